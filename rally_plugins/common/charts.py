@@ -0,0 +1,70 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from rally.common.plugin import plugin
+from rally.common import streaming_algorithms as streaming
+from rally.task.processing import charts
+
+
+@plugin.configure(name="CDF")
+class OutputCDFChart(charts.OutputChart):
+    """Display cumulative distribution of additive data values.
+
+    Values of all iterations are saved at full precision and processed
+    once, when the report is generated: each name gets a line with
+    fraction of iterations (Y axis) finished within the value (X axis).
+    Complete output data is displayed as lines, without any processing.
+
+    Examples of using this plugin in Scenario, for saving output data:
+
+    .. code-block:: python
+
+        self.add_output(
+            additive={"title": "Durations distribution",
+                      "description": "CDF of foo and bar durations",
+                      "chart_plugin": "CDF",
+                      "data": [["foo", 1.2], ["bar", 3.4]],
+                      "label": "Fraction of iterations",
+                      "axis_label": "Duration (sec)"})
+    """
+
+    widget = "Lines"
+
+    def add_iteration(self, iteration):
+        for name, value in self._map_iteration_values(iteration):
+            if name not in self._data:
+                self._data[name] = streaming.PointsSaver()
+            if value is not None:
+                self._data[name].add(value)
+
+    def _process_points(self, points_ins):
+        points = points_ins.result()
+        points_ins.reset()
+        points.sort()
+
+        count = len(points)
+        step = max(1, count // self.zipped_size)
+        indexes = list(range(step - 1, count, step))
+        if indexes and indexes[-1] != count - 1:
+            indexes.append(count - 1)
+        return [[points[i], float(i + 1) / count] for i in indexes]
+
+    def render(self):
+        return {"title": self.title,
+                "description": self.description,
+                "widget": self.widget,
+                "data": [[name, self._process_points(points_ins)]
+                         for name, points_ins in self._data.items()],
+                "label": self.label,
+                "axis_label": self.axis_label}
@@ -25,6 +25,140 @@ KUBERNETES_OPTS = [
     cfg.FloatOpt("status_poll_interval",
                  default=1.0,
                  help="Kubernetes status poll interval"),
+    cfg.StrOpt("status_poll_strategy",
+               default="constant",
+               choices=["constant", "fast_first", "backoff", "learned"],
+               help="Schedule of resource status reads: 'constant' sleeps "
+                    "status_poll_interval between reads, 'fast_first' "
+                    "starts from status_poll_min_interval and doubles it "
+                    "up to status_poll_interval, 'backoff' does the same "
+                    "with random jitter, 'learned' sleeps until the median "
+                    "time the resource kind got ready in the current task "
+                    "and polls fast then"),
+    cfg.FloatOpt("status_poll_min_interval",
+                 default=0.05,
+                 help="The first sleep time between status reads for "
+                      "'fast_first', 'backoff' and 'learned' poll "
+                      "strategies"),
+    cfg.StrOpt("status_wait_method",
+               default="poll",
+               choices=["poll", "watch", "informer"],
+               help="Method to wait for resource status: 'poll' reads "
+                    "resource each status_poll_interval, 'watch' uses "
+                    "Kubernetes watch API per each wait, 'informer' reads "
+                    "resources from process-wide cache, which is updated "
+                    "by single LIST and WATCH per resource kind, scoped "
+                    "by the task owner label. Both "
+                    "'watch' and 'informer' fall back to polling if watch "
+                    "is dropped"),
+    cfg.BoolOpt("report_corrected_waits",
+                default=False,
+                help="Report additional '<wait> (corrected)' atomic action "
+                     "per each wait, which ends at the time of watch event "
+                     "or server-side condition transition satisfied the "
+                     "wait instead of the time it was noticed by polling. "
+                     "With 'poll' wait method, it's reported only for waits "
+                     "of pods, jobs, deployments and namespaces creation, "
+                     "since other resources and terminations have no "
+                     "server-side timestamps"),
+    cfg.BoolOpt("latency_breakdown",
+                default=False,
+                help="Add control-plane phases of deployments, replica "
+                     "sets, stateful sets, daemon sets and jobs startup to "
+                     "scenario output. Each iteration reads the workload, "
+                     "its replica sets and pods once more to get them"),
+    cfg.BoolOpt("status_raw_reads",
+                default=True,
+                help="Read resources as raw JSON while polling status, "
+                     "without deserialization into kubernetes client "
+                     "models, which is CPU consuming with many concurrent "
+                     "waits"),
+    cfg.IntOpt("connection_pool_maxsize",
+               default=None,
+               help="Maximum number of connections to Kubernetes API kept "
+                    "by the client shared between scenario iterations of "
+                    "the same worker process. Defaults to kubernetes "
+                    "client default"),
+    cfg.FloatOpt("api_read_qps",
+                 default=0.0,
+                 help="Maximum rate of read (GET) requests to Kubernetes "
+                      "API per worker process, 0 means unlimited"),
+    cfg.IntOpt("api_read_burst",
+               default=10,
+               help="Number of read requests to Kubernetes API allowed "
+                    "over api_read_qps rate at once"),
+    cfg.FloatOpt("api_mutating_qps",
+                 default=0.0,
+                 help="Maximum rate of mutating (POST, PUT, PATCH, DELETE) "
+                      "requests to Kubernetes API per worker process, 0 "
+                      "means unlimited"),
+    cfg.IntOpt("api_mutating_burst",
+               default=10,
+               help="Number of mutating requests to Kubernetes API allowed "
+                    "over api_mutating_qps rate at once"),
+    cfg.IntOpt("api_throttle_retries",
+               default=5,
+               help="Number of retries of requests rejected by Kubernetes "
+                    "API with 429 Too Many Requests, retries honour "
+                    "Retry-After header"),
+    cfg.IntOpt("api_retries",
+               default=0,
+               help="Number of retries of requests failed with transient "
+                    "Kubernetes API errors (500, 502, 503, 504), retries "
+                    "are disabled by default. Create requests are retried "
+                    "only if object name is set, if retries are enabled "
+                    "such objects get rally-plugins/request-id annotation "
+                    "with idempotency token"),
+    cfg.FloatOpt("api_retry_backoff",
+                 default=0.5,
+                 help="Delay in seconds before the first retry of failed "
+                      "request, the delay is doubled for each next retry"),
+    cfg.BoolOpt("serialized_manifests",
+                default=False,
+                help="Serialize manifests of pods and config maps to JSON "
+                     "from pre-built templates and send them as is, "
+                     "bypassing kubernetes client serialization"),
+    cfg.BoolOpt("tcp_keepalive",
+                default=True,
+                help="Enable TCP keep-alive for connections to Kubernetes "
+                     "API"),
+    cfg.IntOpt("context_resource_management_workers",
+               default=20,
+               help="The number of concurrent threads to use for creating "
+                    "and deleting resources of Kubernetes contexts"),
+    cfg.FloatOpt("node_cache_ttl",
+                 default=30.0,
+                 help="Time in seconds the list of cluster nodes is cached "
+                      "by worker process for DaemonSet scenarios. Set 0 to "
+                      "list nodes filtered by apiserver on each check"),
+    cfg.StrOpt("delete_propagation_policy",
+               default=None,
+               choices=["Foreground", "Background", "Orphan"],
+               help="Propagation policy of resources deletion. Defaults to "
+                    "the resource kind default policy"),
+    cfg.IntOpt("delete_grace_period",
+               default=None,
+               min=0,
+               help="Grace period in seconds of resources deletion. "
+                    "Defaults to the resource default grace period"),
+    cfg.BoolOpt("deferred_termination",
+                default=False,
+                help="Don't wait termination of deleted resources within "
+                     "iterations, termination is verified by "
+                     "kubernetes.reaper context at the end of the task"),
+    cfg.BoolOpt("exec_sessions",
+                default=False,
+                help="Run check commands in pods over persistent shell exec "
+                     "sessions, which are kept open per pod by worker "
+                     "process, instead of new exec stream per command. "
+                     "Several commands of one check are sent at once"),
+    cfg.StrOpt("exec_shell",
+               default="/bin/sh",
+               help="Shell to run in pods for exec sessions"),
+    cfg.FloatOpt("exec_timeout",
+                 default=60.0,
+                 help="Time in seconds to wait for commands executed in "
+                      "pods"),
     cfg.StrOpt("cert_dir",
                default="~/.rally/cert",
                help="Directory for storing certification files")
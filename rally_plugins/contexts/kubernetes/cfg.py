@@ -40,6 +40,29 @@ class CfgContext(common_context.BaseKubernetesContext):
                 "type": "integer",
                 "minimum": 1
             },
+            "wait_method": {
+                "enum": ["poll", "watch", "informer"]
+            },
+            "poll_strategy": {
+                "enum": ["constant", "fast_first", "backoff", "learned"]
+            },
+            "poll_min_interval": {
+                "type": "number",
+                "exclusiveMinimum": 0
+            },
+            "delete_propagation_policy": {
+                "enum": ["Foreground", "Background", "Orphan"]
+            },
+            "delete_grace_period": {
+                "type": "integer",
+                "minimum": 0
+            },
+            "exec_sessions": {
+                "type": "boolean"
+            },
+            "latency_breakdown": {
+                "type": "boolean"
+            },
         }
     }
 
@@ -47,7 +70,15 @@ class CfgContext(common_context.BaseKubernetesContext):
         self.context["kubernetes"] = {
             "sleep_time": CONF.kubernetes.status_poll_interval,
             "retries_total": CONF.kubernetes.status_total_retries,
-            "prepoll_delay": CONF.kubernetes.start_prepoll_delay
+            "prepoll_delay": CONF.kubernetes.start_prepoll_delay,
+            "wait_method": CONF.kubernetes.status_wait_method,
+            "poll_strategy": CONF.kubernetes.status_poll_strategy,
+            "poll_min_interval": CONF.kubernetes.status_poll_min_interval,
+            "delete_propagation_policy": (
+                CONF.kubernetes.delete_propagation_policy),
+            "delete_grace_period": CONF.kubernetes.delete_grace_period,
+            "exec_sessions": CONF.kubernetes.exec_sessions,
+            "latency_breakdown": CONF.kubernetes.latency_breakdown
         }
 
         if self.config.get("sleep_time"):
@@ -62,6 +93,36 @@ class CfgContext(common_context.BaseKubernetesContext):
             CONF.set_override("start_prepoll_delay",
                               self.config["prepoll_delay"],
                               "kubernetes")
+        if self.config.get("wait_method"):
+            CONF.set_override("status_wait_method",
+                              self.config["wait_method"],
+                              "kubernetes")
+        if self.config.get("poll_strategy"):
+            CONF.set_override("status_poll_strategy",
+                              self.config["poll_strategy"],
+                              "kubernetes")
+        if self.config.get("poll_min_interval"):
+            CONF.set_override("status_poll_min_interval",
+                              self.config["poll_min_interval"],
+                              "kubernetes")
+        if self.config.get("delete_propagation_policy"):
+            CONF.set_override("delete_propagation_policy",
+                              self.config["delete_propagation_policy"],
+                              "kubernetes")
+        # NOTE: zero grace period means immediate deletion, so it is a valid
+        #   override as well.
+        if self.config.get("delete_grace_period") is not None:
+            CONF.set_override("delete_grace_period",
+                              self.config["delete_grace_period"],
+                              "kubernetes")
+        if self.config.get("exec_sessions") is not None:
+            CONF.set_override("exec_sessions",
+                              self.config["exec_sessions"],
+                              "kubernetes")
+        if self.config.get("latency_breakdown") is not None:
+            CONF.set_override("latency_breakdown",
+                              self.config["latency_breakdown"],
+                              "kubernetes")
 
     def cleanup(self):
         CONF.set_override("status_poll_interval",
@@ -73,3 +134,25 @@ class CfgContext(common_context.BaseKubernetesContext):
         CONF.set_override("start_prepoll_delay",
                           self.context["kubernetes"]["prepoll_delay"],
                           "kubernetes")
+        CONF.set_override("status_wait_method",
+                          self.context["kubernetes"]["wait_method"],
+                          "kubernetes")
+        CONF.set_override("status_poll_strategy",
+                          self.context["kubernetes"]["poll_strategy"],
+                          "kubernetes")
+        CONF.set_override("status_poll_min_interval",
+                          self.context["kubernetes"]["poll_min_interval"],
+                          "kubernetes")
+        CONF.set_override("delete_propagation_policy",
+                          self.context["kubernetes"][
+                              "delete_propagation_policy"],
+                          "kubernetes")
+        CONF.set_override("delete_grace_period",
+                          self.context["kubernetes"]["delete_grace_period"],
+                          "kubernetes")
+        CONF.set_override("exec_sessions",
+                          self.context["kubernetes"]["exec_sessions"],
+                          "kubernetes")
+        CONF.set_override("latency_breakdown",
+                          self.context["kubernetes"]["latency_breakdown"],
+                          "kubernetes")
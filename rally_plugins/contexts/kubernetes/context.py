@@ -13,6 +13,7 @@
 # under the License.
 
 import string
+import threading
 
 from rally.common.plugin import plugin
 from rally.common import validation
@@ -33,8 +34,47 @@ class BaseKubernetesContext(context.Context):
     def __init__(self, context=None):
         super(BaseKubernetesContext, self).__init__(context)
         self.context.setdefault("kubernetes", {})
+        self._thread_actions = []
+        self._thread_actions_lock = threading.Lock()
+        labels, annotations = self.get_owner_metadata()
         self.client = k8s_service.Kubernetes(
             self.env["platforms"]["kubernetes"],
             name_generator=self.generate_random_name,
-            atomic_inst=self.atomic_actions()
+            atomic_inst=self.atomic_actions(),
+            labels=labels,
+            annotations=annotations
         )
+
+    def get_owner_metadata(self):
+        """Get standard labels and annotations of objects of the context.
+
+        Objects are owned by the task, rally owner id of the context is the
+        workload uuid.
+        """
+        return k8s_service.owner_metadata(self.task["uuid"],
+                                          workload_id=self.get_owner_id())
+
+    def _get_thread_client(self, cache):
+        # NOTE: atomic actions of the context are not thread-safe, so each
+        #   worker thread uses its own service instance and its actions are
+        #   merged to the context ones by _merge_thread_actions.
+        if "client" not in cache:
+            actions = []
+            with self._thread_actions_lock:
+                self._thread_actions.append(actions)
+            labels, annotations = self.get_owner_metadata()
+            cache["client"] = k8s_service.Kubernetes(
+                self.env["platforms"]["kubernetes"],
+                name_generator=self.generate_random_name,
+                atomic_inst=actions,
+                labels=labels,
+                annotations=annotations)
+        return cache["client"]
+
+    def _merge_thread_actions(self):
+        """Add atomic actions of worker thread clients to context ones."""
+        with self._thread_actions_lock:
+            thread_actions, self._thread_actions = self._thread_actions, []
+            self.atomic_actions().extend(sorted(
+                (action for actions in thread_actions for action in actions),
+                key=lambda action: action["started_at"]))
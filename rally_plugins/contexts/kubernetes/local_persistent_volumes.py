@@ -0,0 +1,237 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import itertools
+
+from rally.common import broker
+from rally.common import cfg
+from rally.common import logging
+from rally import exceptions
+from rally.task import context
+
+from rally_plugins.contexts.kubernetes import context as common_context
+from rally_plugins.services.kube import informer
+from rally_plugins.services.kube import kube as k8s_service
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+NODE_LABEL = "kubernetes.io/hostname"
+# Time in seconds to wait for recycler thread to finish in cleanup.
+RECYCLER_STOP_TIMEOUT = 30
+
+
+class ReleasedVolumesRecycler(informer.Informer):
+    """Informer of pool PVs, which makes Released PVs Available again.
+
+    PVs of the pool have Retain reclaim policy, so they become Released
+    when claims of iterations are deleted.
+    """
+
+    def __init__(self, client, label_selector):
+        """Initialize recycler.
+
+        :param client: Kubernetes service instance used by recycler thread
+               only
+        :param label_selector: label selector of pool PVs
+        """
+        super(ReleasedVolumesRecycler, self).__init__(
+            client.v1_client.list_persistent_volume,
+            label_selector=label_selector)
+        self._client = client
+        self.client_actions = client._atomic_actions
+
+    def _recycle(self, volumes):
+        for volume in volumes:
+            if self._stopped.is_set():
+                return
+            if volume.status.phase != "Released":
+                continue
+            try:
+                self._client.recycle_local_pv(volume.metadata.name)
+            except Exception as ex:
+                LOG.warning("Failed to recycle local persistent volume "
+                            "%(name)s: %(ex)s"
+                            % {"name": volume.metadata.name, "ex": ex})
+
+    def _list(self):
+        resource_version = super(ReleasedVolumesRecycler, self)._list()
+        with self._lock:
+            volumes = list(self._store.values())
+        self._recycle(volumes)
+        return resource_version
+
+    def _handle(self, event):
+        super(ReleasedVolumesRecycler, self)._handle(event)
+        if event["type"] == "MODIFIED":
+            self._recycle([event["object"]])
+
+
+@context.configure("local_persistent_volumes", order=1003,
+                   platform="kubernetes")
+class LocalPersistentVolumesContext(common_context.BaseKubernetesContext):
+    """Context for pool of local persistent volumes.
+
+    PVs are created in parallel for each node and path of `nodes` map with
+    storageClass of local_storageclass context. Scenarios lease PV from the
+    pool by claim with the pool selector instead of creating PV per
+    iteration, and PVs released by deleted claims are made Available again
+    in background. Data on volumes is not cleaned between iterations.
+    """
+
+    CONFIG_SCHEMA = {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "nodes": {
+                "type": "object",
+                "minProperties": 1,
+                "additionalProperties": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "array",
+                         "items": {"type": "string"},
+                         "minItems": 1}
+                    ]
+                }
+            },
+            "size": {
+                "type": "string"
+            },
+            "volume_mode": {
+                "enum": ["Filesystem", "Block"]
+            },
+            "access_modes": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 1
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1
+            }
+        },
+        "required": ["nodes"]
+    }
+
+    DEFAULT_CONFIG = {"size": "1Gi",
+                      "volume_mode": "Filesystem",
+                      "access_modes": ["ReadWriteOnce"]}
+
+    def _get_workers(self, count):
+        workers = (self.config.get("resource_management_workers") or
+                   CONF.kubernetes.context_resource_management_workers)
+        return min(workers, count)
+
+    def _get_locations(self):
+        """Get (node, path) pairs interleaved by nodes."""
+        paths = []
+        for node, node_paths in sorted(self.config["nodes"].items()):
+            if isinstance(node_paths, str):
+                node_paths = [node_paths]
+            paths.append([(node, path) for path in node_paths])
+        return [location
+                for locations in itertools.zip_longest(*paths)
+                for location in locations if location is not None]
+
+    def setup(self):
+        storage_class = self.context["kubernetes"].get("storageclass")
+        if not storage_class:
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="local_storageclass context is required.")
+
+        pool_id = self.generate_random_name()
+        pool = {
+            "storageclass": storage_class,
+            "selector": {k8s_service.LOCAL_PV_POOL_LABEL: pool_id},
+            "volumes": []
+        }
+        self.context["kubernetes"]["local_persistent_volumes"] = pool
+        locations = self._get_locations()
+
+        def publish(queue):
+            for location in locations:
+                queue.append(location)
+
+        def consume(cache, location):
+            node, path = location
+            name = self._get_thread_client(cache).create_local_pv(
+                None,
+                storage_class=storage_class,
+                size=self.config["size"],
+                volume_mode=self.config["volume_mode"],
+                local_path=path,
+                access_modes=self.config["access_modes"],
+                node_affinity={
+                    "required": {
+                        "nodeSelectorTerms": [{
+                            "matchExpressions": [{
+                                "key": NODE_LABEL,
+                                "operator": "In",
+                                "values": [node]
+                            }]
+                        }]
+                    }
+                },
+                labels=pool["selector"])
+            pool["volumes"].append(name)
+
+        broker.run(publish, consume, self._get_workers(len(locations)))
+        self._merge_thread_actions()
+
+        if len(pool["volumes"]) != len(locations):
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="Failed to create the requested number of local "
+                    "persistent volumes (%s of %s created)."
+                    % (len(pool["volumes"]), len(locations)))
+
+        # NOTE: actions of the recycler client are merged in cleanup, after
+        #   the recycler thread is finished.
+        self._recycler = ReleasedVolumesRecycler(
+            self._get_thread_client({}),
+            label_selector="%s=%s" % (k8s_service.LOCAL_PV_POOL_LABEL,
+                                      pool_id))
+        self._recycler.start()
+
+    def cleanup(self):
+        recycler = getattr(self, "_recycler", None)
+        if recycler is not None:
+            recycler.stop()
+            if not recycler.join(RECYCLER_STOP_TIMEOUT):
+                LOG.warning("Local persistent volumes recycler is not "
+                            "stopped in %s seconds, its atomic actions are "
+                            "not reported." % RECYCLER_STOP_TIMEOUT)
+                with self._thread_actions_lock:
+                    self._thread_actions = [
+                        actions for actions in self._thread_actions
+                        if actions is not recycler.client_actions]
+
+        pool = self.context["kubernetes"].get("local_persistent_volumes")
+        volumes = (pool or {}).get("volumes") or []
+
+        def publish(queue):
+            for name in volumes:
+                queue.append(name)
+
+        def consume(cache, name):
+            # NOTE: PVs still bound to claims are deleted with the claims,
+            #   when namespaces are deleted.
+            self._get_thread_client(cache).delete_local_pv(
+                name, status_wait=False)
+
+        if volumes:
+            broker.run(publish, consume, self._get_workers(len(volumes)))
+        self._merge_thread_actions()
@@ -12,10 +12,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from rally.task import context
+from rally.common import broker
+from rally.common import cfg
 from rally.common import utils as commonutils
+from rally import exceptions
+from rally.task import context
 
 from rally_plugins.contexts.kubernetes import context as common_context
+from rally_plugins.services.kube import kube as k8s_service
+
+CONF = cfg.CONF
+
+WORKLOAD_LABEL = k8s_service.WORKLOAD_LABEL
 
 
 @context.configure("namespaces", order=1001, platform="kubernetes")
@@ -39,11 +47,24 @@ class NamespaceContext(common_context.BaseKubernetesContext):
             "serviceaccount_delay": {
                 "type": "integer",
                 "minimum": 0
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1
+            },
+            "bulk_cleanup": {
+                "type": "boolean"
             }
         }
     }
 
-    DEFAULT_CONFIG = {"namespace_choice_method": "random"}
+    DEFAULT_CONFIG = {"namespace_choice_method": "random",
+                      "bulk_cleanup": True}
+
+    def _get_workers(self, count):
+        workers = (self.config.get("resource_management_workers") or
+                   CONF.kubernetes.context_resource_management_workers)
+        return min(workers, count)
 
     def setup(self):
         self.context["kubernetes"].update({
@@ -53,19 +74,64 @@ class NamespaceContext(common_context.BaseKubernetesContext):
         })
 
         self.context["kubernetes"].setdefault("namespaces", [])
-        for _ in range(self.config.get("count")):
-            name = self.client.create_namespace(None, status_wait=False)
+        with_serviceaccount = self.config.get("with_serviceaccount")
+        count = self.config.get("count")
+        secrets = []
+
+        def publish(queue):
+            for _ in range(count):
+                queue.append(None)
+
+        def consume(cache, args):
+            client = self._get_thread_client(cache)
+            name = client.create_namespace(None, status_wait=False)
             self.context["kubernetes"]["namespaces"].append(name)
-            if self.config.get("with_serviceaccount"):
-                self.client.create_serviceaccount(name, namespace=name)
-                self.client.create_secret(name, namespace=name)
-                commonutils.interruptable_sleep(
-                    self.context["kubernetes"]["serviceaccount_delay"]
-                )
+            if with_serviceaccount:
+                client.create_serviceaccount(name, namespace=name)
+                client.create_secret(name, namespace=name)
+                secrets.append((name, name))
+
+        broker.run(publish, consume, self._get_workers(count))
+        self._merge_thread_actions()
+
+        created = len(secrets if with_serviceaccount
+                      else self.context["kubernetes"]["namespaces"])
+        if created != count:
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="Failed to create the requested number of namespaces "
+                    "(%s of %s created)." % (created, count))
+
+        if with_serviceaccount:
+            self.client.wait_for_secrets_tokens(secrets)
+            # NOTE: tokens are already issued at this point, the delay is
+            #   kept for backward compatibility and slept once per context.
+            commonutils.interruptable_sleep(
+                self.context["kubernetes"]["serviceaccount_delay"]
+            )
 
     def cleanup(self):
-        for name in self.context["kubernetes"].get("namespaces"):
-            self.client.delete_namespace(name)
+        namespaces = self.context["kubernetes"].get("namespaces") or []
+        # NOTE: in bulk mode all namespaces are deleted at first and then
+        #   termination of the whole set is waited at once.
+        bulk = self.config.get("bulk_cleanup", True)
+
+        def publish(queue):
+            for name in namespaces:
+                queue.append(name)
+
+        def consume(cache, name):
+            self._get_thread_client(cache).delete_namespace(
+                name, status_wait=not bulk)
+
+        if namespaces:
+            broker.run(publish, consume, self._get_workers(len(namespaces)))
+            self._merge_thread_actions()
+            if bulk:
+                self.client.wait_for_namespaces_termination(
+                    namespaces,
+                    label_selector="%s=%s" % (WORKLOAD_LABEL,
+                                              self.get_owner_id()))
 
 
 @context.configure("kubernetes.namespaces", order=1001, platform="kubernetes")
@@ -0,0 +1,84 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+from rally.common import cfg
+from rally.common import logging
+from rally.common import utils as commonutils
+from rally import exceptions
+from rally.task import context
+
+from rally_plugins.contexts.kubernetes import context as common_context
+from rally_plugins.services.kube import kube as k8s_service
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+
+@context.configure("kubernetes.reaper", order=1002, platform="kubernetes")
+class ReaperContext(common_context.BaseKubernetesContext):
+    """Context to verify termination of deleted resources after the task.
+
+    Scenarios don't wait termination of resources they delete, so
+    iterations measure deletion requests only. At the end of the task,
+    before namespaces are deleted, the context waits until resources created
+    by iterations in context namespaces are gone, and fails its cleanup with
+    the list of stragglers otherwise.
+    """
+
+    CONFIG_SCHEMA = {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "timeout": {
+                "type": "number",
+                "minimum": 0
+            }
+        }
+    }
+
+    DEFAULT_CONFIG = {"timeout": 300}
+
+    def setup(self):
+        self.context["kubernetes"]["deferred_termination"] = (
+            CONF.kubernetes.deferred_termination)
+        CONF.set_override("deferred_termination", True, "kubernetes")
+
+    def cleanup(self):
+        CONF.set_override("deferred_termination",
+                          self.context["kubernetes"]["deferred_termination"],
+                          "kubernetes")
+
+        namespaces = self.context["kubernetes"].get("namespaces") or []
+        # NOTE: only resources created by iterations are checked, resources
+        #   of contexts are deleted later by their own cleanup.
+        label_selector = "%s=%s,%s" % (k8s_service.WORKLOAD_LABEL,
+                                       self.get_owner_id(),
+                                       k8s_service.ITERATION_LABEL)
+        deadline = time.time() + self.config["timeout"]
+        remaining = self.client.list_remaining(namespaces, label_selector)
+        while remaining and time.time() < deadline:
+            commonutils.interruptable_sleep(
+                CONF.kubernetes.status_poll_interval)
+            remaining = self.client.list_remaining(namespaces,
+                                                   label_selector)
+
+        if remaining:
+            raise exceptions.RallyException(
+                message="%(count)s resources still exist %(timeout)s "
+                        "seconds after the task: %(names)s"
+                        % {"count": len(remaining),
+                           "timeout": self.config["timeout"],
+                           "names": ", ".join(remaining)})
@@ -12,15 +12,25 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
 import random
 import string
+import time
 
+from rally.common import cfg
 from rally.common.plugin import plugin
 from rally.common import validation
+from rally.task import atomic
+from rally.task.processing import utils as processing_utils
 from rally.task import scenario
 
 from rally_plugins.services.kube import kube as k8s_service
 
+CONF = cfg.CONF
+
+# Label, which marks resources created by one batch of scenario iteration.
+BATCH_LABEL = "rally-plugins/batch"
+
 
 @validation.add_default("required_kubernetes_platform")
 @plugin.default_meta(inherit=False)
@@ -49,10 +59,129 @@ class BaseKubernetesScenario(scenario.Scenario):
         }
         if "env" in self.context:
             spec.update(self.context["env"]["platforms"]["kubernetes"])
+            labels, annotations = self.get_owner_metadata()
             self.client = k8s_service.Kubernetes(
                 spec,
                 name_generator=self.generate_random_name,
-                atomic_inst=self.atomic_actions())
+                atomic_inst=self.atomic_actions(),
+                labels=labels,
+                annotations=annotations)
+
+    def get_owner_metadata(self):
+        """Get standard labels and annotations of objects of the iteration.
+
+        Objects are owned by the task, rally owner id of the scenario is the
+        workload uuid.
+        """
+        return k8s_service.owner_metadata(
+            self.task["uuid"],
+            workload_id=self.get_owner_id(),
+            scenario=self.get_name(),
+            iteration=self.context.get("iteration"))
+
+    def add_latency_breakdown_output(self, kind, name, namespace):
+        """Add control-plane phases of workload startup to scenario output.
+
+        Phases are added only if [kubernetes]latency_breakdown option is set,
+        since they cost additional requests per iteration.
+
+        :param kind: workload kind: Deployment, ReplicaSet, StatefulSet,
+               DaemonSet or Job
+        :param name: workload name
+        :param namespace: workload namespace
+        """
+        if not CONF.kubernetes.latency_breakdown:
+            return
+        phases = self.client.get_latency_breakdown(kind,
+                                                   name=name,
+                                                   namespace=namespace)
+        if phases:
+            self.add_output(
+                additive={"title": "%s startup phases" % kind,
+                          "description": "Durations of control-plane phases "
+                                         "of %s startup by server-side "
+                                         "timestamps in each iteration"
+                                         % kind,
+                          "chart_plugin": "StackedArea",
+                          "data": [list(p) for p in phases],
+                          "label": "Total seconds",
+                          "axis_label": "Iteration"})
+
+    def create_batch(self, kind, batch_size, namespace, create,
+                     status_wait=True):
+        """Create batch of resources back-to-back and wait them together.
+
+        All resources of the batch are created without waiting, then waited
+        by single LIST request per poll. Throughput and per-resource latency
+        percentiles are added to scenario output.
+
+        :param kind: resource kind: pod, deployment, job or configmap
+        :param batch_size: number of resources in batch
+        :param namespace: namespace resources are created in
+        :param create: callable, which accepts labels, creates resource with
+               them without waiting and returns resource name
+        :param status_wait: wait for resources readiness
+        :returns: tuple with list of created resources names and label
+                  selector of the batch
+        """
+        labels = {BATCH_LABEL: self.generate_random_name()}
+        label_selector = "%s=%s" % (BATCH_LABEL, labels[BATCH_LABEL])
+
+        submitted = collections.OrderedDict()
+        with atomic.ActionTimer(self, "kubernetes.create_%s_batch" % kind):
+            for _ in range(batch_size):
+                started_at = time.time()
+                submitted[create(labels)] = started_at
+        names = list(submitted)
+
+        if status_wait:
+            ready = self.client.wait_for_batch(names,
+                                               namespace=namespace,
+                                               kind=kind,
+                                               label_selector=label_selector)
+            self._add_batch_output(kind, submitted, ready)
+        return names, label_selector
+
+    def delete_batch(self, kind, names, namespace, label_selector, delete,
+                     status_wait=True):
+        """Delete batch of resources and wait their termination together.
+
+        :param kind: resource kind: pod, deployment, job or configmap
+        :param names: names of resources in batch
+        :param namespace: namespace of resources
+        :param label_selector: label selector of the batch
+        :param delete: callable, which accepts resource name and deletes it
+               without waiting
+        :param status_wait: wait for resources termination
+        """
+        with atomic.ActionTimer(self, "kubernetes.delete_%s_batch" % kind):
+            for name in names:
+                delete(name)
+        if k8s_service.termination_wait_required(status_wait):
+            self.client.wait_for_batch(names,
+                                       namespace=namespace,
+                                       kind=kind,
+                                       label_selector=label_selector,
+                                       terminated=True)
+
+    def _add_batch_output(self, kind, submitted, ready):
+        latencies = sorted(ready[name] - submitted[name] for name in ready)
+        duration = max(ready.values()) - min(submitted.values())
+        rows = [["throughput, %ss/sec" % kind,
+                 len(latencies) / duration if duration else 0]]
+        for percent in (50, 95, 99):
+            rows.append([
+                "p%s %s latency, sec" % (percent, kind),
+                processing_utils.percentile(latencies, percent / 100.0,
+                                            ignore_sorting=True)])
+        self.add_output(
+            additive={"title": "Batch of %ss throughput and latency" % kind,
+                      "description": "Throughput and percentiles of "
+                                     "per-object time to readiness in batch, "
+                                     "precision is limited by status poll "
+                                     "interval",
+                      "chart_plugin": "StatsTable",
+                      "data": rows})
 
 
 class KubernetesScenario(BaseKubernetesScenario):
@@ -46,6 +46,9 @@ class CreateCheckAndDeleteDaemonSet(common_scenario.BaseKubernetesScenario):
             app=app,
             node_labels=node_labels
         )
+        if status_wait:
+            self.add_latency_breakdown_output("DaemonSet", name, namespace)
+
         self.client.delete_daemonset(
             name,
             namespace=namespace,
@@ -14,12 +14,15 @@
 
 from rally.common import logging
 from rally.task import scenario
+from rally.task import validation
 
 from rally_plugins.scenarios.kubernetes import common
 
 LOG = logging.getLogger(__name__)
 
 
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True, nullable=True)
 @scenario.configure(name="Kubernetes.create_and_delete_deployment",
                     platform="kubernetes")
 class CreateAndDeleteDeployment(common.BaseKubernetesScenario):
@@ -29,17 +32,42 @@ class CreateAndDeleteDeployment(common.BaseKubernetesScenario):
     of replicas, wait until it won't be running and delete it after.
     """
 
-    def run(self, replicas, image, name=None, command=None, status_wait=True):
+    def run(self, replicas, image, name=None, command=None, status_wait=True,
+            batch_size=None):
         """Create and delete deployment and wait for status optionally.
 
         :param replicas: number of replicas for deployment
         :param image: container's template image
-        :param name: custom deployment name
+        :param name: custom deployment name, ignored in batch mode
         :param status_wait: wait for full status if True
         :param command: array of strings representing container command
+        :param batch_size: number of deployments to create back-to-back and
+               wait together in one iteration
         """
         namespace = self.choose_namespace()
 
+        if batch_size:
+            names, label_selector = self.create_batch(
+                "deployment", batch_size,
+                namespace=namespace,
+                create=lambda labels: self.client.create_deployment(
+                    None,
+                    replicas=replicas,
+                    image=image,
+                    namespace=namespace,
+                    command=command,
+                    labels=labels,
+                    status_wait=False),
+                status_wait=status_wait)
+            self.delete_batch(
+                "deployment", names,
+                namespace=namespace,
+                label_selector=label_selector,
+                delete=lambda name: self.client.delete_deployment(
+                    name, namespace=namespace, status_wait=False),
+                status_wait=status_wait)
+            return
+
         name = self.client.create_deployment(
             name,
             replicas=replicas,
@@ -49,6 +77,9 @@ class CreateAndDeleteDeployment(common.BaseKubernetesScenario):
             status_wait=status_wait
         )
 
+        if status_wait:
+            self.add_latency_breakdown_output("Deployment", name, namespace)
+
         self.client.delete_deployment(
             name,
             namespace=namespace
@@ -13,25 +13,52 @@
 # under the License.
 
 from rally.task import scenario
+from rally.task import validation
 
 from rally_plugins.scenarios.kubernetes import common as common_scenario
 
 
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True, nullable=True)
 @scenario.configure("Kubernetes.create_and_delete_job", platform="kubernetes")
 class CreateAndDeleteJob(common_scenario.BaseKubernetesScenario):
 
     def run(self, image, command, image_pull_policy='IfNotPresent', name=None,
-            status_wait=True):
+            status_wait=True, batch_size=None):
         """Create job with no restart policy, wait for success and delete then.
 
         :param image: job container's image
         :param image_pull_policy: override default image pull policy
         :param command: job container's command
-        :param name: job custom name
+        :param name: job custom name, ignored in batch mode
         :param status_wait: wait for success if True
+        :param batch_size: number of jobs to create back-to-back and wait
+               together in one iteration
         """
         namespace = self.choose_namespace()
 
+        if batch_size:
+            names, label_selector = self.create_batch(
+                "job", batch_size,
+                namespace=namespace,
+                create=lambda labels: self.client.create_job(
+                    None,
+                    namespace=namespace,
+                    image=image,
+                    image_pull_policy=image_pull_policy,
+                    command=command,
+                    labels=labels,
+                    status_wait=False),
+                status_wait=status_wait)
+            self.delete_batch(
+                "job", names,
+                namespace=namespace,
+                label_selector=label_selector,
+                delete=lambda name: self.client.delete_job(
+                    name, namespace=namespace, status_wait=False),
+                status_wait=status_wait)
+            return
+
         name = self.client.create_job(
             name,
             namespace=namespace,
@@ -41,6 +68,9 @@ class CreateAndDeleteJob(common_scenario.BaseKubernetesScenario):
             status_wait=status_wait
         )
 
+        if status_wait:
+            self.add_latency_breakdown_output("Job", name, namespace)
+
         self.client.delete_job(
             name,
             namespace=namespace,
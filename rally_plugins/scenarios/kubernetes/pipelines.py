@@ -0,0 +1,119 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+
+from rally.common.plugin import plugin
+from rally import exceptions
+from rally.task import scenario
+from rally.task import validation
+
+from rally_plugins.scenarios.kubernetes import common as common_scenario
+from rally_plugins.services.kube import kube_async
+
+
+@plugin.default_meta(inherit=False)
+class BaseKubernetesPipelinesScenario(common_scenario.BaseKubernetesScenario):
+    """Base class for scenarios, which run concurrent asyncio pipelines.
+
+    Each iteration runs the number of independent pipelines on a single
+    event loop, so the number of in-flight requests is not limited by the
+    number of runner threads.
+    """
+
+    def run_pipelines(self, pipeline, count, concurrency=None):
+        """Run pipelines concurrently and wait all of them.
+
+        :param pipeline: coroutine function, which accepts AsyncKubernetes
+               instance and pipeline index
+        :param count: number of pipelines to run
+        :param concurrency: max number of pipelines running at the same time,
+               defaults to count
+        """
+        spec = {
+            "namespaces": self.context["kubernetes"].get("namespaces"),
+            "serviceaccounts": self.context["kubernetes"].get(
+                "serviceaccounts"),
+            "disable_assert_hostname": True
+        }
+        spec.update(self.context["env"]["platforms"]["kubernetes"])
+        labels, annotations = self.get_owner_metadata()
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(concurrency or count)
+            async with kube_async.AsyncKubernetes(
+                    spec,
+                    name_generator=self.generate_random_name,
+                    atomic_inst=self.atomic_actions(),
+                    labels=labels,
+                    annotations=annotations) as client:
+
+                async def run_one(idx):
+                    async with semaphore:
+                        await pipeline(client, idx)
+
+                return await asyncio.gather(
+                    *[run_one(i) for i in range(count)],
+                    return_exceptions=True)
+
+        errors = [r for r in asyncio.run(run_all())
+                  if isinstance(r, Exception)]
+        if errors:
+            raise exceptions.RallyException(
+                message="%(failed)s of %(count)s pipelines failed, the first "
+                        "error: %(error)s" % {"failed": len(errors),
+                                              "count": count,
+                                              "error": errors[0]})
+
+
+@validation.add("required_kubernetes_asyncio")
+@validation.add("number", param_name="pipelines", minval=1, integer_only=True)
+@validation.add("number", param_name="concurrency", minval=1,
+                integer_only=True, nullable=True)
+@scenario.configure(name="Kubernetes.create_and_delete_pods_concurrently",
+                    platform="kubernetes")
+class CreateAndDeletePodsConcurrently(BaseKubernetesPipelinesScenario):
+
+    def run(self, image, pipelines, concurrency=None,
+            image_pull_policy="IfNotPresent", command=None,
+            status_wait=True):
+        """Create pods, wait them running and delete within one iteration.
+
+        Each of pipelines creates pod, waits until it won't be running and
+        deletes it, all pipelines run on one event loop.
+
+        :param image: pod's image
+        :param pipelines: number of create/wait/delete pipelines per
+               iteration
+        :param concurrency: max number of pipelines running at the same time,
+               defaults to pipelines
+        :param image_pull_policy: override default image pull policy
+        :param command: array of strings, pod's command. Could be None if
+               image have entrypoint
+        :param status_wait: wait pod status after creation and deletion
+        """
+
+        async def pipeline(client, idx):
+            namespace = self.choose_namespace()
+            name = await client.create_pod(
+                image,
+                namespace=namespace,
+                image_pull_policy=image_pull_policy,
+                command=command,
+                status_wait=status_wait
+            )
+            await client.delete("Pod", name=name, namespace=namespace,
+                                status_wait=status_wait)
+
+        self.run_pipelines(pipeline, pipelines, concurrency=concurrency)
@@ -13,13 +13,16 @@
 # under the License.
 
 import collections
-import time
 
 from rally.task import scenario
+from rally.task import validation
 
 from rally_plugins.scenarios.kubernetes import common as common_scenario
+from rally_plugins.services.kube import latency
 
 
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True, nullable=True)
 @scenario.configure(name="Kubernetes.create_and_delete_pod",
                     platform="kubernetes")
 class CreateAndDeletePod(common_scenario.BaseKubernetesScenario):
@@ -27,8 +30,7 @@ class CreateAndDeletePod(common_scenario.BaseKubernetesScenario):
     def _parse_pod_status_conditions(self, conditions):
         """Method for collecting pods statuses: inited, scheduled, ready."""
 
-        def to_time(dt):
-            return time.mktime(dt)
+        to_time = latency.to_time
 
         if not conditions:
             return []
@@ -43,43 +45,35 @@ class CreateAndDeletePod(common_scenario.BaseKubernetesScenario):
         })
         for d in conditions:
             if d.type == "PodScheduled":
-                start = scheduled = to_time(d.last_transition_time.timetuple())
+                start = scheduled = to_time(d.last_transition_time)
                 stat_dict["kubernetes.scheduled_pod"].update({"started_at": scheduled})
             elif d.type == "Initialized":
-                init_time = to_time(d.last_transition_time.timetuple())
+                init_time = to_time(d.last_transition_time)
                 stat_dict["kubernetes.scheduled_pod"].update({"finished_at": init_time})
                 stat_dict["kubernetes.initialized_pod"].update({"started_at": init_time})
             elif d.type == "Ready":
-                ready = to_time(d.last_transition_time.timetuple())
+                ready = to_time(d.last_transition_time)
                 stat_dict["kubernetes.ready_pod"].update({"started_at": ready})
                 stat_dict["kubernetes.initialized_pod"].update({"finished_at": ready})
             elif d.type == "ContainersReady":
-                finish = to_time(d.last_transition_time.timetuple())
+                finish = to_time(d.last_transition_time)
                 stat_dict["kubernetes.ready_pod"].update({"finished_at": finish})
         stat_dict["kubernetes.pod_create"].update({"started_at": start,
                                                    "finished_at": finish})
         return [{"name": k,
-                 "started_at": v["started_at"],
-                 "finished_at": v["finished_at"]}
+                 "started_at": v.get("started_at"),
+                 "finished_at": v.get("finished_at")}
                 for k, v in stat_dict.items()]
 
     def _make_data_from_conditions(self, conditions):
         """Make plot data from conditions made by parse method."""
-        data = [[] for _ in range(4)]
-        state_map = {
-            "kubernetes.scheduled_pod": 0,
-            "kubernetes.ready_pod": 1,
-            "kubernetes.initialized_pod": 2,
-            "kubernetes.pod_create": 3
-        }
-
-        for e in conditions:
-            duration = e["finished_at"] - e["started_at"]
-            data[state_map[e["name"]]] = [e["name"], duration]
-        return data
+        return [[e["name"], e["finished_at"] - e["started_at"]]
+                for e in conditions
+                if e.get("started_at") is not None and
+                e.get("finished_at") is not None]
 
     def run(self, image, image_pull_policy='IfNotPresent', command=None,
-            status_wait=True):
+            status_wait=True, batch_size=None):
         """Create pod, wait until it won't be running and then delete it.
 
         :param image: pod's image
@@ -87,9 +81,33 @@ class CreateAndDeletePod(common_scenario.BaseKubernetesScenario):
         :param command: array of strings, pod's command. Could be None if
                image have entrypoint
         :param status_wait: wait pod status after creation
+        :param batch_size: number of pods to create back-to-back and wait
+               together in one iteration; pod conditions are not collected
+               in batch mode
         """
         namespace = self.choose_namespace()
 
+        if batch_size:
+            names, label_selector = self.create_batch(
+                "pod", batch_size,
+                namespace=namespace,
+                create=lambda labels: self.client.create_pod(
+                    image,
+                    image_pull_policy=image_pull_policy,
+                    namespace=namespace,
+                    command=command,
+                    labels=labels,
+                    status_wait=False),
+                status_wait=status_wait)
+            self.delete_batch(
+                "pod", names,
+                namespace=namespace,
+                label_selector=label_selector,
+                delete=lambda name: self.client.delete_pod(
+                    name, namespace=namespace, status_wait=False),
+                status_wait=status_wait)
+            return
+
         name = self.client.create_pod(
             image,
             image_pull_policy=image_pull_policy,
@@ -100,14 +118,22 @@ class CreateAndDeletePod(common_scenario.BaseKubernetesScenario):
 
         pod = self.client.get_pod(name, namespace=namespace)
         conditions = self._parse_pod_status_conditions(pod.status.conditions)
+        data = self._make_data_from_conditions(conditions)
+        self.add_output(
+            additive={"title": "Pod's conditions durations",
+                      "description": "Statistics of pod's conditions "
+                                     "durations over all iterations",
+                      "chart_plugin": "StatsTable",
+                      "data": data})
         self.add_output(
-            additive={"title": "Pod's conditions total duration",
-                      "description": "Total durations for pod in each "
-                                     "iteration",
-                      "chart_plugin": "StackedArea",
-                      "data": self._make_data_from_conditions(conditions),
-                      "label": "Total seconds",
-                      "axis_label": "Iteration"})
+            additive={"title": "Pod's conditions durations distribution",
+                      "description": "Fraction of iterations, which pod's "
+                                     "conditions are reached within the "
+                                     "duration",
+                      "chart_plugin": "CDF",
+                      "data": data,
+                      "label": "Fraction of iterations",
+                      "axis_label": "Duration (sec)"})
 
         self.client.delete_pod(
             name,
@@ -49,6 +49,9 @@ class CreateAndDeleteReplicaSet(common.BaseKubernetesScenario):
             status_wait=status_wait
         )
 
+        if status_wait:
+            self.add_latency_breakdown_output("ReplicaSet", name, namespace)
+
         self.client.delete_replicaset(
             name,
             namespace=namespace
@@ -49,6 +49,9 @@ class CreateAndDeleteStatefulSet(common.BaseKubernetesScenario):
             status_wait=status_wait
         )
 
+        if status_wait:
+            self.add_latency_breakdown_output("StatefulSet", name, namespace)
+
         self.client.delete_statefulset(
             name,
             namespace=namespace,
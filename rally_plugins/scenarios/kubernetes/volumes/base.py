@@ -12,6 +12,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from rally import exceptions
+
 from rally_plugins.scenarios.kubernetes import common as common_scenario
 
 
@@ -24,19 +26,23 @@ class PodWithVolumeBaseScenario(common_scenario.BaseKubernetesScenario):
 
     def run(self, image, image_pull_policy='IfNotPresent', name=None,
             check_cmd=None, command=None, error_regexp=None,
-            volume=None, status_wait=True):
+            volume=None, status_wait=True, check_output=None):
         """Super class for all kubernetes pod with volume scenarios.
 
         :param image: pod's image
         :param image_pull_policy: override default image pull policy
         :param name: pod's name, equals to volume name
-        :param check_cmd: pod exec command, available if volume_check is True
+        :param check_cmd: pod exec command, available if volume_check is True;
+               list of commands runs them all
         :param command: pod container's command
         :param error_regexp: regexp string to search error in pod exec
                response, available if volume_check is True
         :param volume: a dict, which contains `mount_path` and `volume` keys
                with parts of pod's manifest as values
         :param status_wait: wait for pod's status if True
+        :param check_output: a dict with optional `digest` (hash algorithm,
+               e.g. sha256), `expected_digest` and `expected_size` keys to
+               verify stdout of check_cmd, available if volume_check is True
         """
         name = self.client.create_pod(
             image,
@@ -53,7 +59,8 @@ class PodWithVolumeBaseScenario(common_scenario.BaseKubernetesScenario):
                 name,
                 namespace=self.namespace,
                 check_cmd=check_cmd,
-                error_regexp=error_regexp
+                error_regexp=error_regexp,
+                **(check_output or {})
             )
 
         self.client.delete_pod(
@@ -61,3 +68,73 @@ class PodWithVolumeBaseScenario(common_scenario.BaseKubernetesScenario):
             namespace=self.namespace,
             status_wait=status_wait
         )
+
+    def create_local_volume(self, name, persistent_volume_claim,
+                            persistent_volume=None, status_wait=True):
+        """Create local PVC with PV created for it or leased from pool.
+
+        If local_persistent_volumes context is used, the claim is bound to
+        any Available PV of the pool, otherwise PV with the same name is
+        created for the claim.
+
+        :param name: PVC name, equals to PV name if PV is created
+        :param persistent_volume_claim: a dict with the next keys: `size` and
+               `access_modes`
+        :param persistent_volume: a dict with the next keys: `size`,
+               `volume_mode`, `local_path`, `access_modes`, `node_affinity`;
+               ignored if PV is leased from pool
+        :param status_wait: wait for PV status if True
+        :returns: True if PV is leased from pool
+        """
+        pool = self.context["kubernetes"].get("local_persistent_volumes")
+        if pool:
+            storage_class = pool["storageclass"]
+        else:
+            if not persistent_volume:
+                raise exceptions.InvalidArgumentsException(
+                    message="'persistent_volume' argument is required "
+                            "without local_persistent_volumes context."
+                )
+            storage_class = self.context["kubernetes"]["storageclass"]
+            self.client.create_local_pv(
+                name,
+                storage_class=storage_class,
+                size=persistent_volume["size"],
+                volume_mode=persistent_volume["volume_mode"],
+                local_path=persistent_volume["local_path"],
+                access_modes=persistent_volume["access_modes"],
+                node_affinity=persistent_volume["node_affinity"],
+                status_wait=status_wait
+            )
+
+        self.client.create_local_pvc(
+            name,
+            namespace=self.namespace,
+            storage_class=storage_class,
+            access_modes=persistent_volume_claim["access_modes"],
+            size=persistent_volume_claim["size"],
+            selector=pool["selector"] if pool else None
+        )
+        return bool(pool)
+
+    def delete_local_volume(self, name, leased, status_wait=True):
+        """Delete local PVC and PV, if it's not leased from pool.
+
+        PV leased from pool is released by PVC deletion and recycled by
+        local_persistent_volumes context.
+
+        :param name: PVC name
+        :param leased: whether PV is leased from pool
+        :param status_wait: wait for termination if True
+        """
+        self.client.delete_local_pvc(
+            name,
+            namespace=self.namespace,
+            status_wait=status_wait
+        )
+
+        if not leased:
+            self.client.delete_local_pv(
+                name,
+                status_wait=status_wait
+            )
@@ -12,11 +12,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from rally import exceptions
 from rally.task import scenario
+from rally.task import validation
 
 from rally_plugins.scenarios.kubernetes.volumes import base
 
 
+@validation.add("regexp", param_name="error_regexp")
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True, nullable=True)
 @scenario.configure(
     name="Kubernetes.create_and_delete_pod_with_configmap_volume",
     platform="kubernetes"
@@ -25,7 +30,8 @@ class CreateAndDeletePodWithConfigMapVolume(base.PodWithVolumeBaseScenario):
 
     def run(self, image, mount_path, configmap_data,
             image_pull_policy='IfNotPresent', subpath=None,
-            check_cmd=None, error_regexp=None, command=None, status_wait=True):
+            check_cmd=None, error_regexp=None, command=None, status_wait=True,
+            batch_size=None):
         """Create pod with configMap volume, optionally check and delete then.
 
         Create pod with configMap volume, optionally wait for it's readiness,
@@ -40,7 +46,17 @@ class CreateAndDeletePodWithConfigMapVolume(base.PodWithVolumeBaseScenario):
         :param error_regexp: regexp string to search error in pod exec response
         :param command: array of strings representing container command
         :param status_wait: wait pod status for success if True
+        :param batch_size: number of configMaps and pods to create
+               back-to-back and wait together in one iteration
         """
+        if batch_size:
+            self._run_batch(image, mount_path, configmap_data, batch_size,
+                            image_pull_policy=image_pull_policy,
+                            subpath=subpath, check_cmd=check_cmd,
+                            error_regexp=error_regexp, command=command,
+                            status_wait=status_wait)
+            return
+
         name = self.generate_random_name()
 
         self.client.create_configmap(
@@ -49,6 +65,21 @@ class CreateAndDeletePodWithConfigMapVolume(base.PodWithVolumeBaseScenario):
             data=configmap_data
         )
 
+        super(CreateAndDeletePodWithConfigMapVolume, self).run(
+            image,
+            image_pull_policy=image_pull_policy,
+            name=name,
+            command=command,
+            check_cmd=check_cmd,
+            error_regexp=error_regexp,
+            volume=self._make_volume(name, mount_path, subpath),
+            status_wait=status_wait
+        )
+
+        self.client.delete_configmap(name, namespace=self.namespace)
+
+    @staticmethod
+    def _make_volume(name, mount_path, subpath=None):
         volume = {
             "mount_path": [
                 {
@@ -67,16 +98,75 @@ class CreateAndDeletePodWithConfigMapVolume(base.PodWithVolumeBaseScenario):
         }
         if subpath:
             volume["mount_path"][0]["subPath"] = subpath
+        return volume
 
-        super(CreateAndDeletePodWithConfigMapVolume, self).run(
-            image,
-            image_pull_policy=image_pull_policy,
-            name=name,
-            command=command,
-            check_cmd=check_cmd,
-            error_regexp=error_regexp,
-            volume=volume,
-            status_wait=status_wait
-        )
+    def _run_batch(self, image, mount_path, configmap_data, batch_size,
+                   image_pull_policy, subpath, check_cmd, error_regexp,
+                   command, status_wait):
+        def create_configmap(labels):
+            name = self.generate_random_name()
+            self.client.create_configmap(name,
+                                         namespace=self.namespace,
+                                         data=configmap_data,
+                                         labels=labels)
+            return name
 
-        self.client.delete_configmap(name, namespace=self.namespace)
\ No newline at end of file
+        cm_names, cm_selector = self.create_batch(
+            "configmap", batch_size,
+            namespace=self.namespace,
+            create=create_configmap,
+            status_wait=status_wait)
+
+        # NOTE: each pod is named after its configMap, as in single mode.
+        pod_names = iter(cm_names)
+
+        def create_pod(labels):
+            name = next(pod_names)
+            return self.client.create_pod(
+                image,
+                image_pull_policy=image_pull_policy,
+                name=name,
+                volume=self._make_volume(name, mount_path, subpath),
+                namespace=self.namespace,
+                command=command,
+                labels=labels,
+                status_wait=False)
+
+        try:
+            names, selector = self.create_batch("pod", batch_size,
+                                                namespace=self.namespace,
+                                                create=create_pod,
+                                                status_wait=status_wait)
+        except exceptions.TimeoutException:
+            # NOTE: volume mount failures are reported only by events, so
+            #   pods, which aren't Running, are checked for them to raise
+            #   volume error instead of timeout.
+            for name in cm_names:
+                pod = self.client.get_pod(name, namespace=self.namespace)
+                if pod.status.phase != "Running":
+                    self.client.get_pod(name, namespace=self.namespace,
+                                        volume=True)
+            raise
+        if check_cmd:
+            for name in names:
+                self.client.check_volume_pod(
+                    name,
+                    namespace=self.namespace,
+                    check_cmd=check_cmd,
+                    error_regexp=error_regexp
+                )
+
+        self.delete_batch(
+            "pod", names,
+            namespace=self.namespace,
+            label_selector=selector,
+            delete=lambda name: self.client.delete_pod(
+                name, namespace=self.namespace, status_wait=False),
+            status_wait=status_wait)
+        self.delete_batch(
+            "configmap", cm_names,
+            namespace=self.namespace,
+            label_selector=cm_selector,
+            delete=lambda name: self.client.delete_configmap(
+                name, namespace=self.namespace),
+            status_wait=status_wait)
\ No newline at end of file
@@ -13,10 +13,12 @@
 # under the License.
 
 from rally.task import scenario
+from rally.task import validation
 
 from rally_plugins.scenarios.kubernetes.volumes import base
 
 
+@validation.add("regexp", param_name="error_regexp")
 @scenario.configure(
     name="Kubernetes.create_and_delete_pod_with_emptydir_volume",
     platform="kubernetes"
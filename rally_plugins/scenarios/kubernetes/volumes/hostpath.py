@@ -18,6 +18,10 @@ from rally.task import validation
 from rally_plugins.scenarios.kubernetes.volumes import base
 
 
+@validation.add("regexp", param_name="error_regexp")
+@validation.add("map_keys", param_name="check_output", required=[],
+                allowed=["digest", "expected_digest", "expected_size"],
+                missed=True)
 @validation.add("enum", param_name="volume_type",
                 values=["DirectoryOrCreate", "Directory", "FileOrCreate",
                         "File", "Socket", "CharDevice", "BlockDevice"])
@@ -29,7 +33,8 @@ class CreateAndDeletePodWithHostPathVolume(base.PodWithVolumeBaseScenario):
 
     def run(self, image, mount_path, volume_type, volume_path,
             image_pull_policy='IfNotPresent', check_cmd=None,
-            error_regexp=None, command=None, status_wait=True):
+            error_regexp=None, command=None, status_wait=True,
+            check_output=None):
         """Create pod with hostPath volume, optionally check and delete then.
 
         Create pod with hostPath volume, optionally wait for it's readiness,
@@ -44,6 +49,10 @@ class CreateAndDeletePodWithHostPathVolume(base.PodWithVolumeBaseScenario):
         :param error_regexp: regexp string to search error in pod exec response
         :param command: array of strings representing container command
         :param status_wait: wait pod status for success if True
+        :param check_output: a dict with optional `digest` (hash algorithm,
+               e.g. sha256), `expected_digest` and `expected_size` keys to
+               verify stdout of check_cmd; output is hashed as it's received
+               instead of being kept
         """
         name = self.generate_random_name()
 
@@ -73,5 +82,6 @@ class CreateAndDeletePodWithHostPathVolume(base.PodWithVolumeBaseScenario):
             check_cmd=check_cmd,
             error_regexp=error_regexp,
             volume=volume,
-            status_wait=status_wait
+            status_wait=status_wait,
+            check_output=check_output
         )
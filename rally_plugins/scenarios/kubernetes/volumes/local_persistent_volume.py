@@ -19,20 +19,30 @@ from rally.task import validation
 from rally_plugins.scenarios.kubernetes.volumes import base
 
 
+@validation.add("regexp", param_name="error_regexp")
+@validation.add("map_keys", param_name="check_output", required=[],
+                allowed=["digest", "expected_digest", "expected_size"],
+                missed=True)
 @validation.add("map_keys", param_name="persistent_volume",
                 required=["size", "volume_mode", "local_path",
-                          "access_modes", "node_affinity"])
+                          "access_modes", "node_affinity"],
+                missed=True)
 @validation.add("map_keys", param_name="persistent_volume_claim",
                 required=["size", "access_modes"])
+@validation.add("required_param_or_context",
+                param_name="persistent_volume",
+                ctx_name="local_persistent_volumes")
+@validation.add("local_persistent_volumes_pool")
 @scenario.configure(
     name="Kubernetes.create_and_delete_pod_with_local_persistent_volume",
     platform="kubernetes"
 )
 class CreateAndDeletePodWithLocalPVVolume(base.PodWithVolumeBaseScenario):
 
-    def run(self, image, mount_path, persistent_volume,
-            persistent_volume_claim, image_pull_policy='IfNotPresent', 
-            check_cmd=None, error_regexp=None, command=None, status_wait=True):
+    def run(self, image, mount_path, persistent_volume_claim,
+            persistent_volume=None, image_pull_policy='IfNotPresent',
+            check_cmd=None, error_regexp=None, command=None, status_wait=True,
+            check_output=None):
         """Create pod with local PV, optionally check and delete then.
 
         Create pod with local persistent volume, optionally wait for it's
@@ -42,36 +52,30 @@ class CreateAndDeletePodWithLocalPVVolume(base.PodWithVolumeBaseScenario):
         :param image: pod's image
         :param image_pull_policy: override default image pull policy
         :param mount_path: path to mount volume in pod
-        :param persistent_volume: a dict with the next keys: `size`,
-               `volume_mode`, `local_path`, `access_modes`, `node_affinity`
         :param persistent_volume_claim: a dict with the next keys: `size` and
                `access_modes`
+        :param persistent_volume: a dict with the next keys: `size`,
+               `volume_mode`, `local_path`, `access_modes`, `node_affinity`;
+               required, unless PV is leased from local_persistent_volumes
+               context pool
         :param check_cmd: check command to exec in pod; if None, then no check
         :param error_regexp: regexp string to search error in pod exec response
         :param command: array of strings representing container command
         :param status_wait: wait pod status for success if True
+        :param check_output: a dict with optional `digest` (hash algorithm,
+               e.g. sha256), `expected_digest` and `expected_size` keys to
+               verify stdout of check_cmd; output is hashed as it's received
+               instead of being kept
         """
         name = self.generate_random_name()
 
-        self.client.create_local_pv(
+        leased = self.create_local_volume(
             name,
-            storage_class=self.context["kubernetes"]["storageclass"],
-            size=persistent_volume["size"],
-            volume_mode=persistent_volume["volume_mode"],
-            local_path=persistent_volume["local_path"],
-            access_modes=persistent_volume["access_modes"],
-            node_affinity=persistent_volume["node_affinity"],
+            persistent_volume=persistent_volume,
+            persistent_volume_claim=persistent_volume_claim,
             status_wait=status_wait
         )
 
-        self.client.create_local_pvc(
-            name,
-            namespace=self.namespace,
-            storage_class=self.context["kubernetes"]["storageclass"],
-            access_modes=persistent_volume_claim["access_modes"],
-            size=persistent_volume_claim["size"]
-        )
-
         volume = {
             "mount_path": [
                 {
@@ -97,7 +101,8 @@ class CreateAndDeletePodWithLocalPVVolume(base.PodWithVolumeBaseScenario):
             check_cmd=check_cmd,
             error_regexp=error_regexp,
             volume=volume,
-            status_wait=status_wait
+            status_wait=status_wait,
+            check_output=check_output
         )
 
         with atomic.ActionTimer(
@@ -107,16 +112,7 @@ class CreateAndDeletePodWithLocalPVVolume(base.PodWithVolumeBaseScenario):
             self.assertNotEqual("Failed", resp.status.phase)
         with atomic.ActionTimer(self,
                                 "kubernetes.check_persistent_volume_status"):
-            resp = self.client.get_local_pv(name)
+            resp = self.client.get_local_pv(resp.spec.volume_name)
             self.assertNotEqual("Failed", resp.status.phase)
 
-        self.client.delete_local_pvc(
-            name,
-            namespace=self.namespace,
-            status_wait=status_wait
-        )
-
-        self.client.delete_local_pv(
-            name,
-            status_wait=status_wait
-        )
+        self.delete_local_volume(name, leased=leased, status_wait=status_wait)
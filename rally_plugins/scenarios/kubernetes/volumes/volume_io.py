@@ -0,0 +1,381 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+from rally import exceptions
+from rally.task import scenario
+from rally.task import validation
+
+from rally_plugins.scenarios.kubernetes.volumes import base
+
+# Container command keeping pod running until fio is executed in it.
+IDLE_COMMAND = ["/bin/sh", "-c",
+                "trap 'exit 0' TERM; while true; do sleep 1; done"]
+
+IO_MODES = ["read", "write", "randread", "randwrite", "rw", "randrw"]
+PERCENTILES = (50, 95, 99)
+
+# Time in seconds to wait for fio besides the workload duration, e.g. to
+# lay out test file.
+IO_TIMEOUT_MARGIN = 60
+
+
+def make_fio_command(filename, rw, block_size, queue_depth, duration, size,
+                     ioengine, direct):
+    """Make fio command running single job with JSON output.
+
+    :param filename: path to test file in pod
+    :param rw: I/O pattern, one of IO_MODES
+    :param block_size: block size, e.g. 4k
+    :param queue_depth: number of I/O units kept in flight
+    :param duration: workload duration in seconds
+    :param size: test file size, e.g. 64M
+    :param ioengine: fio I/O engine
+    :param direct: use non-buffered I/O if True
+    """
+    return ["fio",
+            "--name=rally",
+            "--filename=%s" % filename,
+            "--rw=%s" % rw,
+            "--bs=%s" % block_size,
+            "--iodepth=%d" % queue_depth,
+            "--runtime=%d" % duration,
+            "--time_based",
+            "--size=%s" % size,
+            "--ioengine=%s" % ioengine,
+            "--direct=%d" % bool(direct),
+            "--percentile_list=%s" % ":".join(str(p) for p in PERCENTILES),
+            "--output-format=json"]
+
+
+def parse_fio_output(output, errors=""):
+    """Get IOPS, bandwidth and latency percentiles from fio JSON output.
+
+    :param output: stdout of fio command
+    :param errors: stderr of fio command to report if output is invalid
+    :returns: dict with stats of read and write directions, which have I/O
+              done, each is a dict with `iops`, `bandwidth` (MiB/s) and
+              `latency` (dict of percentile to milliseconds) keys
+    """
+    try:
+        # NOTE: fio could print warnings before JSON.
+        job = json.loads(output[output.index("{"):])["jobs"][0]
+    except (ValueError, KeyError, IndexError):
+        raise exceptions.RallyException(
+            message="Failed to parse fio output: %(output)s; fio errors: "
+                    "%(errors)s" % {"output": output[:1024],
+                                    "errors": errors[:1024]})
+
+    stats = {}
+    for direction in ("read", "write"):
+        result = job.get(direction) or {}
+        if not result.get("io_bytes"):
+            continue
+        percentiles = (result.get("clat_ns") or {}).get("percentile") or {}
+        stats[direction] = {
+            "iops": result["iops"],
+            "bandwidth": result["bw"] / 1024.0,
+            "latency": {p: percentiles["%f" % p] / 10.0 ** 6
+                        for p in PERCENTILES if "%f" % p in percentiles}
+        }
+    return stats
+
+
+class VolumeIOBaseScenario(base.PodWithVolumeBaseScenario):
+    """Base scenario plugin for volume I/O scenarios.
+
+    Pod with volume is kept running while fio is executed in it over the
+    same exec path as volume checks, so the image should have fio.
+    """
+
+    def run_io(self, image, name, mount_path, volume, rw, block_size,
+               queue_depth, duration, size, ioengine, direct,
+               image_pull_policy='IfNotPresent', command=None,
+               status_wait=True):
+        """Create pod with volume, run fio workload on it and delete pod.
+
+        :param image: pod's image with fio
+        :param name: pod's name, equals to volume name
+        :param mount_path: path to mount volume in pod
+        :param volume: a dict, which contains `mount_path` and `volume` keys
+               with parts of pod's manifest as values
+        :param rw: I/O pattern, one of IO_MODES
+        :param block_size: block size, e.g. 4k
+        :param queue_depth: number of I/O units kept in flight
+        :param duration: workload duration in seconds
+        :param size: test file size, e.g. 64M
+        :param ioengine: fio I/O engine
+        :param direct: use non-buffered I/O if True
+        :param image_pull_policy: override default image pull policy
+        :param command: pod container's command, which keeps pod running
+        :param status_wait: wait for pod deletion if True
+        """
+        self.client.create_pod(
+            image,
+            image_pull_policy=image_pull_policy,
+            name=name,
+            volume=volume,
+            namespace=self.namespace,
+            command=command or IDLE_COMMAND,
+            status_wait=True
+        )
+
+        fio = make_fio_command("%s/rally-fio" % mount_path.rstrip("/"),
+                               rw=rw,
+                               block_size=block_size,
+                               queue_depth=queue_depth,
+                               duration=duration,
+                               size=size,
+                               ioengine=ioengine,
+                               direct=direct)
+        stdout, stderr = self.client.exec_pod(
+            name,
+            namespace=self.namespace,
+            command=fio,
+            timeout=duration + IO_TIMEOUT_MARGIN
+        )
+        self._add_io_output(parse_fio_output(stdout, errors=stderr), rw=rw,
+                            block_size=block_size, queue_depth=queue_depth)
+
+        self.client.delete_pod(
+            name,
+            namespace=self.namespace,
+            status_wait=status_wait
+        )
+
+    def _add_io_output(self, stats, rw, block_size, queue_depth):
+        rows = []
+        for direction, result in sorted(stats.items()):
+            rows.append(["%s IOPS" % direction, result["iops"]])
+            rows.append(["%s bandwidth, MiB/s" % direction,
+                         result["bandwidth"]])
+            for percent, latency in sorted(result["latency"].items()):
+                rows.append(["p%s %s latency, ms" % (percent, direction),
+                             latency])
+        self.add_output(
+            additive={"title": "Volume I/O throughput and latency",
+                      "description": "IOPS, bandwidth and completion "
+                                     "latency percentiles of %s workload "
+                                     "with %s blocks and queue depth %s "
+                                     "measured by fio"
+                                     % (rw, block_size, queue_depth),
+                      "chart_plugin": "StatsTable",
+                      "data": rows})
+
+
+@validation.add("enum", param_name="rw", values=IO_MODES, missed=True)
+@validation.add("number", param_name="queue_depth", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="duration", minval=1,
+                integer_only=True, nullable=True)
+@scenario.configure(
+    name="Kubernetes.run_volume_io_with_emptydir_volume",
+    platform="kubernetes"
+)
+class RunVolumeIOWithEmptyDirVolume(VolumeIOBaseScenario):
+
+    def run(self, image, mount_path, rw="randread", block_size="4k",
+            queue_depth=1, duration=30, size="64M", ioengine="libaio",
+            direct=True, image_pull_policy='IfNotPresent', command=None,
+            status_wait=True):
+        """Create pod with emptyDir volume, run fio on it and delete pod.
+
+        IOPS, bandwidth and latency percentiles are added to scenario output.
+
+        :param image: pod's image with fio
+        :param mount_path: path to mount volume in pod
+        :param rw: I/O pattern: read, write, randread, randwrite, rw or randrw
+        :param block_size: block size, e.g. 4k
+        :param queue_depth: number of I/O units kept in flight
+        :param duration: workload duration in seconds
+        :param size: test file size, e.g. 64M
+        :param ioengine: fio I/O engine
+        :param direct: use non-buffered I/O if True
+        :param image_pull_policy: override default image pull policy
+        :param command: array of strings representing container command,
+               which keeps pod running
+        :param status_wait: wait pod deletion if True
+        """
+        name = self.generate_random_name()
+
+        volume = {
+            "mount_path": [
+                {
+                    "mountPath": mount_path,
+                    "name": name
+                }
+            ],
+            "volume": [
+                {
+                    "name": name,
+                    "emptyDir": {}
+                }
+            ]
+        }
+
+        self.run_io(image, name=name, mount_path=mount_path, volume=volume,
+                    rw=rw, block_size=block_size, queue_depth=queue_depth,
+                    duration=duration, size=size, ioengine=ioengine,
+                    direct=direct, image_pull_policy=image_pull_policy,
+                    command=command, status_wait=status_wait)
+
+
+@validation.add("enum", param_name="rw", values=IO_MODES, missed=True)
+@validation.add("number", param_name="queue_depth", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="duration", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("enum", param_name="volume_type",
+                values=["DirectoryOrCreate", "Directory"])
+@scenario.configure(
+    name="Kubernetes.run_volume_io_with_hostpath_volume",
+    platform="kubernetes"
+)
+class RunVolumeIOWithHostPathVolume(VolumeIOBaseScenario):
+
+    def run(self, image, mount_path, volume_type, volume_path,
+            rw="randread", block_size="4k", queue_depth=1, duration=30,
+            size="64M", ioengine="libaio", direct=True,
+            image_pull_policy='IfNotPresent', command=None, status_wait=True):
+        """Create pod with hostPath volume, run fio on it and delete pod.
+
+        IOPS, bandwidth and latency percentiles are added to scenario output.
+
+        :param image: pod's image with fio
+        :param mount_path: path to mount volume in pod
+        :param volume_type: hostPath type, Directory or DirectoryOrCreate
+        :param volume_path: hostPath volume path in host
+        :param rw: I/O pattern: read, write, randread, randwrite, rw or randrw
+        :param block_size: block size, e.g. 4k
+        :param queue_depth: number of I/O units kept in flight
+        :param duration: workload duration in seconds
+        :param size: test file size, e.g. 64M
+        :param ioengine: fio I/O engine
+        :param direct: use non-buffered I/O if True
+        :param image_pull_policy: override default image pull policy
+        :param command: array of strings representing container command,
+               which keeps pod running
+        :param status_wait: wait pod deletion if True
+        """
+        name = self.generate_random_name()
+
+        volume = {
+            "mount_path": [
+                {
+                    "mountPath": mount_path,
+                    "name": name
+                }
+            ],
+            "volume": [
+                {
+                    "name": name,
+                    "hostPath": {
+                        "type": volume_type,
+                        "path": volume_path
+                    }
+                }
+            ]
+        }
+
+        self.run_io(image, name=name, mount_path=mount_path, volume=volume,
+                    rw=rw, block_size=block_size, queue_depth=queue_depth,
+                    duration=duration, size=size, ioengine=ioengine,
+                    direct=direct, image_pull_policy=image_pull_policy,
+                    command=command, status_wait=status_wait)
+
+
+@validation.add("enum", param_name="rw", values=IO_MODES, missed=True)
+@validation.add("number", param_name="queue_depth", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="duration", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("map_keys", param_name="persistent_volume",
+                required=["size", "volume_mode", "local_path",
+                          "access_modes", "node_affinity"],
+                missed=True)
+@validation.add("map_keys", param_name="persistent_volume_claim",
+                required=["size", "access_modes"])
+@validation.add("required_param_or_context",
+                param_name="persistent_volume",
+                ctx_name="local_persistent_volumes")
+@validation.add("local_persistent_volumes_pool")
+@scenario.configure(
+    name="Kubernetes.run_volume_io_with_local_persistent_volume",
+    platform="kubernetes"
+)
+class RunVolumeIOWithLocalPVVolume(VolumeIOBaseScenario):
+
+    def run(self, image, mount_path, persistent_volume_claim,
+            persistent_volume=None, rw="randread", block_size="4k",
+            queue_depth=1, duration=30, size="64M", ioengine="libaio",
+            direct=True, image_pull_policy='IfNotPresent', command=None,
+            status_wait=True):
+        """Create pod with local PV, run fio on it and delete pod and PV.
+
+        IOPS, bandwidth and latency percentiles are added to scenario output.
+
+        :param image: pod's image with fio
+        :param mount_path: path to mount volume in pod
+        :param persistent_volume_claim: a dict with the next keys: `size` and
+               `access_modes`
+        :param persistent_volume: a dict with the next keys: `size`,
+               `volume_mode`, `local_path`, `access_modes`, `node_affinity`;
+               required, unless PV is leased from local_persistent_volumes
+               context pool
+        :param rw: I/O pattern: read, write, randread, randwrite, rw or randrw
+        :param block_size: block size, e.g. 4k
+        :param queue_depth: number of I/O units kept in flight
+        :param duration: workload duration in seconds
+        :param size: test file size, e.g. 64M
+        :param ioengine: fio I/O engine
+        :param direct: use non-buffered I/O if True
+        :param image_pull_policy: override default image pull policy
+        :param command: array of strings representing container command,
+               which keeps pod running
+        :param status_wait: wait PV status and deletion if True
+        """
+        name = self.generate_random_name()
+
+        leased = self.create_local_volume(
+            name,
+            persistent_volume=persistent_volume,
+            persistent_volume_claim=persistent_volume_claim,
+            status_wait=status_wait
+        )
+
+        volume = {
+            "mount_path": [
+                {
+                    "mountPath": mount_path,
+                    "name": name
+                }
+            ],
+            "volume": [
+                {
+                    "name": name,
+                    "persistentVolumeClaim": {
+                        "claimName": name
+                    }
+                }
+            ]
+        }
+
+        self.run_io(image, name=name, mount_path=mount_path, volume=volume,
+                    rw=rw, block_size=block_size, queue_depth=queue_depth,
+                    duration=duration, size=size, ioengine=ioengine,
+                    direct=direct, image_pull_policy=image_pull_policy,
+                    command=command, status_wait=status_wait)
+
+        self.delete_local_volume(name, leased=leased, status_wait=status_wait)
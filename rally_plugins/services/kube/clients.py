@@ -0,0 +1,232 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import copy
+import socket
+import threading
+from urllib import parse
+
+from kubernetes import client as k8s_config
+from kubernetes.client import api_client
+from kubernetes.client import rest
+from rally.common import cfg
+import urllib3
+from urllib3 import connection
+
+from rally_plugins.services.kube import manifests
+from rally_plugins.services.kube import ratelimit
+from rally_plugins.services.kube import retries
+
+CONF = cfg.CONF
+
+# Platform spec keys, which define connection to Kubernetes API.
+SPEC_KEYS = ("server", "certificate-authority", "api_key", "api_key_prefix",
+             "client-certificate", "client-key", "tls_insecure",
+             "disable_assert_hostname")
+
+_API_CLIENTS = {}
+_API_CLIENTS_LOCK = threading.Lock()
+
+
+def make_configuration(spec, config=None):
+    """Make kubernetes client configuration from platform spec.
+
+    :param spec: kubernetes platform spec
+    :param config: configuration object to fill, defaults to a copy of
+           kubernetes client default configuration
+    """
+    if config is None:
+        config = k8s_config.Configuration.get_default_copy()
+    config.host = spec["server"]
+    config.ssl_ca_cert = spec["certificate-authority"]
+    if spec.get("api_key"):
+        config.api_key = {"authorization": spec["api_key"]}
+        if spec.get("api_key_prefix"):
+            config.api_key_prefix = {
+                "authorization": spec["api_key_prefix"]}
+    else:
+        config.cert_file = spec["client-certificate"]
+        config.key_file = spec["client-key"]
+        if spec.get("tls_insecure", False):
+            config.verify_ssl = False
+    if spec.get("disable_assert_hostname") is True:
+        config.assert_hostname = False
+    if CONF.kubernetes.connection_pool_maxsize:
+        config.connection_pool_maxsize = (
+            CONF.kubernetes.connection_pool_maxsize)
+    return config
+
+
+class RateLimitedApiClient(api_client.ApiClient):
+    """Api client, which limits rate of its requests and retries them.
+
+    Requests are delayed according to the limiter budgets and requests
+    rejected with 429 Too Many Requests are retried after Retry-After delay,
+    which holds all other requests of the client as well. Requests failed
+    with transient apiserver errors are retried after exponential backoff,
+    create requests carry idempotency token, so 409 AlreadyExists of the
+    retried create is considered success if the object has the same token,
+    as well as 404 of the retried delete. Manifests serialized in advance
+    (see manifests.Serialized) are sent as is.
+
+    Time requests are held is reported as atomic actions of atomic_inst of
+    the client, see bind.
+    """
+
+    atomic_inst = None
+
+    def __init__(self, configuration=None, limiter=None):
+        super(RateLimitedApiClient, self).__init__(
+            configuration=configuration)
+        self.limiter = limiter or ratelimit.RateLimiter()
+        self.unbound = self
+
+    def bind(self, atomic_inst):
+        """Make client reporting throttling as atomic actions of instance.
+
+        The new client shares connection pool and limiter with this one.
+
+        :param atomic_inst: object with _atomic_actions attribute (e.g.
+               service instance)
+        """
+        client = copy.copy(self)
+        client._pool = None
+        client.atomic_inst = atomic_inst
+        return client
+
+    def _resolve_retried(self, method, url, ex, token, kwargs):
+        if method == "DELETE" and ex.status == 404:
+            return retries.ErrorResponse(ex)
+        if method == "POST" and ex.status == 409 and token is not None:
+            body = kwargs["body"]
+            name = (body.name if isinstance(body, manifests.Serialized)
+                    else body["metadata"]["name"])
+            resp = super(RateLimitedApiClient, self).request(
+                "GET", "%s/%s" % (url, name),
+                headers=kwargs.get("headers"),
+                _request_timeout=kwargs.get("_request_timeout"))
+            if retries.has_token(resp, token):
+                return resp
+        return None
+
+    def _send_serialized(self, method, url, query_params=None, headers=None,
+                         post_params=None, body=None, _preload_content=True,
+                         _request_timeout=None):
+        # NOTE: rest client serializes any json body, so serialized one is
+        #   sent by connection pool directly.
+        if query_params:
+            url += "?" + parse.urlencode(query_params)
+        headers = dict(headers or {})
+        headers.setdefault("Content-Type", "application/json")
+        timeout = None
+        if isinstance(_request_timeout, tuple):
+            timeout = urllib3.Timeout(connect=_request_timeout[0],
+                                      read=_request_timeout[1])
+        elif _request_timeout:
+            timeout = urllib3.Timeout(total=_request_timeout)
+        try:
+            resp = self.rest_client.pool_manager.request(
+                method, url, body=bytes(body), headers=headers,
+                preload_content=_preload_content, timeout=timeout)
+        except urllib3.exceptions.SSLError as e:
+            raise rest.ApiException(
+                status=0, reason="%s\n%s" % (type(e).__name__, e))
+        if _preload_content:
+            resp = rest.RESTResponse(resp)
+            resp.data = resp.data.decode("utf8")
+        if not 200 <= resp.status <= 299:
+            raise rest.ApiException(http_resp=resp)
+        return resp
+
+    def request(self, method, url, *args, **kwargs):
+        body = kwargs.get("body")
+        serialized = isinstance(body, manifests.Serialized)
+        token = None
+        if method == "POST" and CONF.kubernetes.api_retries:
+            token = (body.token if serialized
+                     else retries.set_idempotency_token(body))
+        throttled = failed = 0
+        while True:
+            ratelimit.throttle(self.limiter.reserve(method),
+                               self.atomic_inst)
+            try:
+                if serialized:
+                    return self._send_serialized(method, url, *args,
+                                                 **kwargs)
+                return super(RateLimitedApiClient, self).request(
+                    method, url, *args, **kwargs)
+            except rest.ApiException as ex:
+                if (ex.status == 429 and
+                        throttled < CONF.kubernetes.api_throttle_retries):
+                    throttled += 1
+                    self.limiter.pause(ratelimit.retry_after(ex))
+                    continue
+                if failed:
+                    resp = self._resolve_retried(method, url, ex, token,
+                                                 kwargs)
+                    if resp is not None:
+                        return resp
+                if (ex.status not in retries.BACKOFF_STATUSES or
+                        failed >= CONF.kubernetes.api_retries or
+                        (method == "POST" and token is None)):
+                    raise
+                ratelimit.throttle(retries.backoff(failed), self.atomic_inst,
+                                   action="kubernetes.retry_backoff")
+                failed += 1
+
+
+def make_api_client(spec):
+    """Make new api client with its own connection pool and rate limiter.
+
+    :param spec: kubernetes platform spec
+    """
+    api = RateLimitedApiClient(configuration=make_configuration(spec),
+                               limiter=ratelimit.RateLimiter.from_conf())
+    if CONF.kubernetes.tcp_keepalive:
+        pool_kw = api.rest_client.pool_manager.connection_pool_kw
+        pool_kw["socket_options"] = (
+            connection.HTTPConnection.default_socket_options +
+            [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+    return api
+
+
+def unbound_api(api):
+    """Get api of the same group, which uses unbound api client.
+
+    Requests of process-wide caches shouldn't be reported as atomic actions
+    of the service, which happened to create the cache.
+
+    :param api: api instance, e.g. CoreV1Api
+    """
+    client = getattr(api.api_client, "unbound", api.api_client)
+    if client is api.api_client:
+        return api
+    return type(api)(client)
+
+
+def get_api_client(spec):
+    """Get api client shared by all services with the same platform spec.
+
+    Api client keeps pool of established connections to Kubernetes API, so
+    sharing it saves TLS handshake and certificates reading per each service
+    instance. urllib3 pool is thread-safe, so the client could be used by
+    all scenario iterations of the worker process.
+
+    :param spec: kubernetes platform spec
+    """
+    key = tuple(spec.get(k) for k in SPEC_KEYS)
+    with _API_CLIENTS_LOCK:
+        if key not in _API_CLIENTS:
+            _API_CLIENTS[key] = make_api_client(spec)
+        return _API_CLIENTS[key]
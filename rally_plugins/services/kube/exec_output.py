@@ -0,0 +1,146 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import codecs
+import functools
+import hashlib
+import re
+
+from kubernetes.stream import ws_client
+
+# Error of container runtime, which couldn't exec command.
+EXEC_FAILED_REGEXP = re.compile("exec failed")
+
+# Length of output kept to search matches crossing chunks boundary and to
+# report in errors.
+WINDOW = 4096
+
+
+@functools.lru_cache(maxsize=64)
+def compile_regexp(pattern):
+    """Compile regexp once per process.
+
+    :param pattern: regexp string
+    """
+    return re.compile(pattern)
+
+
+class OutputMatcher(object):
+    """Search error regexp in exec output fed chunk by chunk.
+
+    Only the last window of output is kept per channel, so matches crossing
+    boundary of chunks are found, if they are shorter than the window, and
+    matches aren't spliced from stdout and stderr chunks.
+    """
+
+    def __init__(self, error_regexp=None, window=WINDOW):
+        """Init matcher.
+
+        :param error_regexp: regexp string to search in output besides
+               exec failure
+        :param window: length of output kept between chunks
+        """
+        self._regexps = [EXEC_FAILED_REGEXP]
+        if error_regexp:
+            self._regexps.append(compile_regexp(error_regexp))
+        self._window = window
+        self._tails = {}
+        self.head = ""
+        self.size = 0
+        self.match = None
+
+    def feed(self, chunk, channel=None):
+        """Search regexps in the next chunk of output.
+
+        :param chunk: output string
+        :param channel: exec stream channel of output
+        :returns: True if output matched
+        """
+        self.size += len(chunk)
+        if len(self.head) < self._window:
+            self.head += chunk[:self._window - len(self.head)]
+        if self.match is None:
+            data = self._tails.get(channel, "") + chunk
+            for regexp in self._regexps:
+                match = regexp.search(data)
+                if match is not None:
+                    self.match = match.group(0)
+                    break
+            self._tails[channel] = data[-self._window:]
+        return self.match is not None
+
+    @property
+    def matched(self):
+        return self.match is not None
+
+    @property
+    def excerpt(self):
+        """Beginning of output to report."""
+        return self.head + ("..." if self.size > len(self.head) else "")
+
+
+class OutputDigest(object):
+    """Size and optional hash digest of output fed chunk by chunk.
+
+    :param algorithm: hashlib algorithm name, e.g. sha256, or None to count
+           bytes only
+    """
+
+    def __init__(self, algorithm=None):
+        self._hash = hashlib.new(algorithm) if algorithm else None
+        self.size = 0
+
+    def feed(self, chunk):
+        """Count the next chunk of output.
+
+        :param chunk: output bytes
+        """
+        self.size += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+
+    @property
+    def digest(self):
+        return self._hash.hexdigest() if self._hash is not None else None
+
+
+class OutputCheck(object):
+    """Check of exec output, which is fed by chunks as it's received.
+
+    Both stdout and stderr are searched for errors, stdout is counted and
+    optionally hashed instead of being kept, so memory used by the check
+    doesn't depend on output size.
+
+    :param error_regexp: regexp string to search in output
+    :param digest: hashlib algorithm name to hash stdout with
+    """
+
+    def __init__(self, error_regexp=None, digest=None):
+        self.matcher = OutputMatcher(error_regexp)
+        self.stdout = OutputDigest(digest)
+        self._decoders = {}
+
+    def feed(self, channel, chunk):
+        """Check the next chunk of output.
+
+        :param channel: exec stream channel of output
+        :param chunk: output bytes
+        """
+        if channel == ws_client.STDOUT_CHANNEL:
+            self.stdout.feed(chunk)
+        if channel not in self._decoders:
+            self._decoders[channel] = codecs.getincrementaldecoder("utf8")(
+                "replace")
+        self.matcher.feed(self._decoders[channel].decode(chunk),
+                          channel=channel)
@@ -0,0 +1,369 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import contextlib
+import json
+import selectors
+import shlex
+import threading
+import time
+import uuid
+
+from kubernetes.stream import stream
+from kubernetes.stream import ws_client
+from rally import exceptions
+from websocket import ABNF
+
+STDOUT = ws_client.STDOUT_CHANNEL
+STDERR = ws_client.STDERR_CHANNEL
+
+# Exit codes of shell, which couldn't find or execute command.
+EXEC_FAILED_CODES = (126, 127)
+
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+class CommandResult(object):
+    """Result of command run in exec session."""
+
+    def __init__(self, command, stdout, stderr, exit_code, started_at,
+                 finished_at):
+        self.command = command
+        self.stdout = stdout
+        self.stderr = stderr
+        self.exit_code = exit_code
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @property
+    def output(self):
+        return self.stdout + self.stderr
+
+    @property
+    def exec_failed(self):
+        return self.exit_code in EXEC_FAILED_CODES
+
+
+class ExecSession(object):
+    """Shell running in pod, which commands are sent to over exec stream.
+
+    Commands of a batch are written to shell stdin at once, so the batch
+    takes single round-trip. Each command is followed by marker lines with
+    its number and exit code, written to stdout and stderr, which split
+    output of the batch per command. Command time is measured from the end
+    of the previous command (or the batch start) to its stdout marker.
+    """
+
+    def __init__(self, exec_api, name, namespace, shell="/bin/sh"):
+        self.key = _key(exec_api, namespace, name)
+        self._marker = "rally-exec-%s" % uuid.uuid4().hex
+        self._ws = stream(exec_api.connect_get_namespaced_pod_exec,
+                          name,
+                          namespace=namespace,
+                          command=[shell],
+                          stderr=True, stdin=True,
+                          stdout=True, tty=False,
+                          _preload_content=False)
+
+    def is_open(self):
+        # NOTE: nothing is expected from idle shell, so any frame is either
+        #   close or garbage.
+        while True:
+            frame = recv(self._ws, 0)
+            if frame is None or frame[0] is None:
+                return frame is not None
+
+    def close(self):
+        self._ws.close()
+
+    def _script(self, commands):
+        lines = []
+        for i, command in enumerate(commands):
+            # NOTE: commands shouldn't read the rest of the script from
+            #   shell stdin.
+            lines.append("%(cmd)s </dev/null; "
+                         "printf '\\n%(marker)s %(i)d %%d\\n' $?; "
+                         "printf '\\n%(marker)s %(i)d\\n' >&2"
+                         % {"cmd": " ".join(shlex.quote(arg)
+                                            for arg in command),
+                            "marker": self._marker, "i": i})
+        return "\n".join(lines) + "\n"
+
+    def run(self, commands, timeout=60, consume=None):
+        """Run batch of commands in the shell.
+
+        :param commands: list of commands, each is array of strings
+        :param timeout: time in seconds to wait for all commands
+        :param consume: function to pass output to as it's received instead
+               of keeping it in results, called with command index, channel
+               (STDOUT or STDERR) and bytes chunk
+        :returns: list of CommandResult
+        """
+        outputs = {}
+        if consume is None:
+            def consume(i, channel, data):
+                outputs.setdefault((i, channel), []).append(data)
+
+        started_at = time.time()
+        self._ws.write_stdin(self._script(commands))
+
+        results = []
+        buffers = {STDOUT: b"", STDERR: b""}
+        exit_code = finished_at = None
+        while len(results) < len(commands):
+            i = len(results)
+            out = buffers[STDOUT]
+            if exit_code is None:
+                out_end = ("\n%s %d " % (self._marker, i)).encode()
+                pos = out.find(out_end)
+                eol = out.find(b"\n", pos + len(out_end)) if pos >= 0 else -1
+                if eol >= 0:
+                    consume(i, STDOUT, out[:pos])
+                    exit_code = int(out[pos + len(out_end):eol])
+                    finished_at = time.time()
+                    buffers[STDOUT] = out[eol + 1:]
+                elif pos < 0 and len(out) > len(out_end):
+                    # NOTE: keep only the tail, which could be beginning of
+                    #   the marker line.
+                    consume(i, STDOUT, out[:-len(out_end)])
+                    buffers[STDOUT] = out[-len(out_end):]
+            err = buffers[STDERR]
+            err_end = ("\n%s %d\n" % (self._marker, i)).encode()
+            pos = err.find(err_end)
+            if pos >= 0 and exit_code is not None:
+                consume(i, STDERR, err[:pos])
+                buffers[STDERR] = err[pos + len(err_end):]
+                stdout, stderr = (
+                    b"".join(outputs.pop((i, c), [])).decode("utf8",
+                                                             "replace")
+                    for c in (STDOUT, STDERR))
+                results.append(CommandResult(
+                    commands[i], stdout, stderr, exit_code,
+                    started_at=(results[-1].finished_at if results
+                                else started_at),
+                    finished_at=finished_at))
+                exit_code = None
+                continue
+            if pos < 0 and len(err) > len(err_end):
+                consume(i, STDERR, err[:-len(err_end)])
+                buffers[STDERR] = err[-len(err_end):]
+
+            remaining = started_at + timeout - time.time()
+            if remaining <= 0:
+                self.close()
+                raise exceptions.TimeoutException(
+                    desired_status="all commands done",
+                    resource_name=self.key[2],
+                    resource_type="Pod exec session",
+                    resource_id="<no id>",
+                    resource_status="%s of %s commands done" % (
+                        i, len(commands)),
+                    timeout=timeout)
+            frame = recv(self._ws, remaining)
+            if frame is None:
+                raise exceptions.RallyException(
+                    "Exec session to pod %s/%s is closed after %s of %s "
+                    "commands" % (self.key[1], self.key[2], i,
+                                  len(commands)))
+            channel, data = frame
+            if channel in buffers:
+                buffers[channel] += data
+        return results
+
+
+def _buffered(sock):
+    """Check whether websocket has received data not read yet.
+
+    Data decrypted by SSL socket or kept by websocket frame buffer is not
+    seen by select on the socket descriptor.
+
+    :param sock: websocket.WebSocket
+    """
+    pending = getattr(sock.sock, "pending", None)
+    if pending is not None and pending():
+        return True
+    frame_buffer = getattr(sock, "frame_buffer", None)
+    return bool(getattr(frame_buffer, "recv_buffer", None))
+
+
+def recv(ws, timeout):
+    """Receive next frame of exec stream.
+
+    Unlike WSClient.update, output is neither decoded nor kept by websocket
+    client, so it could be processed chunk by chunk.
+
+    :param ws: ws_client.WSClient of exec stream
+    :param timeout: time in seconds to wait for frame
+    :returns: tuple of channel and bytes data, channel is None if there is
+              no data frame in time, or None if stream is closed
+    """
+    if not ws.is_open() or not ws.sock.connected:
+        ws.close()
+        return None
+    if not _buffered(ws.sock):
+        # NOTE: select.select fails for descriptors above FD_SETSIZE, which
+        #   are common in workers with many connections.
+        with selectors.DefaultSelector() as selector:
+            selector.register(ws.sock.sock, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                return None, b""
+    op_code, frame = ws.sock.recv_data_frame(True)
+    if op_code == ABNF.OPCODE_CLOSE:
+        ws.close()
+        return None
+    data = frame.data
+    if (op_code not in (ABNF.OPCODE_BINARY, ABNF.OPCODE_TEXT)
+            or len(data) < 2):
+        return None, b""
+    if isinstance(data, str):
+        data = data.encode("utf8")
+    return data[0], data[1:]
+
+
+def exec_command_status(exec_api, name, namespace, command, consume,
+                        timeout=60):
+    """Exec command in pod passing its output to consume function.
+
+    :param exec_api: core api, which api client is used for exec requests
+           only (see Kubernetes.exec_client)
+    :param name: pod name
+    :param namespace: pod namespace
+    :param command: array of strings
+    :param consume: function to pass output to as it's received, called
+           with channel and bytes chunk
+    :param timeout: time in seconds to wait for the command
+    :returns: tuple of exec failure flag, which is True if command
+              couldn't be executed, i.e. exec failed with other reason than
+              non-zero exit code of command, and exit code of command or None
+              if it's unknown
+    """
+    ws = stream(exec_api.connect_get_namespaced_pod_exec,
+                name,
+                namespace=namespace,
+                command=command,
+                stderr=True, stdin=False,
+                stdout=True, tty=False,
+                _preload_content=False)
+    deadline = time.time() + timeout
+    error = b""
+    try:
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise exceptions.TimeoutException(
+                    desired_status="command done",
+                    resource_name=name,
+                    resource_type="Pod exec",
+                    resource_id="<no id>",
+                    resource_status="running",
+                    timeout=timeout)
+            frame = recv(ws, remaining)
+            if frame is None:
+                break
+            channel, data = frame
+            if channel in (STDOUT, STDERR) and data:
+                consume(channel, data)
+            elif channel == ws_client.ERROR_CHANNEL:
+                error += data
+    finally:
+        ws.close()
+    try:
+        status = json.loads(error) if error else {}
+    except ValueError:
+        return True, None
+    if status.get("status") == "Success":
+        return False, 0
+    if status.get("reason") != "NonZeroExitCode":
+        return status.get("status") == "Failure", None
+    for cause in (status.get("details") or {}).get("causes") or []:
+        if cause.get("reason") == "ExitCode":
+            try:
+                return False, int(cause.get("message"))
+            except (TypeError, ValueError):
+                break
+    return False, None
+
+
+def exec_command(exec_api, name, namespace, command, consume, timeout=60):
+    """Exec command in pod passing its output to consume function.
+
+    :param exec_api: core api, which api client is used for exec requests
+           only (see Kubernetes.exec_client)
+    :param name: pod name
+    :param namespace: pod namespace
+    :param command: array of strings
+    :param consume: function to pass output to as it's received, called
+           with channel and bytes chunk
+    :param timeout: time in seconds to wait for the command
+    :returns: True if command couldn't be executed, i.e. exec failed with
+              other reason than non-zero exit code of command
+    """
+    return exec_command_status(exec_api, name, namespace, command, consume,
+                               timeout=timeout)[0]
+
+
+def _key(exec_api, namespace, name):
+    return exec_api.api_client.configuration.host, namespace, name
+
+
+def _acquire(key):
+    while True:
+        with _SESSIONS_LOCK:
+            idle = _SESSIONS.get(key)
+            if not idle:
+                return None
+            exec_session = idle.pop()
+        if exec_session.is_open():
+            return exec_session
+
+
+@contextlib.contextmanager
+def session(exec_api, name, namespace, shell="/bin/sh"):
+    """Get idle exec session to the pod or open new one.
+
+    Sessions are kept open by worker process and shared by scenario
+    iterations, each session is used by one thread at a time.
+
+    :param exec_api: core api, which api client is used for exec requests
+           only (see Kubernetes.exec_client)
+    :param name: pod name
+    :param namespace: pod namespace
+    :param shell: path to shell in pod container
+    """
+    key = _key(exec_api, namespace, name)
+    exec_session = _acquire(key)
+    if exec_session is None:
+        exec_session = ExecSession(exec_api, name, namespace, shell=shell)
+    try:
+        yield exec_session
+    except Exception:
+        exec_session.close()
+        raise
+    if exec_session.is_open():
+        with _SESSIONS_LOCK:
+            _SESSIONS.setdefault(key, []).append(exec_session)
+
+
+def discard(host, namespace, name):
+    """Close idle exec sessions to the pod, e.g. when it's deleted.
+
+    :param host: Kubernetes API address
+    :param namespace: pod namespace
+    :param name: pod name
+    """
+    with _SESSIONS_LOCK:
+        idle = _SESSIONS.pop((host, namespace, name), [])
+    for exec_session in idle:
+        exec_session.close()
@@ -0,0 +1,247 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import threading
+import time
+
+from kubernetes import watch as k8s_watch
+from rally.common import logging
+
+from rally_plugins.services.kube import clients
+
+LOG = logging.getLogger(__name__)
+
+# Number of consecutive LIST/WATCH failures after which informer considered
+# broken and waiters fall back to polling.
+MAX_FAILURES = 3
+# Server-side timeout of a single watch request, informer re-watches from the
+# last seen resourceVersion after it.
+WATCH_TIMEOUT = 300
+
+_INFORMERS = {}
+_INFORMERS_LOCK = threading.Lock()
+
+
+def _all_namespaces_method(list_method):
+    """Return list method for the same kind, but across all namespaces.
+
+    :param list_method: list method of resource api, e.g.
+           CoreV1Api.list_namespaced_pod or CoreV1Api.list_namespace
+    """
+    name = list_method.__name__
+    prefix = "list_namespaced_"
+    if name.startswith(prefix):
+        name = "list_%s_for_all_namespaces" % name[len(prefix):]
+    return getattr(list_method.__self__, name)
+
+
+def get_informer(list_method, informer_cls=None, label_selector=None):
+    """Get process-wide informer for resource kind, start it if needed.
+
+    Informers are shared by waiters of the same kind and label selector, so
+    resources of other tasks are not watched if selector of the task owner
+    label is specified.
+
+    :param list_method: list method of resource api, which kind should be
+           watched by informer
+    :param informer_cls: Informer subclass to use, defaults to Informer
+    :param label_selector: label selector of watched resources
+    """
+    informer_cls = informer_cls or Informer
+    list_method = getattr(clients.unbound_api(list_method.__self__),
+                          list_method.__name__)
+    method = _all_namespaces_method(list_method)
+    list_kwargs = {}
+    if label_selector:
+        list_kwargs["label_selector"] = label_selector
+    key = (id(method.__self__.api_client), method.__name__,
+           informer_cls.__name__, label_selector)
+    with _INFORMERS_LOCK:
+        if key not in _INFORMERS:
+            _INFORMERS[key] = informer_cls(method, **list_kwargs)
+            _INFORMERS[key].start()
+        return _INFORMERS[key]
+
+
+class Informer(object):
+    """Shared in-memory store of resources of one kind.
+
+    Informer does a single LIST and then WATCH for the resource kind and keeps
+    the store up to date in a background thread, so any number of waiters
+    read resources state without requests to apiserver.
+    """
+
+    def __init__(self, list_method, **list_kwargs):
+        """Initialize informer.
+
+        :param list_method: list method of resource api; for namespaced
+               resources it should list resources across all namespaces
+        :param list_kwargs: additional arguments of LIST and WATCH requests,
+               e.g. label_selector
+        """
+        self._list_method = list_method
+        self._list_kwargs = list_kwargs
+        self._store = {}
+        self._waiters = collections.defaultdict(set)
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._healthy = True
+        self._watcher = None
+        self._thread = threading.Thread(
+            target=self._run, name="informer-%s" % list_method.__name__)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def join(self, timeout=None):
+        """Wait for informer thread to finish after stop.
+
+        Thread could be blocked in watch request until the next event or
+        watch timeout.
+
+        :param timeout: time in seconds to wait
+        :returns: True if thread is finished
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    @staticmethod
+    def _key(resource):
+        return resource.metadata.namespace, resource.metadata.name
+
+    @staticmethod
+    def _accept(resource):
+        """Check whether the resource should be kept in the store."""
+        return True
+
+    def _notify(self, keys):
+        for key in keys:
+            for event in self._waiters.get(key, ()):
+                event.set()
+
+    def _list(self):
+        resp = self._list_method(**self._list_kwargs)
+        with self._lock:
+            self._store = dict((self._key(r), r) for r in resp.items
+                               if self._accept(r))
+            self._healthy = True
+            self._notify(list(self._waiters))
+        self._synced.set()
+        return resp.metadata.resource_version
+
+    def _handle(self, event):
+        resource = event["object"]
+        if not self._accept(resource):
+            return
+        key = self._key(resource)
+        with self._lock:
+            if event["type"] == "DELETED":
+                self._store.pop(key, None)
+            elif event["type"] in ("ADDED", "MODIFIED"):
+                self._store[key] = resource
+            self._notify([key])
+
+    def _run(self):
+        resource_version = None
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._list()
+                self._watcher = k8s_watch.Watch()
+                for event in self._watcher.stream(
+                        self._list_method,
+                        resource_version=resource_version,
+                        timeout_seconds=WATCH_TIMEOUT,
+                        **self._list_kwargs):
+                    self._handle(event)
+                resource_version = (self._watcher.resource_version or
+                                    resource_version)
+                failures = 0
+            except Exception as ex:
+                # NOTE: resourceVersion could be expired (410 Gone) or
+                #   connection dropped, so the full state should be listed
+                #   again.
+                resource_version = None
+                failures += 1
+                LOG.warning("Informer %(name)s failed to watch resources "
+                            "(%(num)s time(s)): %(ex)s"
+                            % {"name": self._thread.name, "num": failures,
+                               "ex": ex})
+                if failures >= MAX_FAILURES:
+                    with self._lock:
+                        self._healthy = False
+                        self._notify(list(self._waiters))
+                    self._synced.set()
+                self._stopped.wait(min(failures, 10))
+
+    def get(self, namespace, name):
+        """Get resource from store.
+
+        :param namespace: resource namespace, None for cluster-wide resources
+        :param name: resource name
+        :returns: tuple with flag, whether the store is synced and up to date,
+                  and resource object (None if resource is not found)
+        """
+        with self._lock:
+            return (self._healthy and self._synced.is_set(),
+                    self._store.get((namespace, name)))
+
+    def wait_for(self, namespace, name, predicate, timeout):
+        """Wait until predicate won't be satisfied for resource in store.
+
+        :param namespace: resource namespace, None for cluster-wide resources
+        :param name: resource name
+        :param predicate: callable, which accepts resource object (or None if
+               resource is not found) and returns True if wait is over
+        :param timeout: total time to wait in seconds
+        :returns: tuple with wait result and last seen resource object.
+                  Result is True if predicate is satisfied, False if timeout
+                  is reached and None if informer is broken and waiting
+                  should be continued by polling
+        """
+        deadline = time.time() + timeout
+        key = (namespace, name)
+        event = threading.Event()
+        resource = None
+        with self._lock:
+            self._waiters[key].add(event)
+        try:
+            self._synced.wait(timeout)
+            while True:
+                event.clear()
+                with self._lock:
+                    healthy = self._healthy
+                    resource = self._store.get(key)
+                if not healthy or not self._synced.is_set():
+                    return None, resource
+                if predicate(resource):
+                    return True, resource
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False, resource
+                event.wait(remaining)
+        finally:
+            with self._lock:
+                self._waiters[key].discard(event)
+                if not self._waiters[key]:
+                    del self._waiters[key]
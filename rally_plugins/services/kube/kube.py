@@ -13,9 +13,11 @@
 # under the License.
 
 import os
-import re
+import threading
+import time
 
 from kubernetes import client as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client import api_client
 from kubernetes.client.api import apps_v1_api
 from kubernetes.client.api import batch_v1_api
@@ -24,7 +26,6 @@ from kubernetes.client.api import extensions_v1beta1_api
 from kubernetes.client.api import storage_v1_api
 from kubernetes.client.api import version_api
 from kubernetes.client import rest
-from kubernetes.stream import stream
 from rally.common import cfg
 from rally.common import logging
 from rally.common import utils as commonutils
@@ -32,102 +33,462 @@ from rally import exceptions
 from rally.task import atomic
 from rally.task import service
 
+from rally_plugins.services.kube import clients
+from rally_plugins.services.kube import exec_output
+from rally_plugins.services.kube import exec_session
+from rally_plugins.services.kube import informer
+from rally_plugins.services.kube import latency
+from rally_plugins.services.kube import manifests
+from rally_plugins.services.kube import nodes
+from rally_plugins.services.kube import poll
+from rally_plugins.services.kube import raw as raw_api
+from rally_plugins.services.kube import retries
+
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
 
+SA_TOKEN_SECRET_TYPE = "kubernetes.io/service-account-token"
+# Reasons of pod events, which mean pod volume mount failure, which is not
+# reflected in pod status.
+POD_FAILURE_REASONS = ("CreateContainerError", "Failed")
+
+# Standard labels of created objects, which allow to filter objects of the
+# task (e.g. by platform cleanup), scenario and iteration server-side.
+OWNER_LABEL = "rally-plugins/owner-id"
+WORKLOAD_LABEL = "rally-plugins/workload-id"
+SCENARIO_LABEL = "rally-plugins/scenario"
+ITERATION_LABEL = "rally-plugins/iteration"
+LOCAL_PV_POOL_LABEL = "rally-plugins/local-pv-pool"
+# Annotation with human readable owner of created objects.
+OWNER_ANNOTATION = "rally-plugins/owner"
+
+_WAIT_STATE = threading.local()
+
+
+def _watch_for(name, list_method, predicate, timeout, namespace=None):
+    """Util method for watching resource until predicate won't be True.
+
+    Resource is listed by its name first and then watched starting from the
+    list resourceVersion, so no state transition could be missed.
+
+    :param name: resource name
+    :param list_method: list method of resource api, used for watching
+    :param predicate: callable, which accepts resource object (or None if
+           resource is not found) and returns True if wait is over
+    :param timeout: total time to watch resource in seconds
+    :param namespace: resource namespace, None for cluster-wide resources
+    :returns: tuple with wait result and last seen resource object. Result
+              is True if predicate is satisfied, False if timeout is reached
+              and None if watch was dropped and waiting should be continued
+              by polling
+    """
+    kwargs = {"field_selector": "metadata.name=%s" % name}
+    if namespace is not None:
+        kwargs["namespace"] = namespace
+    deadline = time.time() + timeout
+    resource = None
+    try:
+        resp = list_method(**kwargs)
+        resource = resp.items[0] if resp.items else None
+        if predicate(resource):
+            return True, resource
+        resource_version = resp.metadata.resource_version
+
+        watcher = k8s_watch.Watch()
+        while time.time() < deadline:
+            timeout_seconds = max(1, int(deadline - time.time()))
+            for event in watcher.stream(list_method,
+                                        resource_version=resource_version,
+                                        timeout_seconds=timeout_seconds,
+                                        **kwargs):
+                if event["type"] == "DELETED":
+                    resource = None
+                else:
+                    resource = event["object"]
+                if predicate(resource):
+                    watcher.stop()
+                    return True, resource
+            resource_version = watcher.resource_version or resource_version
+    except Exception as ex:
+        LOG.warning("Watch for %(name)s was dropped, fall back to polling: "
+                    "%(ex)s" % {"name": name, "ex": ex})
+        return None, resource
+    return False, resource
+
+
+def _wait_for_event(name, list_method, predicate, namespace=None,
+                    label_selector=None):
+    """Wait for resource state change without polling, if it's configured.
+
+    Resource is watched by its own watch request in `watch` wait method or
+    read from the process-wide informer store of resources of its kind and
+    owner label selector in `informer` wait method.
+
+    :param name: resource name
+    :param list_method: list method of resource api or None, if resource
+           doesn't support watching
+    :param predicate: callable, which accepts resource object (or None if
+           resource is not found) and returns True if wait is over
+    :param namespace: resource namespace
+    :param label_selector: owner label selector the resource matches,
+           which informer is scoped by
+    :returns: tuple with wait result and last seen resource object, see
+              `_watch_for`. Result is None if waiting should be done by
+              polling
+    """
+    wait_method = CONF.kubernetes.status_wait_method
+    if list_method is None or wait_method == "poll":
+        return None, None
+    timeout = (CONF.kubernetes.status_total_retries *
+               CONF.kubernetes.status_poll_interval)
+    if wait_method == "informer":
+        return informer.get_informer(
+            list_method, label_selector=label_selector).wait_for(
+                namespace, name, predicate, timeout)
+    return _watch_for(name, list_method, predicate, timeout,
+                      namespace=namespace)
+
+
+def _poll_timeout(started_at):
+    """Return the rest of the wait timeout to poll resource status in.
+
+    Polling after a dropped watch shares the timeout with the watch, so the
+    whole wait doesn't take longer than the configured timeout.
+
+    :param started_at: time the wait is started at
+    """
+    timeout = (CONF.kubernetes.status_total_retries *
+               CONF.kubernetes.status_poll_interval)
+    return max(0, timeout - (time.time() - started_at))
+
+
+def _wait_done(kind, started_at, satisfied_at=None):
+    """Account successfully finished wait.
+
+    :param kind: resource kind (and wait type) to learn poll schedule for
+    :param started_at: time the wait is started at
+    :param satisfied_at: time the awaited state is reached at, if it's known
+           more precisely than the wait end, e.g. watch event arrival time
+           or server-side condition transition time
+    """
+    poll.observe(kind, time.time() - started_at)
+    _WAIT_STATE.satisfied_at = satisfied_at
+
+
+class WaitTimer(atomic.ActionTimer):
+    """Atomic action timer of wait, which optionally reports corrected time.
+
+    Wait measured by polling includes up to one poll interval of overshoot.
+    If [kubernetes]report_corrected_waits option is set, one more atomic
+    action "<name> (corrected)" is added, which ends at the time awaited
+    state is reached at (see _wait_done).
+    """
+
+    def __enter__(self):
+        _WAIT_STATE.satisfied_at = None
+        super(WaitTimer, self).__enter__()
+
+    def __exit__(self, type_, value, tb):
+        super(WaitTimer, self).__exit__(type_, value, tb)
+        satisfied_at = getattr(_WAIT_STATE, "satisfied_at", None)
+        _WAIT_STATE.satisfied_at = None
+        if (type_ is None and satisfied_at is not None
+                and CONF.kubernetes.report_corrected_waits):
+            # NOTE: server-side timestamps have one second precision and
+            #   server clock could differ from the local one, so corrected
+            #   time is kept within the measured interval.
+            finished_at = min(max(satisfied_at, self.start), self.finish)
+            self._root.append({"name": "%s (corrected)" % self.name,
+                               "children": [],
+                               "started_at": self.start,
+                               "finished_at": finished_at})
+
+
+def owner_metadata(owner_id, workload_id=None, scenario=None,
+                   iteration=None):
+    """Make standard labels and annotations of objects created by owner.
+
+    :param owner_id: owner id, i.e. task uuid
+    :param workload_id: workload uuid
+    :param scenario: scenario name
+    :param iteration: scenario iteration number
+    :returns: tuple of labels and annotations dicts
+    """
+    labels = {OWNER_LABEL: owner_id}
+    owner = "task %s" % owner_id
+    if workload_id:
+        labels[WORKLOAD_LABEL] = workload_id
+        owner = "workload %s of %s" % (workload_id, owner)
+    if scenario:
+        # NOTE: label values are limited to 63 characters and should end
+        #   with alphanumeric character.
+        labels[SCENARIO_LABEL] = scenario[:63].rstrip("._-")
+        owner = "%s of %s" % (scenario, owner)
+    if iteration is not None:
+        labels[ITERATION_LABEL] = str(iteration)
+        owner = "iteration %s of %s" % (iteration, owner)
+    return labels, {OWNER_ANNOTATION: owner}
+
+
+def set_owner_metadata(manifest, labels=None, annotations=None):
+    """Set standard labels and annotations to object manifest.
+
+    Labels are set to pod template as well, so pods created by controllers
+    could be filtered by them too. Labels and annotations already set in
+    the manifest are kept.
+
+    :param manifest: object manifest (dict)
+    :param labels: labels dict
+    :param annotations: annotations dict
+    """
+    targets = [manifest.setdefault("metadata", {})]
+    template = (manifest.get("spec") or {}).get("template")
+    if isinstance(template, dict):
+        targets.append(template.setdefault("metadata", {}))
+    for metadata in targets:
+        if labels:
+            metadata["labels"] = dict(labels, **(metadata.get("labels") or {}))
+        if annotations:
+            metadata["annotations"] = dict(
+                annotations, **(metadata.get("annotations") or {}))
+
+
+def delete_options():
+    """Make delete options with configured propagation and grace period."""
+    return k8s_config.V1DeleteOptions(
+        propagation_policy=CONF.kubernetes.delete_propagation_policy,
+        grace_period_seconds=CONF.kubernetes.delete_grace_period)
+
+
+def termination_wait_required(status_wait):
+    """Check whether resource termination is waited right after deletion.
+
+    In deferred termination mode deletions are not waited, termination of
+    all deleted resources is verified by kubernetes.reaper context at the
+    end of the task instead.
+
+    :param status_wait: status_wait argument of delete call
+    """
+    return status_wait and not CONF.kubernetes.deferred_termination
+
+
+def _status_matches(current_status, status):
+    if isinstance(status, (list, tuple)):
+        return current_status in status
+    return current_status == status
+
 
-def wait_for_status(name, status, read_method, resource_type=None, **kwargs):
+def _replicas_ready(resp):
+    current_replicas = resp.status.replicas
+    ready_replicas = resp.status.ready_replicas
+    return (current_replicas is not None and
+            ready_replicas is not None and
+            current_replicas == ready_replicas)
+
+
+def wait_for_batch(names, list_method, predicate, label_selector,
+                   resource_type, namespace=None):
+    """Util method for waiting a batch of resources by single LIST per poll.
+
+    :param names: names of resources in batch
+    :param list_method: list method of resource api
+    :param predicate: callable, which accepts resource object (or None if
+           resource is not found) and returns True if resource is done
+    :param label_selector: label selector, which matches the batch
+    :param resource_type: resource type for extended exceptions
+    :param namespace: resources namespace, None for cluster-wide resources
+    :returns: dict with time each resource was seen done at
+    """
+    sleep_time = CONF.kubernetes.status_poll_interval
+    retries_total = CONF.kubernetes.status_total_retries
+    kwargs = {"label_selector": label_selector}
+    if namespace is not None:
+        kwargs["namespace"] = namespace
+
+    done = {}
+    for delay in poll.schedule("%s batch" % resource_type):
+        listed = dict((r.metadata.name, r)
+                      for r in list_method(**kwargs).items)
+        now = time.time()
+        for name in names:
+            if name not in done and predicate(listed.get(name)):
+                done[name] = now
+        if len(done) == len(names):
+            return done
+        commonutils.interruptable_sleep(delay)
+    raise exceptions.TimeoutException(
+        desired_status="all done",
+        resource_name=", ".join(sorted(set(names) - set(done))),
+        resource_type=resource_type,
+        resource_id="<no id>",
+        resource_status="%s of %s done" % (len(done), len(names)),
+        timeout=(retries_total * sleep_time))
+
+
+def wait_for_status(name, status, read_method, resource_type=None,
+                    list_method=None, watch_selector=None, **kwargs):
     """Util method for polling status until it won't be equals to `status`.
 
     :param name: resource name
     :param status: status waiting for (string or tuple/list)
     :param read_method: method to poll
     :param resource_type: resource type for extended exceptions
+    :param list_method: list method to watch resource with, if watch or
+           informer wait method is configured
+    :param watch_selector: owner label selector of the resource to scope
+           informer by
     :param kwargs: additional kwargs for read_method
     """
     sleep_time = CONF.kubernetes.status_poll_interval
     retries_total = CONF.kubernetes.status_total_retries
-
+    started_at = time.time()
+
+    result, resp = _wait_for_event(
+        name, list_method,
+        predicate=lambda r: (r is not None and
+                             _status_matches(r.status.phase, status)),
+        namespace=kwargs.get("namespace"), label_selector=watch_selector)
+    if result:
+        _wait_done(resource_type, started_at, satisfied_at=time.time())
+        return
+    elif result is False:
+        raise exceptions.TimeoutException(
+            desired_status=status,
+            resource_name=name,
+            resource_type=resource_type,
+            resource_id=resp.metadata.uid if resp else "<no id>",
+            resource_status=resp.status.phase if resp else None,
+            timeout=(retries_total * sleep_time))
+
+    timeout = _poll_timeout(started_at)
     commonutils.interruptable_sleep(CONF.kubernetes.start_prepoll_delay)
 
-    i = 0
-    while i < retries_total:
-        resp = read_method(name=name, **kwargs)
+    resp_id = current_status = None
+    for delay in poll.schedule(resource_type, timeout=timeout):
+        resp = read_method(name=name, raw=CONF.kubernetes.status_raw_reads,
+                           **kwargs)
         resp_id = resp.metadata.uid
         current_status = resp.status.phase
-        if ((isinstance(status, (list, tuple)) and
-             resp.status.phase not in status) or
-            (isinstance(status, str) and
-             resp.status.phase != status)):
-            i += 1
-            commonutils.interruptable_sleep(sleep_time)
-        else:
+        if _status_matches(current_status, status):
+            _wait_done(resource_type, started_at,
+                       satisfied_at=latency.ready_time(resp, resource_type))
             return
-        if i == retries_total:
-            raise exceptions.TimeoutException(
-                desired_status=status,
-                resource_name=name,
-                resource_type=resource_type,
-                resource_id=resp_id or "<no id>",
-                resource_status=current_status,
-                timeout=(retries_total * sleep_time))
+        commonutils.interruptable_sleep(delay)
+
+    raise exceptions.TimeoutException(
+        desired_status=status,
+        resource_name=name,
+        resource_type=resource_type,
+        resource_id=resp_id or "<no id>",
+        resource_status=current_status,
+        timeout=(retries_total * sleep_time))
 
 
 def wait_for_ready_replicas(name, read_method, resource_type=None,
-                            replicas=None, **kwargs):
+                            replicas=None, list_method=None,
+                            watch_selector=None, **kwargs):
     """Util method for polling status until it won't be all replicas running.
 
     :param name: resource name
     :param read_method: method to poll
     :param resource_type: resource type for extended exceptions
     :param replicas: expected replicas for extended exceptions
+    :param list_method: list method to watch resource with, if watch or
+           informer wait method is configured
+    :param watch_selector: owner label selector of the resource to scope
+           informer by
     :param kwargs: additional kwargs for read_method
     """
     sleep_time = CONF.kubernetes.status_poll_interval
     retries_total = CONF.kubernetes.status_total_retries
-
+    started_at = time.time()
+
+    result, resp = _wait_for_event(
+        name, list_method,
+        predicate=lambda r: r is not None and _replicas_ready(r),
+        namespace=kwargs.get("namespace"), label_selector=watch_selector)
+    if result:
+        _wait_done(resource_type, started_at, satisfied_at=time.time())
+        return
+    elif result is False:
+        raise exceptions.TimeoutException(
+            desired_status="%s replicas running" % replicas,
+            resource_name=name,
+            resource_type=resource_type,
+            resource_id=resp.metadata.uid if resp else "<no id>",
+            resource_status="%s replicas running" % (
+                resp.status.replicas if resp else None),
+            timeout=(retries_total * sleep_time))
+
+    timeout = _poll_timeout(started_at)
     commonutils.interruptable_sleep(CONF.kubernetes.start_prepoll_delay)
 
-    i = 0
-    while i < retries_total:
-        resp = read_method(name=name, **kwargs)
+    resp_id = current_replicas = None
+    for delay in poll.schedule(resource_type, timeout=timeout):
+        resp = read_method(name=name, raw=CONF.kubernetes.status_raw_reads,
+                           **kwargs)
         resp_id = resp.metadata.uid
         current_replicas = resp.status.replicas
-        ready_replicas = resp.status.ready_replicas
-        if (current_replicas is None or
-                ready_replicas is None or
-                current_replicas != ready_replicas):
-            i += 1
-            commonutils.interruptable_sleep(sleep_time)
-        else:
+        if _replicas_ready(resp):
+            _wait_done(resource_type, started_at,
+                       satisfied_at=latency.ready_time(resp, resource_type))
             return
-        if i == retries_total:
-            raise exceptions.TimeoutException(
-                desired_status="%s replicas running" % replicas,
-                resource_name=name,
-                resource_type=resource_type,
-                resource_id=resp_id or "<no id>",
-                resource_status="%s replicas running" % current_replicas,
-                timeout=(retries_total * sleep_time))
+        commonutils.interruptable_sleep(delay)
 
+    raise exceptions.TimeoutException(
+        desired_status="%s replicas running" % replicas,
+        resource_name=name,
+        resource_type=resource_type,
+        resource_id=resp_id or "<no id>",
+        resource_status="%s replicas running" % current_replicas,
+        timeout=(retries_total * sleep_time))
 
-def wait_for_not_found(name, read_method, resource_type=None, **kwargs):
+
+def wait_for_not_found(name, read_method, resource_type=None,
+                       list_method=None, watch_selector=None, **kwargs):
     """Util method for polling status while resource exists.
 
     :param name: resource name
     :param read_method: method to poll
     :param resource_type: resource type for extended exceptions
+    :param list_method: list method to watch resource with, if watch or
+           informer wait method is configured
+    :param watch_selector: owner label selector of the resource to scope
+           informer by
     :param kwargs: additional kwargs for read_method
     """
     sleep_time = CONF.kubernetes.status_poll_interval
     retries_total = CONF.kubernetes.status_total_retries
-
+    started_at = time.time()
+    # NOTE: termination time differs from creation one, so it is learned
+    #   separately. Waits of unknown kind are not learned at all.
+    kind = "%s termination" % resource_type if resource_type else None
+
+    result, resp = _wait_for_event(name, list_method,
+                                   predicate=lambda r: r is None,
+                                   namespace=kwargs.get("namespace"),
+                                   label_selector=watch_selector)
+    if result:
+        _wait_done(kind, started_at, satisfied_at=time.time())
+        return
+    elif result is False:
+        raise exceptions.TimeoutException(
+            desired_status="Terminated",
+            resource_name=name,
+            resource_type=resource_type,
+            resource_id=resp.metadata.uid if resp else "<no id>",
+            resource_status="Unknown",
+            timeout=(retries_total * sleep_time))
+
+    timeout = _poll_timeout(started_at)
     commonutils.interruptable_sleep(CONF.kubernetes.start_prepoll_delay)
 
-    i = 0
-    while i < retries_total:
+    resp_id = current_status = None
+    for delay in poll.schedule(kind, timeout=timeout):
         try:
-            resp = read_method(name=name, **kwargs)
+            resp = read_method(name=name,
+                               raw=CONF.kubernetes.status_raw_reads,
+                               **kwargs)
             resp_id = resp.metadata.uid
             if kwargs.get("replicas"):
                 current_status = "%s replicas" % resp.status.replicas
@@ -135,26 +496,25 @@ def wait_for_not_found(name, read_method, resource_type=None, **kwargs):
                 current_status = resp.status.active
             elif kwargs.get("daemonset"):
                 current_status = "%s pods" % resp.status.number_available
-            elif hasattr(resp.status, "phase"):
+            elif getattr(resp.status, "phase", None):
                 current_status = resp.status.phase
             else:
                 current_status = "Unknown"
         except rest.ApiException as ex:
             if ex.status == 404:
+                _wait_done(kind, started_at)
                 return
             else:
                 raise
-        else:
-            commonutils.interruptable_sleep(sleep_time)
-            i += 1
-        if i == retries_total:
-            raise exceptions.TimeoutException(
-                desired_status="Terminated",
-                resource_name=name,
-                resource_type=resource_type,
-                resource_id=resp_id or "<no id>",
-                resource_status=current_status,
-                timeout=(retries_total * sleep_time))
+        commonutils.interruptable_sleep(delay)
+
+    raise exceptions.TimeoutException(
+        desired_status="Terminated",
+        resource_name=name,
+        resource_type=resource_type,
+        resource_id=resp_id or "<no id>",
+        resource_status=current_status,
+        timeout=(retries_total * sleep_time))
 
 
 class Kubernetes(service.Service):
@@ -163,35 +523,69 @@ class Kubernetes(service.Service):
     This class handles different ways for initialization of kubernetesclient.
     """
 
-    def __init__(self, spec, name_generator=None, atomic_inst=None):
+    def __init__(self, spec, name_generator=None, atomic_inst=None,
+                 labels=None, annotations=None):
         super(Kubernetes, self).__init__(None,
                                          name_generator=name_generator,
                                          atomic_inst=atomic_inst)
         self._spec = spec
-        config = k8s_config.Configuration.get_default_copy()
-        config.host = self._spec["server"]
-        config.ssl_ca_cert = self._spec["certificate-authority"]
-        if self._spec.get("api_key"):
-            config.api_key = {"authorization": self._spec["api_key"]}
-            if self._spec.get("api_key_prefix"):
-                config.api_key_prefix = {
-                    "authorization": self._spec["api_key_prefix"]}
-        else:
-            config.cert_file = self._spec["client-certificate"]
-            config.key_file = self._spec["client-key"]
-            if self._spec.get("tls_insecure", False):
-                config.verify_ssl = False
-        if self._spec.get("disable_assert_hostname") is True:
-            config.assert_hostname = False
-
-        api = api_client.ApiClient(configuration=config)
+        self._labels = labels or {}
+        self._annotations = annotations or {}
+        api = clients.get_api_client(self._spec).bind(self)
         self.api = api
+        self._exec_api = None
         self.v1_client = core_v1_api.CoreV1Api(api)
         self.v1_storage = storage_v1_api.StorageV1Api(api)
         self.v1beta1_ext = extensions_v1beta1_api.ExtensionsV1beta1Api(api)
         self.v1_apps = apps_v1_api.AppsV1Api(api)
         self.v1_batch = batch_v1_api.BatchV1Api(api)
 
+    def _set_owner_metadata(self, manifest):
+        set_owner_metadata(manifest, labels=self._labels,
+                           annotations=self._annotations)
+
+    def _owner_selector(self):
+        """Label selector of objects created by the owner, e.g. the task."""
+        owner_id = (self._labels or {}).get(OWNER_LABEL)
+        return "%s=%s" % (OWNER_LABEL, owner_id) if owner_id else None
+
+    def _render_manifest(self, kind, values, **options):
+        """Make manifest of the kind from its pre-built template.
+
+        Standard labels and annotations are added to values, and manifest
+        is serialized to JSON right away, if serialized_manifests option is
+        set.
+
+        :param kind: object kind
+        :param values: values of the template fields
+        :param options: template options
+        """
+        for key, owner_values in (("labels", self._labels),
+                                  ("annotations", self._annotations)):
+            values[key] = dict(owner_values or {}, **(values.get(key) or {}))
+        template = manifests.get_template(kind, **options)
+        if not CONF.kubernetes.serialized_manifests:
+            return template.fill(**values)
+        token = None
+        if CONF.kubernetes.api_retries:
+            token = retries.new_token()
+            values["annotations"][retries.IDEMPOTENCY_ANNOTATION] = token
+        return manifests.Serialized(template.dumps(**values),
+                                    name=values["name"], token=token)
+
+    @property
+    def exec_client(self):
+        """Core api client for exec requests.
+
+        `kubernetes.stream.stream` temporarily replaces request method of api
+        client with websocket one, so exec requests could not be done with
+        api client shared between threads.
+        """
+        if self._exec_api is None:
+            self._exec_api = core_v1_api.CoreV1Api(
+                api_client.ApiClient(configuration=self.api.configuration))
+        return self._exec_api
+
     def get_version(self):
         return version_api.VersionApi(self.api).get_code().to_dict()
 
@@ -224,19 +618,21 @@ class Kubernetes(service.Service):
                 for r in self.v1_client.list_namespace().items]
 
     @atomic.action_timer("kubernetes.get_namespace")
-    def get_namespace(self, name):
+    def get_namespace(self, name, raw=False):
         """Get namespace status.
 
         :param name: namespace name
+        :param raw: return raw JSON view instead of client model
         """
-        return self.v1_client.read_namespace(name)
+        return raw_api.read(self.v1_client.read_namespace, name, raw=raw)
 
     @atomic.action_timer("kubernetes.create_namespace")
-    def create_namespace(self, name, status_wait=True):
+    def create_namespace(self, name, status_wait=True, labels=None):
         """Create namespace and wait until status phase won't be Active.
 
         :param name: namespace name
         :param status_wait: wait namespace for Active status
+        :param labels: additional namespace labels
         """
         name = name or self.generate_random_name()
 
@@ -250,14 +646,20 @@ class Kubernetes(service.Service):
                 }
             }
         }
+        if labels:
+            manifest["metadata"]["labels"].update(labels)
+        self._set_owner_metadata(manifest)
         self.v1_client.create_namespace(body=manifest)
 
         if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_for_nc_become_active"):
+            with WaitTimer(self,
+                           "kubernetes.wait_for_nc_become_active"):
                 wait_for_status(name,
                                 status="Active",
-                                read_method=self.get_namespace)
+                                read_method=self.get_namespace,
+                                resource_type="Namespace",
+                                list_method=self.v1_client.list_namespace,
+                                watch_selector=self._owner_selector())
         return name
 
     @atomic.action_timer("kubernetes.delete_namespace")
@@ -268,13 +670,291 @@ class Kubernetes(service.Service):
         :param status_wait: wait namespace for termination
         """
         self.v1_client.delete_namespace(name=name,
-                                        body=k8s_config.V1DeleteOptions())
+                                        body=delete_options())
 
-        if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_namespace_termination"):
+        if termination_wait_required(status_wait):
+            with WaitTimer(self,
+                           "kubernetes.wait_namespace_termination"):
                 wait_for_not_found(name,
-                                   read_method=self.get_namespace)
+                                   read_method=self.get_namespace,
+                                   resource_type="Namespace",
+                                   list_method=self.v1_client.list_namespace,
+                                   watch_selector=self._owner_selector())
+
+    @atomic.action_timer("kubernetes.wait_namespaces_termination")
+    def wait_for_namespaces_termination(self, names, label_selector=None):
+        """Wait until all namespaces won't be fully terminated.
+
+        Namespaces are checked by single LIST request per poll, so the wait
+        takes as long as the slowest namespace termination.
+
+        :param names: names of deleted namespaces
+        :param label_selector: label selector, which matches deleted
+               namespaces, to narrow the LIST request
+        """
+        pending = set(names)
+        sleep_time = CONF.kubernetes.status_poll_interval
+        retries_total = CONF.kubernetes.status_total_retries
+        for delay in poll.schedule("Namespace termination"):
+            resp = self.v1_client.list_namespace(
+                label_selector=label_selector)
+            pending &= set(r.metadata.name for r in resp.items)
+            if not pending:
+                return
+            commonutils.interruptable_sleep(delay)
+        raise exceptions.TimeoutException(
+            desired_status="Terminated",
+            resource_name=", ".join(sorted(pending)),
+            resource_type="Namespace",
+            resource_id="<no id>",
+            resource_status="Terminating",
+            timeout=(retries_total * sleep_time))
+
+    def _batch_kinds(self):
+        return {
+            "pod": (self.v1_client.list_namespaced_pod,
+                    lambda r: r.status.phase == "Running"),
+            "deployment": (self.v1beta1_ext.list_namespaced_deployment,
+                           _replicas_ready),
+            "job": (self.v1_batch.list_namespaced_job,
+                    lambda r: bool(r.status.succeeded)),
+            "configmap": (self.v1_client.list_namespaced_config_map,
+                          lambda r: True)
+        }
+
+    def wait_for_batch(self, names, namespace, kind, label_selector,
+                       terminated=False):
+        """Wait until all resources of the batch won't be ready or deleted.
+
+        :param names: names of resources in batch
+        :param namespace: resources namespace
+        :param kind: resource kind: pod, deployment, job or configmap
+        :param label_selector: label selector, which matches the batch
+        :param terminated: wait for resources termination instead of
+               readiness
+        :returns: dict with time each resource was seen ready (or deleted)
+        """
+        list_method, ready = self._batch_kinds()[kind]
+        if terminated:
+            action = "kubernetes.wait_for_%s_batch_termination" % kind
+            predicate = (lambda r: r is None)
+        else:
+            action = "kubernetes.wait_for_%s_batch_ready" % kind
+            predicate = (lambda r: r is not None and ready(r))
+        with WaitTimer(self, action):
+            return wait_for_batch(names,
+                                  list_method=list_method,
+                                  predicate=predicate,
+                                  label_selector=label_selector,
+                                  resource_type=kind,
+                                  namespace=namespace)
+
+    def _terminating_kinds(self):
+        return {
+            "Pod": self.v1_client.list_namespaced_pod,
+            "ReplicationController": (
+                self.v1_client.list_namespaced_replication_controller),
+            "ReplicaSet": self.v1beta1_ext.list_namespaced_replica_set,
+            "Deployment": self.v1beta1_ext.list_namespaced_deployment,
+            "StatefulSet": self.v1_apps.list_namespaced_stateful_set,
+            "DaemonSet": self.v1beta1_ext.list_namespaced_daemon_set,
+            "Job": self.v1_batch.list_namespaced_job,
+            "Service": self.v1_client.list_namespaced_service,
+            "ConfigMap": self.v1_client.list_namespaced_config_map,
+            "Secret": self.v1_client.list_namespaced_secret,
+            "PersistentVolumeClaim": (
+                self.v1_client.list_namespaced_persistent_volume_claim)
+        }
+
+    @atomic.action_timer("kubernetes.list_remaining")
+    def list_remaining(self, namespaces, label_selector):
+        """List resources of namespaces, which still exist.
+
+        Resources are found by labels regardless of whether their deletion
+        has been requested, so ones which have never been deleted are
+        listed too.
+
+        :param namespaces: list of namespaces names
+        :param label_selector: label selector to filter resources by
+        :returns: list of "<kind> <namespace>/<name>" strings
+        """
+        remaining = []
+        for kind, list_method in self._terminating_kinds().items():
+            for namespace in namespaces:
+                resp = raw_api.read(list_method, namespace,
+                                    label_selector=label_selector)
+                for r in resp.items:
+                    remaining.append("%s %s/%s" % (
+                        kind, namespace, r.metadata.name))
+        return remaining
+
+    def _cleanup_kinds(self):
+        # NOTE: kind: (list method, deletecollection method or None if api
+        #   doesn't support it for the kind, delete method). Namespaced kinds
+        #   are listed across all namespaces.
+        core, apps = self.v1_client, self.v1_apps
+        return {
+            "Deployment": (apps.list_deployment_for_all_namespaces,
+                           apps.delete_collection_namespaced_deployment,
+                           apps.delete_namespaced_deployment),
+            "DaemonSet": (apps.list_daemon_set_for_all_namespaces,
+                          apps.delete_collection_namespaced_daemon_set,
+                          apps.delete_namespaced_daemon_set),
+            "StatefulSet": (apps.list_stateful_set_for_all_namespaces,
+                            apps.delete_collection_namespaced_stateful_set,
+                            apps.delete_namespaced_stateful_set),
+            "ReplicaSet": (apps.list_replica_set_for_all_namespaces,
+                           apps.delete_collection_namespaced_replica_set,
+                           apps.delete_namespaced_replica_set),
+            "Job": (self.v1_batch.list_job_for_all_namespaces,
+                    self.v1_batch.delete_collection_namespaced_job,
+                    self.v1_batch.delete_namespaced_job),
+            "ReplicationController": (
+                core.list_replication_controller_for_all_namespaces,
+                core.delete_collection_namespaced_replication_controller,
+                core.delete_namespaced_replication_controller),
+            "Pod": (core.list_pod_for_all_namespaces,
+                    core.delete_collection_namespaced_pod,
+                    core.delete_namespaced_pod),
+            "Service": (core.list_service_for_all_namespaces,
+                        None,
+                        core.delete_namespaced_service),
+            "ConfigMap": (core.list_config_map_for_all_namespaces,
+                          core.delete_collection_namespaced_config_map,
+                          core.delete_namespaced_config_map),
+            "Secret": (core.list_secret_for_all_namespaces,
+                       core.delete_collection_namespaced_secret,
+                       core.delete_namespaced_secret),
+            "PersistentVolumeClaim": (
+                core.list_persistent_volume_claim_for_all_namespaces,
+                core.delete_collection_namespaced_persistent_volume_claim,
+                core.delete_namespaced_persistent_volume_claim),
+            "Namespace": (core.list_namespace,
+                          None,
+                          core.delete_namespace),
+            "PersistentVolume": (core.list_persistent_volume,
+                                 core.delete_collection_persistent_volume,
+                                 core.delete_persistent_volume),
+            "StorageClass": (self.v1_storage.list_storage_class,
+                             self.v1_storage.delete_collection_storage_class,
+                             self.v1_storage.delete_storage_class)
+        }
+
+    def list_cleanup_kinds(self):
+        """List kinds of resources, which platform cleanup looks for."""
+        return sorted(self._cleanup_kinds())
+
+    def list_labeled(self, label_selector, kinds=None):
+        """List resources of cleanup kinds by label selector.
+
+        :param label_selector: label selector of resources
+        :param kinds: kinds to list, all cleanup kinds if None
+        :returns: list of (kind, namespace, name) tuples, namespace is None
+                  for cluster-wide resources
+        """
+        found = []
+        cleanup_kinds = self._cleanup_kinds()
+        for kind in kinds or sorted(cleanup_kinds):
+            list_method = cleanup_kinds[kind][0]
+            resp = raw_api.read(list_method, label_selector=label_selector)
+            for r in resp.items:
+                found.append((kind, r.metadata.namespace, r.metadata.name))
+        return found
+
+    def supports_delete_collection(self, kind):
+        """Check whether resources of the kind are deleted by collection.
+
+        :param kind: one of cleanup kinds, e.g. Pod
+        """
+        return self._cleanup_kinds()[kind][1] is not None
+
+    def delete_labeled(self, kind, label_selector, namespace=None,
+                       name=None):
+        """Delete resources of the kind without waiting termination.
+
+        Resources matching label selector are deleted by single
+        deletecollection request, if name is not specified, otherwise the
+        named resource is deleted.
+
+        :param kind: one of cleanup kinds, e.g. Pod
+        :param label_selector: label selector of resources
+        :param namespace: namespace of resources, None for cluster-wide kinds
+        :param name: resource name to delete by single delete request
+        """
+        _, delete_collection, delete = self._cleanup_kinds()[kind]
+        kwargs = {"body": delete_options()}
+        if namespace is not None:
+            kwargs["namespace"] = namespace
+        if name is None:
+            delete_collection(label_selector=label_selector, **kwargs)
+            return
+        try:
+            delete(name, **kwargs)
+        except rest.ApiException as ex:
+            if ex.status != 404:
+                raise
+
+    def _latency_kinds(self):
+        return {
+            "Deployment": (self.v1beta1_ext.read_namespaced_deployment,
+                           self.v1beta1_ext.list_namespaced_replica_set),
+            "ReplicaSet": (self.v1beta1_ext.read_namespaced_replica_set,
+                           None),
+            "StatefulSet": (self.v1_apps.read_namespaced_stateful_set, None),
+            "DaemonSet": (self.v1beta1_ext.read_namespaced_daemon_set, None),
+            "Job": (self.v1_batch.read_namespaced_job, None)
+        }
+
+    @staticmethod
+    def _owned_by(items, owner):
+        return [i for i in items
+                if getattr(latency.controller_of(i), "uid", None) ==
+                owner.metadata.uid]
+
+    @atomic.action_timer("kubernetes.get_latency_breakdown")
+    def get_latency_breakdown(self, kind, name, namespace):
+        """Decompose workload startup latency into control-plane phases.
+
+        Phases are reconstructed from server-side timestamps of the workload,
+        its ownerReferences chain and the pod, which got ready the last.
+
+        :param kind: workload kind: Deployment, ReplicaSet, StatefulSet,
+               DaemonSet or Job
+        :param name: workload name
+        :param namespace: workload namespace
+        :returns: ordered list of (phase, duration in seconds) tuples
+        """
+        read_method, list_children = self._latency_kinds()[kind]
+        workload = read_method(name, namespace=namespace)
+        match_labels = (workload.spec.selector.match_labels
+                        if workload.spec.selector else None) or {}
+        selector = ",".join("%s=%s" % (k, v)
+                            for k, v in sorted(match_labels.items()))
+
+        chain = [workload]
+        if list_children is not None:
+            # NOTE: the latest owned object is the one created for the
+            #   current template, e.g. replicaset of the last rollout.
+            children = self._owned_by(
+                list_children(namespace, label_selector=selector).items,
+                workload)
+            if children:
+                chain.append(max(
+                    children,
+                    key=lambda c: c.metadata.creation_timestamp))
+
+        pods = self._owned_by(
+            self.v1_client.list_namespaced_pod(
+                namespace, label_selector=selector).items,
+            chain[-1])
+        pod = latency.critical_pod(pods)
+
+        if kind == "Job":
+            return latency.breakdown(
+                chain, pod,
+                finished_at=workload.status.completion_time,
+                finished_phase="Job completion")
+        return latency.breakdown(chain, pod)
 
     @atomic.action_timer("kubernetes.create_serviceaccount")
     def create_serviceaccount(self, name, namespace):
@@ -290,6 +970,7 @@ class Kubernetes(service.Service):
                 "name": name
             }
         }
+        self._set_owner_metadata(sa_manifest)
         self.v1_client.create_namespaced_service_account(namespace=namespace,
                                                          body=sa_manifest)
 
@@ -308,11 +989,50 @@ class Kubernetes(service.Service):
                 "annotations": {
                     "kubernetes.io/service-account.name": name
                 }
-            }
+            },
+            "type": SA_TOKEN_SECRET_TYPE
         }
+        self._set_owner_metadata(secret_manifest)
         self.v1_client.create_namespaced_secret(namespace=namespace,
                                                 body=secret_manifest)
 
+    @atomic.action_timer("kubernetes.wait_for_secrets_tokens")
+    def wait_for_secrets_tokens(self, secrets):
+        """Wait until service account tokens won't be issued for secrets.
+
+        All secrets of a namespace are checked by single request per poll,
+        only namespaces with pending secrets are polled. Token secrets are
+        listed by owner labels, so only secrets created by the service are
+        read.
+
+        :param secrets: list of (namespace, name) tuples of secrets, created
+               by create_secret method
+        """
+        pending = set(secrets)
+        sleep_time = CONF.kubernetes.status_poll_interval
+        retries_total = CONF.kubernetes.status_total_retries
+        label_selector = ",".join("%s=%s" % label
+                                  for label in sorted(self._labels.items()))
+        for delay in poll.schedule("Secret token"):
+            for namespace in sorted(set(ns for ns, _name in pending)):
+                resp = self.v1_client.list_namespaced_secret(
+                    namespace,
+                    field_selector="type=%s" % SA_TOKEN_SECRET_TYPE,
+                    label_selector=label_selector or None)
+                for r in resp.items:
+                    if r.data and r.data.get("token"):
+                        pending.discard((namespace, r.metadata.name))
+            if not pending:
+                return
+            commonutils.interruptable_sleep(delay)
+        raise exceptions.TimeoutException(
+            desired_status="token issued",
+            resource_name=", ".join("%s/%s" % s for s in sorted(pending)),
+            resource_type="Secret",
+            resource_id="<no id>",
+            resource_status="no token",
+            timeout=(retries_total * sleep_time))
+
     @atomic.action_timer("kubernetes.delete_secret")
     def delete_secret(self, name, namespace):
         """Delete secret.
@@ -323,9 +1043,22 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_secret(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
+    def _get_pod_failure_events(self, name, namespace):
+        """Get failure events of the pod.
+
+        :param name: pod's name
+        :param namespace: pod's namespace
+        """
+        e_list = self.v1_client.list_namespaced_event(
+            namespace=namespace,
+            field_selector="involvedObject.kind=Pod,involvedObject.name=%s"
+                           % name)
+        return [item for item in e_list.items
+                if item.reason in POD_FAILURE_REASONS]
+
     @atomic.action_timer("kubernetes.get_pod")
     def get_pod(self, name, namespace, **kwargs):
         """Get pod status.
@@ -334,17 +1067,15 @@ class Kubernetes(service.Service):
         :param namespace: pod's namespace
         """
         if kwargs.get("volume"):
-            e_list = self.v1_client.list_namespaced_event(namespace=namespace)
-            for item in e_list.items:
-                if item.metadata.name.startswith(name):
-                    if item.reason in ("CreateContainerError", "Failed"):
-                        raise exceptions.RallyException(
-                            message="Volume mount failed with %(reason)s and "
-                                    "message: %(msg)s" % {
-                                        "reason": item.reason,
-                                        "msg": item.message
-                                    })
-        return self.v1_client.read_namespaced_pod(name, namespace=namespace)
+            for item in self._get_pod_failure_events(name, namespace):
+                raise exceptions.RallyException(
+                    message="Volume mount failed with %(reason)s and "
+                            "message: %(msg)s" % {
+                                "reason": item.reason,
+                                "msg": item.message
+                            })
+        return raw_api.read(self.v1_client.read_namespaced_pod, name,
+                            namespace=namespace, raw=kwargs.get("raw"))
 
     @atomic.action_timer("kubernetes.create_pod")
     def create_pod(self, image, namespace, image_pull_policy="IfNotPresent",
@@ -366,79 +1097,188 @@ class Kubernetes(service.Service):
         """
         name = name or self.generate_random_name()
 
-        container_spec = {
+        values = {
             "name": name,
             "image": image,
-            "imagePullPolicy": image_pull_policy
+            "image_pull_policy": image_pull_policy,
+            "labels": dict({"role": name}, **(labels or {})),
+            "service_account": namespace
         }
         if command is not None and isinstance(command, (list, tuple)):
-            container_spec["command"] = list(command)
+            values["command"] = list(command)
         if volume and volume.get("mount_path"):
-            container_spec["volumeMounts"] = volume["mount_path"]
+            values["volume_mounts"] = volume["mount_path"]
         if port is not None and isinstance(port, int) and port > 0:
-            container_spec["ports"] = [{"containerPort": port}]
+            values["ports"] = [{"containerPort": port}]
             if protocol is not None:
-                container_spec["ports"][0]["protocol"] = protocol
-
-        manifest = {
-            "apiVersion": "v1",
-            "kind": "Pod",
-            "metadata": {
-                "name": name,
-                "labels": {
-                    "role": name
-                }
-            },
-            "spec": {
-                "serviceAccountName": namespace,
-                "containers": [container_spec]
-            }
-        }
-
-        if labels:
-            manifest["metadata"]["labels"].update(labels)
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["serviceAccountName"]
+                values["ports"][0]["protocol"] = protocol
         if volume and volume.get("volume"):
-            manifest["spec"]["volumes"] = volume["volume"]
-
+            values["volumes"] = volume["volume"]
+
+        manifest = self._render_manifest(
+            "Pod", values,
+            service_account=bool(self._spec.get("serviceaccounts")),
+            command="command" in values,
+            volume_mounts="volume_mounts" in values,
+            ports="ports" in values,
+            volumes="volumes" in values)
         self.v1_client.create_namespaced_pod(body=manifest,
                                              namespace=namespace)
 
         if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_for_pod_become_running"):
+            with WaitTimer(self,
+                           "kubernetes.wait_for_pod_become_running"):
+                # NOTE: volume mount failures are reported only by events,
+                #   so pods with volumes are always checked by polling.
+                list_method = (None if volume else
+                               self.v1_client.list_namespaced_pod)
                 wait_for_status(name,
                                 status="Running",
                                 read_method=self.get_pod,
+                                watch_selector=self._owner_selector(),
+                                list_method=list_method,
                                 namespace=namespace,
                                 resource_type="Pod",
                                 volume=volume)
         return name
 
+    def exec_commands(self, name, namespace, commands, consume=None,
+                      timeout=None):
+        """Run batch of commands in pod over persistent exec session.
+
+        Each command is reported as nested atomic action.
+
+        :param name: pod's name
+        :param namespace: pod's namespace
+        :param commands: list of commands, each is array of strings
+        :param consume: function to pass output to instead of keeping it in
+               results (see exec_session.ExecSession.run)
+        :param timeout: time in seconds to wait for all commands, defaults to
+               exec_timeout option
+        :returns: list of exec_session.CommandResult
+        """
+        timer = atomic.ActionTimer(self, "kubernetes.exec_commands")
+        with timer:
+            with exec_session.session(self.exec_client, name, namespace,
+                                      shell=CONF.kubernetes.exec_shell) as s:
+                results = s.run(
+                    commands,
+                    timeout=timeout or CONF.kubernetes.exec_timeout,
+                    consume=consume)
+        for result in results:
+            timer.atomic_action["children"].append({
+                "name": "kubernetes.exec_command",
+                "children": [],
+                "started_at": result.started_at,
+                "finished_at": result.finished_at})
+        return results
+
     @atomic.action_timer("kube.check_volume_pod_existence")
-    def check_volume_pod(self, name, namespace, check_cmd, error_regexp=None):
-        """Exec check_cmd in pod and get response.
+    def check_volume_pod(self, name, namespace, check_cmd, error_regexp=None,
+                         digest=None, expected_digest=None,
+                         expected_size=None):
+        """Exec check_cmd in pod and check its output.
+
+        Output is checked chunk by chunk as it's received and isn't kept, so
+        commands could output large files content.
 
         :param name: pod's name
         :param namespace: pod's namespace
-        :param check_cmd: check_cmd as array of strings
+        :param check_cmd: check_cmd as array of strings, or list of such
+               arrays to run several commands
         :param error_regexp: error regexp to raise exception
+        :param digest: hashlib algorithm name to hash stdout of commands with
+        :param expected_digest: expected hex digest of stdout of each command
+        :param expected_size: expected size in bytes of stdout of each command
+        :returns: list of dicts with size and digest of stdout per command
         """
-        resp = stream(
-            self.v1_client.connect_get_namespaced_pod_exec,
-            name,
-            namespace=namespace,
-            command=check_cmd,
-            stderr=True, stdin=False,
-            stdout=True, tty=False
-        )
+        commands = check_cmd
+        if not check_cmd or not isinstance(check_cmd[0], (list, tuple)):
+            commands = [check_cmd]
+        checks = [exec_output.OutputCheck(error_regexp, digest=digest)
+                  for _command in commands]
+
+        if CONF.kubernetes.exec_sessions:
+            results = self.exec_commands(
+                name, namespace=namespace, commands=commands,
+                consume=lambda i, channel, chunk: checks[i].feed(channel,
+                                                                 chunk))
+            exec_failed = [r.exec_failed for r in results]
+        else:
+            exec_failed = [
+                exec_session.exec_command(
+                    self.exec_client, name, namespace, command,
+                    consume=check.feed,
+                    timeout=CONF.kubernetes.exec_timeout)
+                for command, check in zip(commands, checks)]
+
+        for check, failed in zip(checks, exec_failed):
+            if check.matcher.matched:
+                raise exceptions.RallyException(
+                    message="Check pod's volume exec output matched error "
+                            "%(match)r; output starts with: %(excerpt)s"
+                            % {"match": check.matcher.match,
+                               "excerpt": check.matcher.excerpt})
+            if failed:
+                raise exceptions.RallyException(
+                    message="Check pod's volume exec failed with error: %s"
+                            % check.matcher.excerpt
+                )
+            if (expected_size is not None
+                    and check.stdout.size != expected_size):
+                raise exceptions.RallyException(
+                    message="Check pod's volume exec output is %s bytes "
+                            "instead of %s" % (check.stdout.size,
+                                               expected_size))
+            if (expected_digest is not None
+                    and check.stdout.digest != expected_digest):
+                raise exceptions.RallyException(
+                    message="Check pod's volume exec output %s digest is %s "
+                            "instead of %s" % (digest, check.stdout.digest,
+                                               expected_digest))
+        return [{"size": check.stdout.size, "digest": check.stdout.digest}
+                for check in checks]
+
+    @atomic.action_timer("kubernetes.exec_pod")
+    def exec_pod(self, name, namespace, command, timeout=None):
+        """Exec command in pod and get its output.
 
-        regexp = re.search(error_regexp, resp)
-        if "exec failed" in resp or (error_regexp and regexp is not None):
+        :param name: pod's name
+        :param namespace: pod's namespace
+        :param command: array of strings
+        :param timeout: time in seconds to wait for the command, defaults to
+               exec_timeout option
+        :returns: tuple of stdout and stderr strings
+        :raises RallyException: if command couldn't be executed or exited
+                with non-zero code
+        """
+        if CONF.kubernetes.exec_sessions:
+            result = self.exec_commands(name, namespace=namespace,
+                                        commands=[command],
+                                        timeout=timeout)[0]
+            exec_failed, exit_code = result.exec_failed, result.exit_code
+            stdout, stderr = result.stdout, result.stderr
+        else:
+            output = {}
+            exec_failed, exit_code = exec_session.exec_command_status(
+                self.exec_client, name, namespace, command,
+                consume=lambda channel, chunk: output.setdefault(
+                    channel, []).append(chunk),
+                timeout=timeout or CONF.kubernetes.exec_timeout)
+            stdout, stderr = (
+                b"".join(output.get(c, [])).decode("utf8", "replace")
+                for c in (exec_session.STDOUT, exec_session.STDERR))
+        if exec_failed:
             raise exceptions.RallyException(
-                message="Check pod's volume exec failed with error: %s" % resp
-            )
+                message="Exec of %s in pod %s failed: %s"
+                        % (command, name, stderr or stdout))
+        if exit_code:
+            raise exceptions.RallyException(
+                message="Command %(command)s in pod %(name)s exited with "
+                        "code %(code)s: %(stderr)s"
+                        % {"command": command, "name": name,
+                           "code": exit_code, "stderr": stderr or stdout})
+        return stdout, stderr
 
     @atomic.action_timer("kubernetes.delete_pod")
     def delete_pod(self, name, namespace, status_wait=True):
@@ -451,16 +1291,20 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_pod(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
+        exec_session.discard(self.api.configuration.host, namespace, name)
 
-        if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_pod_termination"):
-                wait_for_not_found(name,
-                                   read_method=self.get_pod,
-                                   resource_type="Pod",
-                                   namespace=namespace)
+        if termination_wait_required(status_wait):
+            with WaitTimer(self,
+                           "kubernetes.wait_pod_termination"):
+                wait_for_not_found(
+                    name,
+                    read_method=self.get_pod,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1_client.list_namespaced_pod,
+                    resource_type="Pod",
+                    namespace=namespace)
 
     @atomic.action_timer("kubernetes.get_service")
     def get_service(self, name, namespace):
@@ -500,6 +1344,7 @@ class Kubernetes(service.Service):
             }
         }
 
+        self._set_owner_metadata(manifest)
         self.v1_client.create_namespaced_service(
             namespace=namespace,
             body=manifest
@@ -536,6 +1381,7 @@ class Kubernetes(service.Service):
                 }
             ]
         }
+        self._set_owner_metadata(manifest)
         self.v1_client.create_namespaced_endpoints(
             namespace=namespace,
             body=manifest
@@ -546,7 +1392,7 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_endpoints(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
     @atomic.action_timer("kubernetes.delete_service")
@@ -554,14 +1400,16 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_service(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
     @atomic.action_timer("kubernetes.get_replication_controller")
     def get_rc(self, name, namespace, **kwargs):
-        return self.v1_client.read_namespaced_replication_controller(
+        return raw_api.read(
+            self.v1_client.read_namespaced_replication_controller,
             name,
-            namespace=namespace
+            namespace=namespace,
+            raw=kwargs.get("raw")
         )
 
     @atomic.action_timer("kubernetes.create_replication_controller")
@@ -587,6 +1435,10 @@ class Kubernetes(service.Service):
         if command is not None and isinstance(command, (list, tuple)):
             container_spec["command"] = list(command)
 
+        pod_spec = {"containers": [container_spec]}
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
         manifest = {
             "apiVersion": "v1",
             "kind": "ReplicationController",
@@ -605,30 +1457,28 @@ class Kubernetes(service.Service):
                             "app": app
                         }
                     },
-                    "spec": {
-                        "serviceAccountName": namespace,
-                        "containers": [container_spec]
-                    }
+                    "spec": pod_spec
                 }
             }
         }
 
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["template"]["spec"]["serviceAccountName"]
-
+        self._set_owner_metadata(manifest)
         self.v1_client.create_namespaced_replication_controller(
             body=manifest,
             namespace=namespace
         )
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_replication_controller_ready_replicas"
             ):
                 wait_for_ready_replicas(
                     name,
                     read_method=self.get_rc,
+                    watch_selector=self._owner_selector(),
+                    list_method=(
+                        self.v1_client.list_namespaced_replication_controller),
                     resource_type="Replication controller",
                     replicas=replicas,
                     namespace=namespace)
@@ -649,13 +1499,16 @@ class Kubernetes(service.Service):
             body={"spec": {"replicas": replicas}}
         )
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_replication_controller_ready_replicas"
             ):
                 wait_for_ready_replicas(
                     name,
                     read_method=self.get_rc,
+                    watch_selector=self._owner_selector(),
+                    list_method=(
+                        self.v1_client.list_namespaced_replication_controller),
                     resource_type="Replication controller",
                     replicas=replicas,
                     namespace=namespace)
@@ -671,24 +1524,29 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_replication_controller(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
-        if status_wait:
-            with atomic.ActionTimer(
+        if termination_wait_required(status_wait):
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_replication_controller_termination"):
                 wait_for_not_found(
                     name,
                     read_method=self.get_rc,
+                    watch_selector=self._owner_selector(),
+                    list_method=(
+                        self.v1_client.list_namespaced_replication_controller),
                     resource_type="Replication controller",
                     replicas=True,
                     namespace=namespace)
 
     @atomic.action_timer("kubernetes.get_replicaset")
     def get_replicaset(self, name, namespace, **kwargs):
-        return self.v1beta1_ext.read_namespaced_replica_set(
+        return raw_api.read(
+            self.v1beta1_ext.read_namespaced_replica_set,
             name=name,
-            namespace=namespace
+            namespace=namespace,
+            raw=kwargs.get("raw")
         )
 
     @atomic.action_timer("kubernetes.create_replicaset")
@@ -714,6 +1572,10 @@ class Kubernetes(service.Service):
         if command is not None and isinstance(command, (list, tuple)):
             container_spec["command"] = list(command)
 
+        pod_spec = {"containers": [container_spec]}
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
         manifest = {
             "apiVersion": "extensions/v1beta1",
             "kind": "ReplicaSet",
@@ -737,30 +1599,27 @@ class Kubernetes(service.Service):
                             "app": app
                         }
                     },
-                    "spec": {
-                        "serviceAccountName": namespace,
-                        "containers": [container_spec]
-                    }
+                    "spec": pod_spec
                 }
             }
         }
 
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["template"]["spec"]["serviceAccountName"]
-
+        self._set_owner_metadata(manifest)
         self.v1beta1_ext.create_namespaced_replica_set(
             namespace=namespace,
             body=manifest
         )
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_replicaset_become_ready"):
                 wait_for_ready_replicas(
                     name,
                     resource_type="ReplicaSet",
                     read_method=self.get_replicaset,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1beta1_ext.list_namespaced_replica_set,
                     namespace=namespace)
         return name
 
@@ -772,13 +1631,15 @@ class Kubernetes(service.Service):
             body={"spec": {"replicas": replicas}}
         )
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_replicaset_scale"):
                 wait_for_ready_replicas(
                     name,
                     resource_type="ReplicaSet",
                     read_method=self.get_replicaset,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1beta1_ext.list_namespaced_replica_set,
                     namespace=namespace)
 
     @atomic.action_timer("kubernetes.delete_replicaset")
@@ -792,27 +1653,35 @@ class Kubernetes(service.Service):
         self.v1beta1_ext.delete_namespaced_replica_set(
             name=name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
-        if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_replicaset_termination"):
+        if termination_wait_required(status_wait):
+            with WaitTimer(self,
+                           "kubernetes.wait_replicaset_termination"):
                 wait_for_not_found(name,
                                    read_method=self.get_replicaset,
+                                   resource_type="ReplicaSet",
+                                   watch_selector=self._owner_selector(),
+                                   list_method=(
+                                       self.v1beta1_ext
+                                       .list_namespaced_replica_set),
                                    namespace=namespace,
                                    replicas=True)
 
     @atomic.action_timer("kubernetes.get_deployment")
     def get_deployment(self, name, namespace, **kwargs):
-        return self.v1beta1_ext.read_namespaced_deployment_status(
+        return raw_api.read(
+            self.v1beta1_ext.read_namespaced_deployment_status,
             name=name,
-            namespace=namespace
+            namespace=namespace,
+            raw=kwargs.get("raw")
         )
 
     @atomic.action_timer("kubernetes.create_deployment")
     def create_deployment(self, name, namespace, replicas, image,
                           image_pull_policy='IfNotPresent', resources=None,
-                          env=None, command=None, status_wait=True):
+                          env=None, command=None, labels=None,
+                          status_wait=True):
         """Create replicaset and wait until it won't be ready.
 
         :param name: replicaset name
@@ -822,6 +1691,7 @@ class Kubernetes(service.Service):
         :param resources: container's template resources requirements
         :param env: container's template env variables array
         :param command: container's template array of strings command
+        :param labels: additional labels for deployment
         :param status_wait: wait for readiness if True
         """
         app = self.generate_random_name()
@@ -839,6 +1709,10 @@ class Kubernetes(service.Service):
         if resources is not None and isinstance(resources, dict):
             container_spec["resources"] = resources
 
+        pod_spec = {"containers": [container_spec]}
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
         manifest = {
             "apiVersion": "extensions/v1beta1",
             "kind": "Deployment",
@@ -857,30 +1731,30 @@ class Kubernetes(service.Service):
                             "app": app
                         }
                     },
-                    "spec": {
-                        "serviceAccountName": namespace,
-                        "containers": [container_spec]
-                    }
+                    "spec": pod_spec
                 }
             }
         }
 
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["template"]["spec"]["serviceAccountName"]
+        if labels:
+            manifest["metadata"]["labels"].update(labels)
 
+        self._set_owner_metadata(manifest)
         self.v1beta1_ext.create_namespaced_deployment(
             namespace=namespace,
             body=manifest
         )
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_deployment_become_ready"):
                 wait_for_ready_replicas(
                     name,
                     resource_type="Deployment",
                     read_method=self.get_deployment,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1beta1_ext.list_namespaced_deployment,
                     namespace=namespace)
         return name
 
@@ -918,13 +1792,15 @@ class Kubernetes(service.Service):
             body=deployment
         )
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_deployment_rollout"):
                 wait_for_ready_replicas(
                     name,
                     resource_type="Deployment",
                     read_method=self.get_deployment,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1beta1_ext.list_namespaced_deployment,
                     namespace=namespace)
 
     @atomic.action_timer("kubernetes.delete_deployment")
@@ -938,21 +1814,28 @@ class Kubernetes(service.Service):
         self.v1beta1_ext.delete_namespaced_deployment(
             name=name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
-        if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_deployment_termination"):
+        if termination_wait_required(status_wait):
+            with WaitTimer(self,
+                           "kubernetes.wait_deployment_termination"):
                 wait_for_not_found(name,
                                    read_method=self.get_deployment,
+                                   resource_type="Deployment",
+                                   watch_selector=self._owner_selector(),
+                                   list_method=(
+                                       self.v1beta1_ext
+                                       .list_namespaced_deployment),
                                    namespace=namespace,
                                    replicas=True)
 
     @atomic.action_timer("kubernetes.get_statefulset")
-    def get_statefulset(self, name, namespace):
-        return self.v1_apps.read_namespaced_stateful_set(
+    def get_statefulset(self, name, namespace, raw=False):
+        return raw_api.read(
+            self.v1_apps.read_namespaced_stateful_set,
             name,
-            namespace=namespace
+            namespace=namespace,
+            raw=raw
         )
 
     @atomic.action_timer("kubernetes.create_statefulset")
@@ -979,6 +1862,10 @@ class Kubernetes(service.Service):
         if command is not None and isinstance(command, (list, tuple)):
             container_spec["command"] = list(command)
 
+        pod_spec = {"containers": [container_spec]}
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
         manifest = {
             "apiVersion": "apps/v1",
             "kind": "StatefulSet",
@@ -1002,30 +1889,28 @@ class Kubernetes(service.Service):
                             "app": app
                         }
                     },
-                    "spec": {
-                        "serviceAccountName": namespace,
-                        "containers": [container_spec]
-                    }
+                    "spec": pod_spec
                 }
             }
         }
 
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["template"]["spec"]["serviceAccountName"]
-
+        self._set_owner_metadata(manifest)
         self.v1_apps.create_namespaced_stateful_set(
             namespace=namespace,
             body=manifest
         )
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_statefulset_for_ready_replicas"):
-                wait_for_ready_replicas(name,
-                                        read_method=self.get_statefulset,
-                                        resource_type="StatefulSet",
-                                        namespace=namespace)
+                wait_for_ready_replicas(
+                    name,
+                    read_method=self.get_statefulset,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1_apps.list_namespaced_stateful_set,
+                    resource_type="StatefulSet",
+                    namespace=namespace)
         return name
 
     @atomic.action_timer("kubernetes.scale_statefulset")
@@ -1045,13 +1930,16 @@ class Kubernetes(service.Service):
         )
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_statefulset_for_ready_replicas"):
-                wait_for_ready_replicas(name,
-                                        read_method=self.get_statefulset,
-                                        resource_type="StatefulSet",
-                                        namespace=namespace)
+                wait_for_ready_replicas(
+                    name,
+                    read_method=self.get_statefulset,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1_apps.list_namespaced_stateful_set,
+                    resource_type="StatefulSet",
+                    namespace=namespace)
 
     @atomic.action_timer("kubernetes.delete_statefulset")
     def delete_statefulset(self, name, namespace, status_wait=True):
@@ -1064,25 +1952,30 @@ class Kubernetes(service.Service):
         self.v1_apps.delete_namespaced_stateful_set(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
-        if status_wait:
-            with atomic.ActionTimer(
+        if termination_wait_required(status_wait):
+            with WaitTimer(
                     self,
                     "kubernetes.wait_statefulset_for_termination"):
-                wait_for_not_found(name,
-                                   read_method=self.get_statefulset,
-                                   resource_type="StatefulSet",
-                                   namespace=namespace)
+                wait_for_not_found(
+                    name,
+                    read_method=self.get_statefulset,
+                    watch_selector=self._owner_selector(),
+                    list_method=self.v1_apps.list_namespaced_stateful_set,
+                    resource_type="StatefulSet",
+                    namespace=namespace)
 
     @atomic.action_timer("kubernetes.get_job")
     def get_job(self, name, namespace, **kwargs):
-        return self.v1_batch.read_namespaced_job(name, namespace=namespace)
+        return raw_api.read(self.v1_batch.read_namespaced_job, name,
+                            namespace=namespace, raw=kwargs.get("raw"))
 
     @atomic.action_timer("kubernetes.create_job")
     def create_job(self, name, namespace, image, command,
-                   image_pull_policy='IfNotPresent', restart_policy="Never", status_wait=True):
+                   image_pull_policy='IfNotPresent', restart_policy="Never",
+                   labels=None, status_wait=True):
         """Create job and optionally wait for status.
 
         :param name: job custom name
@@ -1091,11 +1984,26 @@ class Kubernetes(service.Service):
         :param image_pull_policy: override default image pull policy
         :param command: job container's command
         :param restart_policy: job template restartPolicy, default is "Never"
+        :param labels: additional labels for job
         :param status_wait: wait for status if True
         :return: name
         """
         name = name or self.generate_random_name()
 
+        pod_spec = {
+            "restartPolicy": restart_policy,
+            "containers": [
+                {
+                    "name": name,
+                    "image": image,
+                    "imagePullPolicy": image_pull_policy,
+                    "command": command
+                }
+            ]
+        }
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
         manifest = {
             "apiVersion": "batch/v1",
             "kind": "Job",
@@ -1107,53 +2015,66 @@ class Kubernetes(service.Service):
                     "metadata": {
                         "name": name
                     },
-                    "spec": {
-                        "restartPolicy": restart_policy,
-                        "serviceAccountName": namespace,
-                        "containers": [
-                            {
-                                "name": name,
-                                "image": image,
-                                "imagePullPolicy": image_pull_policy,
-                                "command": command
-                            }
-                        ]
-                    }
+                    "spec": pod_spec
                 }
             }
         }
 
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["template"]["spec"]["serviceAccountName"]
+        if labels:
+            manifest["metadata"]["labels"] = dict(labels)
 
+        self._set_owner_metadata(manifest)
         self.v1_batch.create_namespaced_job(namespace=namespace, body=manifest)
 
         if status_wait:
-            with atomic.ActionTimer(self, "kubernetes.wait_job_for_success"):
+            with WaitTimer(self, "kubernetes.wait_job_for_success"):
                 sleep_time = CONF.kubernetes.status_poll_interval
                 retries_total = CONF.kubernetes.status_total_retries
-
+                started_at = time.time()
+
+                result, resp = _wait_for_event(
+                    name, self.v1_batch.list_namespaced_job,
+                    predicate=lambda r: (r is not None and
+                                         r.status.succeeded == 1),
+                    namespace=namespace,
+                    label_selector=self._owner_selector())
+                if result:
+                    _wait_done("Job", started_at, satisfied_at=time.time())
+                    return name
+                elif result is False:
+                    raise exceptions.TimeoutException(
+                        desired_status="1 succeeded",
+                        resource_name=name,
+                        resource_type="Job",
+                        resource_id=resp.metadata.uid if resp else "<no id>",
+                        resource_status="%s succeeded" % (
+                            resp.status.succeeded if resp else None),
+                        timeout=(retries_total * sleep_time))
+
+                timeout = _poll_timeout(started_at)
                 commonutils.interruptable_sleep(
                     CONF.kubernetes.start_prepoll_delay)
 
-                i = 0
-                while i < retries_total:
-                    resp = self.get_job(name=name, namespace=namespace)
+                resp_id = current_status = None
+                for delay in poll.schedule("Job", timeout=timeout):
+                    resp = self.get_job(
+                        name=name, namespace=namespace,
+                        raw=CONF.kubernetes.status_raw_reads)
                     resp_id = resp.metadata.uid
                     current_status = resp.status.succeeded
-                    if current_status != 1:
-                        i += 1
-                        commonutils.interruptable_sleep(sleep_time)
-                    else:
+                    if current_status == 1:
+                        _wait_done("Job", started_at,
+                                   satisfied_at=latency.ready_time(resp))
                         break
-                    if i == retries_total:
-                        raise exceptions.TimeoutException(
-                            desired_status="1 succeeded",
-                            resource_name=name,
-                            resource_type="Job",
-                            resource_id=resp_id or "<no id>",
-                            resource_status="%s succeeded" % current_status,
-                            timeout=(retries_total * sleep_time))
+                    commonutils.interruptable_sleep(delay)
+                else:
+                    raise exceptions.TimeoutException(
+                        desired_status="1 succeeded",
+                        resource_name=name,
+                        resource_type="Job",
+                        resource_id=resp_id or "<no id>",
+                        resource_status="%s succeeded" % current_status,
+                        timeout=(retries_total * sleep_time))
         return name
 
     @atomic.action_timer("kubernetes.delete_job")
@@ -1167,14 +2088,17 @@ class Kubernetes(service.Service):
         self.v1_batch.delete_namespaced_job(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
-        if status_wait:
-            with atomic.ActionTimer(self,
-                                    "kubernetes.wait_job_for_termination"):
+        if termination_wait_required(status_wait):
+            with WaitTimer(self,
+                           "kubernetes.wait_job_for_termination"):
                 wait_for_not_found(name,
                                    read_method=self.get_job,
+                                   watch_selector=self._owner_selector(),
+                                   list_method=(
+                                       self.v1_batch.list_namespaced_job),
                                    resource_type="Job",
                                    namespace=namespace,
                                    active=True)
@@ -1186,24 +2110,21 @@ class Kubernetes(service.Service):
     def list_filtered_nodes(self, node_labels=None):
         """Return list of optionally filtered nodes names.
 
-        :param node_labels: map, each key is a label name with some value
-        """
-        node_meta = [node.metadata for node in self.list_node().items]
-        if node_labels is None:
-            return [meta.name for meta in node_meta]
+        Nodes are read from process-wide cache, see [kubernetes]node_cache_ttl
+        option.
 
-        node_names = []
-        for meta in node_meta:
-            for k, v in meta.labels.items():
-                if k in node_labels and node_labels[k] == v:
-                    node_names.append(meta.name)
-        return node_names
+        :param node_labels: map, each key is a label name with some value;
+               node is selected if it has all the labels
+        """
+        return nodes.get_node_cache(self.v1_client).names(node_labels)
 
     @atomic.action_timer("kubernetes.get_daemonset")
     def get_daemonset(self, name, namespace, **kwargs):
-        return self.v1beta1_ext.read_namespaced_daemon_set(
+        return raw_api.read(
+            self.v1beta1_ext.read_namespaced_daemon_set,
             name,
-            namespace=namespace
+            namespace=namespace,
+            raw=kwargs.get("raw")
         )
 
     @atomic.action_timer("kubernetes.create_daemonset")
@@ -1230,6 +2151,10 @@ class Kubernetes(service.Service):
         if command is not None and isinstance(command, (list, tuple)):
             container_spec["command"] = list(command)
 
+        pod_spec = {"containers": [container_spec]}
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
         manifest = {
             "apiVersion": "extensions/v1beta1",
             "kind": "DaemonSet",
@@ -1244,51 +2169,75 @@ class Kubernetes(service.Service):
                             "app": app
                         }
                     },
-                    "spec": {
-                        "serviceAccountName": namespace,
-                        "containers": [container_spec]
-                    }
+                    "spec": pod_spec
                 }
             }
         }
 
-        if not self._spec.get("serviceaccounts"):
-            del manifest["spec"]["template"]["spec"]["serviceAccountName"]
-
+        self._set_owner_metadata(manifest)
         self.v1beta1_ext.create_namespaced_daemon_set(
             namespace=namespace,
             body=manifest
         )
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_daemonset_ready_pods"):
                 sleep_time = CONF.kubernetes.status_poll_interval
                 retries_total = CONF.kubernetes.status_total_retries
+                started_at = time.time()
 
+                nodes_total = None
+                if CONF.kubernetes.status_wait_method != "poll":
+                    nodes_total = len(self.list_filtered_nodes(node_labels))
+                    result, resp = _wait_for_event(
+                        name, self.v1beta1_ext.list_namespaced_daemon_set,
+                        predicate=lambda r: (
+                            r is not None and
+                            r.status.number_ready == nodes_total),
+                        namespace=namespace,
+                        label_selector=self._owner_selector())
+                    if result:
+                        _wait_done("DaemonSet", started_at,
+                                   satisfied_at=time.time())
+                        return name, app
+                    elif result is False:
+                        raise exceptions.TimeoutException(
+                            desired_status="%s pods" % nodes_total,
+                            resource_name=name,
+                            resource_type="DaemonSet",
+                            resource_id=(resp.metadata.uid if resp
+                                         else "<no id>"),
+                            resource_status="%s pods" % (
+                                resp.status.number_ready if resp else None),
+                            timeout=(retries_total * sleep_time))
+
+                timeout = _poll_timeout(started_at)
                 commonutils.interruptable_sleep(
                     CONF.kubernetes.start_prepoll_delay)
 
-                i = 0
-                while i < retries_total:
-                    resp = self.get_daemonset(name=name, namespace=namespace)
+                resp_id = current_status = None
+                for delay in poll.schedule("DaemonSet", timeout=timeout):
+                    resp = self.get_daemonset(
+                        name=name, namespace=namespace,
+                        raw=CONF.kubernetes.status_raw_reads)
                     resp_id = resp.metadata.uid
                     current_status = resp.status.number_ready
                     nodes_total = len(self.list_filtered_nodes(node_labels))
-                    if current_status != nodes_total:
-                        i += 1
-                        commonutils.interruptable_sleep(sleep_time)
-                    else:
+                    if current_status == nodes_total:
+                        _wait_done("DaemonSet", started_at,
+                                   satisfied_at=latency.ready_time(resp))
                         break
-                    if i == retries_total:
-                        raise exceptions.TimeoutException(
-                            desired_status="%s pods" % nodes_total,
-                            resource_name=name,
-                            resource_type="DaemonSet",
-                            resource_id=resp_id or "<no id>",
-                            resource_status="%s pods" % current_status,
-                            timeout=(retries_total * sleep_time))
+                    commonutils.interruptable_sleep(delay)
+                else:
+                    raise exceptions.TimeoutException(
+                        desired_status="%s pods" % nodes_total,
+                        resource_name=name,
+                        resource_type="DaemonSet",
+                        resource_id=resp_id or "<no id>",
+                        resource_status="%s pods" % current_status,
+                        timeout=(retries_total * sleep_time))
         return name, app
 
     @atomic.action_timer("kubernetes.check_daemonset_pods")
@@ -1319,15 +2268,19 @@ class Kubernetes(service.Service):
         self.v1beta1_ext.delete_namespaced_daemon_set(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
-        if status_wait:
-            with atomic.ActionTimer(
+        if termination_wait_required(status_wait):
+            with WaitTimer(
                     self,
                     "kubernetes.wait_daemonset_for_termination"):
                 wait_for_not_found(name,
                                    read_method=self.get_daemonset,
+                                   watch_selector=self._owner_selector(),
+                                   list_method=(
+                                       self.v1beta1_ext
+                                       .list_namespaced_daemon_set),
                                    resource_type="DaemonSet",
                                    namespace=namespace,
                                    daemonset=True)
@@ -1346,6 +2299,7 @@ class Kubernetes(service.Service):
             "volumeBindingMode": "WaitForFirstConsumer"
         }
 
+        self._set_owner_metadata(manifest)
         self.v1_storage.create_storage_class(body=manifest)
         return name
 
@@ -1353,13 +2307,13 @@ class Kubernetes(service.Service):
     def delete_local_storageclass(self, name):
         self.v1_storage.delete_storage_class(
             name,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
     @atomic.action_timer("kubernetes.create_local_persistent_volume")
     def create_local_pv(self, name, storage_class, size, volume_mode,
                         local_path, access_modes, node_affinity,
-                        status_wait=True):
+                        status_wait=True, labels=None):
         """Create local persistent volume and optionally wait for readiness.
         :param name: local PV name
         :param storage_class: storageClass created for local PV
@@ -1371,6 +2325,7 @@ class Kubernetes(service.Service):
         :param node_affinity: map represents PV nodeAffinity (see kubernetes
                docs)
         :param status_wait: wait for status if True
+        :param labels: additional labels of PV
         :return: name
         """
         name = name or self.generate_random_name()
@@ -1379,7 +2334,8 @@ class Kubernetes(service.Service):
             "kind": "PersistentVolume",
             "apiVersion": "v1",
             "metadata": {
-                "name": name
+                "name": name,
+                "labels": labels or {}
             },
             "spec": {
                 "capacity": {
@@ -1396,22 +2352,27 @@ class Kubernetes(service.Service):
             }
         }
 
+        self._set_owner_metadata(manifest)
         self.v1_client.create_persistent_volume(body=manifest)
 
         if status_wait:
-            with atomic.ActionTimer(
+            with WaitTimer(
                     self,
                     "kubernetes.wait_for_local_persistent_volume_become_ready"
             ):
                 wait_for_status(name,
                                 status=("Available", "Released"),
                                 read_method=self.get_local_pv,
+                                list_method=(
+                                    self.v1_client.list_persistent_volume),
+                                watch_selector=self._owner_selector(),
                                 resource_type="Persistent Volume")
         return name
 
     @atomic.action_timer("kubernetes.get_local_persistent_volume")
-    def get_local_pv(self, name):
-        return self.v1_client.read_persistent_volume(name)
+    def get_local_pv(self, name, raw=False):
+        return raw_api.read(self.v1_client.read_persistent_volume, name,
+                            raw=raw)
 
     @atomic.action_timer("kubernetes.delete_local_persistent_volume")
     def delete_local_pv(self, name, status_wait=True):
@@ -1421,21 +2382,38 @@ class Kubernetes(service.Service):
         """
         self.v1_client.delete_persistent_volume(
             name=name,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
-        if status_wait:
-            with atomic.ActionTimer(
+        if termination_wait_required(status_wait):
+            with WaitTimer(
                 self,
                 "kubernetes.wait_for_local_persistent_volume_termination"
             ):
                 wait_for_not_found(name,
                                    read_method=self.get_local_pv,
+                                   list_method=(
+                                       self.v1_client.list_persistent_volume),
+                                   watch_selector=self._owner_selector(),
                                    resource_type="Persistent Volume")
 
+    @atomic.action_timer("kubernetes.recycle_local_persistent_volume")
+    def recycle_local_pv(self, name):
+        """Make Released local PV Available for new claims again.
+
+        Claim reference left by deleted PVC is removed; data on the volume
+        is kept as is.
+
+        :param name: local PV name
+        """
+        self.v1_client.patch_persistent_volume(
+            name,
+            body={"spec": {"claimRef": None}}
+        )
+
     @atomic.action_timer("kubernetes.create_local_persistent_volume_claim")
     def create_local_pvc(self, name, namespace, storage_class, access_modes,
-                         size):
+                         size, selector=None):
         """Create local persistent volume claim.
         :param name: local PVC name
         :param namespace: local PVC namespace
@@ -1443,6 +2421,8 @@ class Kubernetes(service.Service):
         :param access_modes: array of strings - access modes (see kubernetes
                docs)
         :param size: PV size (see kubernetes docs)
+        :param selector: labels of PV to bind the claim to, any PV of the
+               storageClass if None
         :return:
         """
         manifest = {
@@ -1461,16 +2441,20 @@ class Kubernetes(service.Service):
                 "storageClassName": storage_class
             }
         }
+        if selector:
+            manifest["spec"]["selector"] = {"matchLabels": selector}
 
+        self._set_owner_metadata(manifest)
         self.v1_client.create_namespaced_persistent_volume_claim(
             namespace=namespace,
             body=manifest
         )
 
     @atomic.action_timer("kubernetes.get_local_pvc")
-    def get_local_pvc(self, name, namespace):
-        return self.v1_client.read_namespaced_persistent_volume_claim(
-            name, namespace=namespace)
+    def get_local_pvc(self, name, namespace, raw=False):
+        return raw_api.read(
+            self.v1_client.read_namespaced_persistent_volume_claim,
+            name, namespace=namespace, raw=raw)
 
     @atomic.action_timer("kubernetes.delete_local_pvc")
     def delete_local_pvc(self, name, namespace, status_wait=True):
@@ -1482,34 +2466,33 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_persistent_volume_claim(
             name=name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
 
-        if status_wait:
-            with atomic.ActionTimer(
+        if termination_wait_required(status_wait):
+            with WaitTimer(
                 self,
                 "kubernetes.wait_for_local_persistent_volume_claim_termination"
             ):
-                wait_for_not_found(name,
-                                   namespace=namespace,
-                                   read_method=self.get_local_pvc,
-                                   resource_type="Persistent Volume Claim")
+                core = self.v1_client
+                wait_for_not_found(
+                    name,
+                    namespace=namespace,
+                    read_method=self.get_local_pvc,
+                    watch_selector=self._owner_selector(),
+                    list_method=core.list_namespaced_persistent_volume_claim,
+                    resource_type="Persistent Volume Claim")
 
     @atomic.action_timer("kubernetes.create_configmap")
-    def create_configmap(self, name, namespace, data):
+    def create_configmap(self, name, namespace, data, labels=None):
         """Create configMap resource.
         :param name: configMap resource name
         :param namespace: configMap namespace
         :param data: configMap data
+        :param labels: configMap labels
         """
-        manifest = {
-            "apiVersion": "v1",
-            "kind": "ConfigMap",
-            "metadata": {
-                "name": name
-            },
-            "data": data
-        }
+        manifest = self._render_manifest(
+            "ConfigMap", {"name": name, "data": data, "labels": labels})
         self.v1_client.create_namespaced_config_map(namespace=namespace,
                                                     body=manifest)
 
@@ -1522,5 +2505,5 @@ class Kubernetes(service.Service):
         self.v1_client.delete_namespaced_config_map(
             name,
             namespace=namespace,
-            body=k8s_config.V1DeleteOptions()
+            body=delete_options()
         )
@@ -0,0 +1,428 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import collections
+import time
+
+from rally.common import cfg
+from rally.common import logging
+from rally import exceptions
+from rally.task import service
+
+from rally_plugins.services.kube import clients
+from rally_plugins.services.kube import kube
+from rally_plugins.services.kube import poll
+from rally_plugins.services.kube import ratelimit
+from rally_plugins.services.kube import retries
+
+try:
+    from kubernetes_asyncio import client as k8s_async
+    from kubernetes_asyncio.client import rest as k8s_async_rest
+except ImportError:
+    k8s_async = None
+    k8s_async_rest = None
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+
+def _phase(*phases):
+    return lambda r: r.status.phase in phases
+
+
+def _replicas_ready(r):
+    return (r.status.ready_replicas or 0) == r.spec.replicas
+
+
+def _daemonset_ready(r):
+    return (bool(r.status.desired_number_scheduled) and
+            r.status.number_ready == r.status.desired_number_scheduled)
+
+
+def _job_succeeded(r):
+    return (r.status.succeeded or 0) >= (r.spec.completions or 1)
+
+
+ResourceKind = collections.namedtuple(
+    "ResourceKind", ["api", "suffix", "namespaced", "action", "ready"])
+
+# Resource kinds supported by AsyncKubernetes. Api methods are resolved as
+# create_<suffix>, read_<suffix>, delete_<suffix>; ready is a predicate of
+# resource readiness or None if resource is ready once created.
+RESOURCES = {
+    "Namespace": ResourceKind("CoreV1Api", "namespace", False,
+                              "namespace", _phase("Active")),
+    "Pod": ResourceKind("CoreV1Api", "namespaced_pod", True,
+                        "pod", _phase("Running")),
+    "Service": ResourceKind("CoreV1Api", "namespaced_service", True,
+                            "service", None),
+    "ConfigMap": ResourceKind("CoreV1Api", "namespaced_config_map", True,
+                              "configmap", None),
+    "Secret": ResourceKind("CoreV1Api", "namespaced_secret", True,
+                           "secret", None),
+    "ServiceAccount": ResourceKind("CoreV1Api",
+                                   "namespaced_service_account", True,
+                                   "serviceaccount", None),
+    "PersistentVolume": ResourceKind("CoreV1Api", "persistent_volume",
+                                     False, "pv",
+                                     _phase("Available", "Bound")),
+    "PersistentVolumeClaim": ResourceKind(
+        "CoreV1Api", "namespaced_persistent_volume_claim", True,
+        "pvc", _phase("Bound")),
+    "ReplicationController": ResourceKind(
+        "CoreV1Api", "namespaced_replication_controller", True,
+        "rc", _replicas_ready),
+    "ReplicaSet": ResourceKind("AppsV1Api", "namespaced_replica_set", True,
+                               "replicaset", _replicas_ready),
+    "Deployment": ResourceKind("AppsV1Api", "namespaced_deployment", True,
+                               "deployment", _replicas_ready),
+    "StatefulSet": ResourceKind("AppsV1Api", "namespaced_stateful_set", True,
+                                "statefulset", _replicas_ready),
+    "DaemonSet": ResourceKind("AppsV1Api", "namespaced_daemon_set", True,
+                              "daemonset", _daemonset_ready),
+    "Job": ResourceKind("BatchV1Api", "namespaced_job", True,
+                        "job", _job_succeeded)
+}
+
+
+class _AsyncActionTimer(object):
+    """Atomic action timer, which is safe for concurrent coroutines.
+
+    rally.task.atomic.ActionTimer nests atomic action into the last
+    unfinished one, so atomic actions of concurrent coroutines get mixed.
+    This timer appends finished atomic action to the given parent instead.
+    """
+
+    def __init__(self, root, name):
+        self._root = root
+        self.atomic_action = {"name": name, "children": []}
+
+    async def __aenter__(self):
+        self.atomic_action["started_at"] = time.time()
+        return self.atomic_action
+
+    async def __aexit__(self, type_, value, tb):
+        self.atomic_action["finished_at"] = time.time()
+        if type_:
+            self.atomic_action["failed"] = True
+        self._root.append(self.atomic_action)
+
+
+async def _throttle(delay, inst=None, action="kubernetes.throttled"):
+    """Sleep the throttling delay without blocking the event loop.
+
+    Unlike ratelimit.throttle, action is added to the root atomic actions of
+    the instance, since actions of concurrent coroutines aren't nested.
+
+    :param delay: time in seconds to sleep
+    :param inst: object with _atomic_actions attribute (e.g. service
+           instance) to report action to, or None
+    :param action: atomic action name
+    """
+    if delay <= 0:
+        return
+    if inst is None:
+        await asyncio.sleep(delay)
+        return
+    async with _AsyncActionTimer(inst._atomic_actions, action):
+        await asyncio.sleep(delay)
+
+
+if k8s_async is not None:
+
+    class RateLimitedApiClient(k8s_async.ApiClient):
+        """Asyncio api client, which limits rate of its requests.
+
+        Requests are delayed and retried the same way requests of
+        clients.RateLimitedApiClient are: according to the limiter budgets,
+        after Retry-After delay of 429 Too Many Requests and after
+        exponential backoff of transient apiserver errors.
+
+        :param configuration: kubernetes_asyncio client configuration
+        :param limiter: ratelimit.RateLimiter to delay requests with
+        :param atomic_inst: object with _atomic_actions attribute (e.g.
+               service instance) to report time requests are held to
+        """
+
+        def __init__(self, configuration, limiter, atomic_inst=None):
+            super(RateLimitedApiClient, self).__init__(
+                configuration=configuration)
+            self.limiter = limiter
+            self.atomic_inst = atomic_inst
+
+        async def _resolve_retried(self, method, url, ex, token, kwargs):
+            if method == "DELETE" and ex.status == 404:
+                return retries.ErrorResponse(ex)
+            if method == "POST" and ex.status == 409 and token is not None:
+                resp = await super(RateLimitedApiClient, self).request(
+                    "GET",
+                    "%s/%s" % (url, kwargs["body"]["metadata"]["name"]),
+                    headers=kwargs.get("headers"),
+                    _request_timeout=kwargs.get("_request_timeout"))
+                if retries.has_token(resp, token):
+                    return resp
+            return None
+
+        async def request(self, method, url, *args, **kwargs):
+            token = None
+            if method == "POST" and CONF.kubernetes.api_retries:
+                token = retries.set_idempotency_token(kwargs.get("body"))
+            throttled = failed = 0
+            while True:
+                await _throttle(self.limiter.reserve(method),
+                                self.atomic_inst)
+                try:
+                    return await super(RateLimitedApiClient, self).request(
+                        method, url, *args, **kwargs)
+                except k8s_async_rest.ApiException as ex:
+                    if (ex.status == 429 and
+                            throttled < CONF.kubernetes.api_throttle_retries):
+                        throttled += 1
+                        self.limiter.pause(ratelimit.retry_after(ex))
+                        continue
+                    if failed:
+                        resp = await self._resolve_retried(method, url, ex,
+                                                           token, kwargs)
+                        if resp is not None:
+                            return resp
+                    if (ex.status not in retries.BACKOFF_STATUSES or
+                            failed >= CONF.kubernetes.api_retries or
+                            (method == "POST" and token is None)):
+                        raise
+                    await _throttle(retries.backoff(failed),
+                                    self.atomic_inst,
+                                    action="kubernetes.retry_backoff")
+                    failed += 1
+
+
+class AsyncKubernetes(service.Service):
+    """A wrapper for asyncio kubernetes client.
+
+    All methods are coroutines, so one event loop could keep any number of
+    requests in flight. Service should be used as async context manager
+    within the event loop it is used in:
+
+        async with AsyncKubernetes(spec) as client:
+            await client.create("Pod", manifest=manifest,
+                                namespace=namespace)
+    """
+
+    def __init__(self, spec, name_generator=None, atomic_inst=None,
+                 labels=None, annotations=None):
+        if k8s_async is None:
+            raise exceptions.RallyException(
+                message="kubernetes_asyncio library is required for asyncio "
+                        "Kubernetes service, install rally-plugins[asyncio]")
+        super(AsyncKubernetes, self).__init__(None,
+                                              name_generator=name_generator,
+                                              atomic_inst=atomic_inst)
+        self._spec = spec
+        self._labels = labels
+        self._annotations = annotations
+        self.api = None
+        self._apis = {}
+
+    async def __aenter__(self):
+        config = clients.make_configuration(
+            self._spec, config=k8s_async.Configuration())
+        # NOTE: limiter is shared with api client of the same spec, so
+        #   sync and asyncio services keep the same requests rate budget.
+        self.api = RateLimitedApiClient(
+            configuration=config,
+            limiter=clients.get_api_client(self._spec).limiter,
+            atomic_inst=self)
+        return self
+
+    async def __aexit__(self, type_, value, tb):
+        await self.api.close()
+        self.api = None
+        self._apis = {}
+
+    def atomic(self, name, parent=None):
+        """Time atomic action of a coroutine.
+
+        :param name: atomic action name
+        :param parent: parent atomic action dict, defaults to the root
+        """
+        root = (self._atomic_actions if parent is None
+                else parent["children"])
+        return _AsyncActionTimer(root, name)
+
+    def _method(self, kind, action):
+        resource = RESOURCES[kind]
+        if resource.api not in self._apis:
+            self._apis[resource.api] = getattr(k8s_async, resource.api)(
+                self.api)
+        return getattr(self._apis[resource.api],
+                       "%s_%s" % (action, resource.suffix))
+
+    @staticmethod
+    def _ns_kwargs(kind, namespace):
+        return {"namespace": namespace} if RESOURCES[kind].namespaced else {}
+
+    async def get(self, kind, name, namespace=None):
+        """Read resource.
+
+        :param kind: resource kind, one of RESOURCES keys
+        :param name: resource name
+        :param namespace: resource namespace for namespaced kinds
+        """
+        async with self.atomic("kubernetes.get_%s" % RESOURCES[kind].action):
+            return await self._method(kind, "read")(
+                name, **self._ns_kwargs(kind, namespace))
+
+    async def create(self, kind, manifest, namespace=None, status_wait=True):
+        """Create resource and optionally wait until it won't be ready.
+
+        :param kind: resource kind, one of RESOURCES keys
+        :param manifest: resource manifest; random name is generated if
+               metadata.name is not set
+        :param namespace: resource namespace for namespaced kinds
+        :param status_wait: wait resource to become ready
+        :returns: resource name
+        """
+        metadata = manifest.setdefault("metadata", {})
+        metadata.setdefault("name", self.generate_random_name())
+        name = metadata["name"]
+        kube.set_owner_metadata(manifest, labels=self._labels,
+                                annotations=self._annotations)
+
+        action = RESOURCES[kind].action
+        async with self.atomic("kubernetes.create_%s" % action) as parent:
+            await self._method(kind, "create")(
+                body=manifest, **self._ns_kwargs(kind, namespace))
+            if status_wait and RESOURCES[kind].ready is not None:
+                async with self.atomic("kubernetes.wait_for_%s_ready"
+                                       % action, parent=parent):
+                    await self.wait_for_ready(kind, name=name,
+                                              namespace=namespace)
+        return name
+
+    async def delete(self, kind, name, namespace=None, status_wait=True):
+        """Delete resource and optionally wait its full termination.
+
+        :param kind: resource kind, one of RESOURCES keys
+        :param name: resource name
+        :param namespace: resource namespace for namespaced kinds
+        :param status_wait: wait resource termination
+        """
+        action = RESOURCES[kind].action
+        async with self.atomic("kubernetes.delete_%s" % action) as parent:
+            await self._method(kind, "delete")(
+                name, body=kube.delete_options(),
+                **self._ns_kwargs(kind, namespace))
+            # NOTE: in deferred termination mode termination is verified by
+            #   kubernetes.reaper context at the end of the task.
+            if status_wait and not CONF.kubernetes.deferred_termination:
+                async with self.atomic("kubernetes.wait_%s_termination"
+                                       % action, parent=parent):
+                    await self.wait_for_not_found(kind, name=name,
+                                                  namespace=namespace)
+
+    async def wait_for_ready(self, kind, name, namespace=None):
+        """Wait until resource won't satisfy its kind readiness predicate.
+
+        :param kind: resource kind, one of RESOURCES keys
+        :param name: resource name
+        :param namespace: resource namespace for namespaced kinds
+        """
+        ready = RESOURCES[kind].ready
+        read = self._method(kind, "read")
+        started_at = time.time()
+        resp = None
+        for delay in poll.schedule(kind):
+            resp = await read(name, **self._ns_kwargs(kind, namespace))
+            if ready(resp):
+                poll.observe(kind, time.time() - started_at)
+                return resp
+            await asyncio.sleep(delay)
+        raise exceptions.TimeoutException(
+            desired_status="ready",
+            resource_name=name,
+            resource_type=kind,
+            resource_id=resp.metadata.uid if resp else "<no id>",
+            resource_status=resp.status if resp else None,
+            timeout=(CONF.kubernetes.status_total_retries *
+                     CONF.kubernetes.status_poll_interval))
+
+    async def wait_for_not_found(self, kind, name, namespace=None):
+        """Wait until resource won't be found.
+
+        :param kind: resource kind, one of RESOURCES keys
+        :param name: resource name
+        :param namespace: resource namespace for namespaced kinds
+        """
+        read = self._method(kind, "read")
+        started_at = time.time()
+        resp = None
+        for delay in poll.schedule("%s termination" % kind):
+            try:
+                resp = await read(name, **self._ns_kwargs(kind, namespace))
+            except k8s_async_rest.ApiException as ex:
+                if ex.status == 404:
+                    poll.observe("%s termination" % kind,
+                                 time.time() - started_at)
+                    return
+                raise
+            await asyncio.sleep(delay)
+        raise exceptions.TimeoutException(
+            desired_status="Terminated",
+            resource_name=name,
+            resource_type=kind,
+            resource_id=resp.metadata.uid if resp else "<no id>",
+            resource_status=resp.status if resp else None,
+            timeout=(CONF.kubernetes.status_total_retries *
+                     CONF.kubernetes.status_poll_interval))
+
+    async def create_pod(self, image, namespace,
+                         image_pull_policy="IfNotPresent", command=None,
+                         name=None, status_wait=True):
+        """Create pod and wait until status phase won't be Running.
+
+        :param image: pod's image
+        :param namespace: chosen namespace to create pod into
+        :param image_pull_policy: override default image pull policy
+        :param command: array of strings which represents container command
+        :param name: pod's custom name
+        :param status_wait: wait pod for Running status
+        """
+        name = name or self.generate_random_name()
+        container_spec = {
+            "name": name,
+            "image": image,
+            "imagePullPolicy": image_pull_policy
+        }
+        if command is not None and isinstance(command, (list, tuple)):
+            container_spec["command"] = list(command)
+
+        pod_spec = {"containers": [container_spec]}
+        if self._spec.get("serviceaccounts"):
+            pod_spec["serviceAccountName"] = namespace
+
+        manifest = {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "name": name,
+                "labels": {
+                    "role": name
+                }
+            },
+            "spec": pod_spec
+        }
+
+        return await self.create("Pod", manifest=manifest,
+                                 namespace=namespace,
+                                 status_wait=status_wait)
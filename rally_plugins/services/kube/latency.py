@@ -0,0 +1,163 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+
+RFC3339_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+RFC3339_MICRO_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def to_time(dt):
+    """Convert timezone-aware datetime from Kubernetes API to unix time.
+
+    :param dt: datetime or RFC 3339 string (timestamps of raw responses),
+           optionally with fractional seconds (MicroTime fields, e.g.
+           event time of events)
+    """
+    if dt is None:
+        return None
+    if isinstance(dt, str):
+        dt = datetime.datetime.strptime(
+            dt, RFC3339_MICRO_FORMAT if "." in dt else RFC3339_FORMAT
+        ).replace(tzinfo=datetime.timezone.utc)
+    return dt.timestamp()
+
+
+def _condition_time(conditions, type_):
+    for c in conditions or []:
+        if c.type == type_ and c.status == "True":
+            return to_time(c.last_transition_time)
+    return None
+
+
+def _containers_time(pod, state, attr):
+    times = []
+    for s in pod.status.container_statuses or []:
+        for st in (s.state, s.last_state):
+            value = getattr(st, state, None) if st else None
+            if value is not None and getattr(value, attr, None):
+                times.append(to_time(getattr(value, attr)))
+    return max(times) if times else None
+
+
+def pod_milestones(pod):
+    """Return ordered list of (milestone, time) of pod startup.
+
+    :param pod: V1Pod object
+    """
+    conditions = pod.status.conditions
+    started = (_containers_time(pod, "running", "started_at") or
+               _containers_time(pod, "terminated", "started_at"))
+    finished = _containers_time(pod, "terminated", "finished_at")
+    milestones = [
+        ("scheduling", _condition_time(conditions, "PodScheduled")),
+        ("initialization", _condition_time(conditions, "Initialized")),
+        ("containers start", started)
+    ]
+    if finished is not None:
+        milestones.append(("containers run", finished))
+    else:
+        milestones.append(("readiness",
+                           _condition_time(conditions, "Ready")))
+    return milestones
+
+
+def ready_time(resource, kind=None):
+    """Return server-side time the resource got ready at, if it's known.
+
+    Pods are considered ready, when all containers are started, namespaces,
+    when they are created, deployments, when rollout of new replica set is
+    complete, other resources, when Ready or Complete condition is set.
+    ReplicaSets, StatefulSets and DaemonSets don't have such timestamps.
+
+    :param resource: Kubernetes object or None
+    :param kind: resource kind, if it can't be told by status
+    """
+    if resource is None or resource.status is None:
+        return None
+    if kind == "Namespace":
+        return to_time(resource.metadata.creation_timestamp)
+    if getattr(resource.status, "container_statuses", None):
+        return _containers_time(resource, "running", "started_at")
+    conditions = getattr(resource.status, "conditions", None)
+    for type_ in ("Ready", "Complete"):
+        at = _condition_time(conditions, type_)
+        if at is not None:
+            return at
+    for c in conditions or []:
+        if (c.type == "Progressing" and c.status == "True"
+                and c.reason == "NewReplicaSetAvailable"):
+            return to_time(c.last_update_time)
+    return None
+
+
+def controller_of(obj):
+    """Return ownerReference of the object controller or None.
+
+    :param obj: Kubernetes object
+    """
+    for ref in obj.metadata.owner_references or []:
+        if ref.controller:
+            return ref
+    return None
+
+
+def critical_pod(pods):
+    """Return pod, which got ready (or finished) the last.
+
+    :param pods: list of V1Pod objects
+    """
+    def done_at(pod):
+        times = [t for _, t in pod_milestones(pod) if t is not None]
+        return max(times) if times else 0
+    return max(pods, key=done_at) if pods else None
+
+
+def breakdown(chain, pod, finished_at=None, finished_phase=None):
+    """Decompose resource startup into ordered list of (phase, duration).
+
+    Phases are built from server-side timestamps only, so they don't include
+    client polling quantization (API timestamps have one second precision).
+    The first phases are reactions of controllers on ownerReferences chain,
+    e.g. Deployment -> ReplicaSet -> Pod, measured by creationTimestamp of
+    each owned object, then startup phases of the critical pod.
+
+    :param chain: list of objects from the top owner to the direct owner of
+           the pod, e.g. [deployment, replicaset]
+    :param pod: critical pod (see critical_pod) or None
+    :param finished_at: datetime, when the top owner is done, e.g. job
+           completionTime
+    :param finished_phase: name of the last phase, which ends at finished_at
+    """
+    milestones = [("created",
+                   to_time(chain[0].metadata.creation_timestamp))]
+    objects = list(chain[1:]) + ([pod] if pod is not None else [])
+    for obj in objects:
+        owner = controller_of(obj)
+        milestones.append(("%s controller" % (owner.kind if owner else "-"),
+                           to_time(obj.metadata.creation_timestamp)))
+    if pod is not None:
+        milestones.extend(pod_milestones(pod))
+    if finished_at is not None:
+        milestones.append((finished_phase, to_time(finished_at)))
+
+    phases = []
+    previous = None
+    for name, ts in milestones:
+        if ts is None:
+            continue
+        if previous is not None:
+            phases.append((name, max(0.0, ts - previous)))
+        previous = ts
+    return phases
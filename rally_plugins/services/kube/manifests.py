@@ -0,0 +1,196 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import re
+import threading
+
+_BUILDERS = {}
+_TEMPLATES = {}
+_TEMPLATES_LOCK = threading.Lock()
+
+_FIELD_MARK = "@@rally-plugins-field:%s@@"
+_FIELD_RE = re.compile(r'"@@rally-plugins-field:(\w+)@@"')
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class Field(object):
+    """Placeholder of variable value in manifest skeleton."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Serialized(bytes):
+    """Manifest serialized to JSON, which is sent by api client as is.
+
+    Keeps name and idempotency token of the object, so create requests
+    with serialized body could be retried the same way as ones with dict
+    body.
+    """
+
+    def __new__(cls, data, name=None, token=None):
+        obj = super(Serialized, cls).__new__(cls, data)
+        obj.name = name
+        obj.token = token
+        return obj
+
+
+class _Shared(object):
+    """Part of skeleton without fields shared between filled manifests."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Template(object):
+    """Manifest pre-built from skeleton with Field placeholders.
+
+    Skeleton is never changed: fill builds only dicts and lists on the way
+    from the root to placeholders and shares the rest of the skeleton, and
+    dumps joins JSON chunks of the skeleton, serialized once, with JSON of
+    the field values.
+    """
+
+    def __init__(self, skeleton):
+        self._root = self._prepare(skeleton)[0]
+        chunks = _FIELD_RE.split(json.dumps(
+            skeleton, separators=(",", ":"),
+            default=lambda f: _FIELD_MARK % f.name))
+        self._head = chunks[0]
+        self._tail = list(zip(chunks[1::2], chunks[2::2]))
+
+    @classmethod
+    def _prepare(cls, node):
+        """Wrap parts of the node without fields and check for fields."""
+        if isinstance(node, Field):
+            return node, True
+        if isinstance(node, dict):
+            items = [(k,) + cls._prepare(v) for k, v in node.items()]
+            if any(has_fields for _k, _v, has_fields in items):
+                return {k: v for k, v, _f in items}, True
+        elif isinstance(node, list):
+            items = [cls._prepare(v) for v in node]
+            if any(has_fields for _v, has_fields in items):
+                return [v for v, _f in items], True
+        return _Shared(node), False
+
+    @classmethod
+    def _fill(cls, node, values):
+        if isinstance(node, _Shared):
+            return node.value
+        if isinstance(node, Field):
+            return values[node.name]
+        if isinstance(node, dict):
+            return {k: cls._fill(v, values) for k, v in node.items()}
+        return [cls._fill(v, values) for v in node]
+
+    def fill(self, **values):
+        """Make manifest dict with given values of fields.
+
+        Parts of the skeleton without fields are shared between manifests,
+        so the result should not be modified.
+        """
+        return self._fill(self._root, values)
+
+    def dumps(self, **values):
+        """Make manifest JSON bytes with given values of fields."""
+        encode = _ENCODER.encode
+        parts = [self._head]
+        for field, chunk in self._tail:
+            parts.append(encode(values[field]))
+            parts.append(chunk)
+        return "".join(parts).encode("utf8")
+
+
+def register(kind):
+    """Register skeleton builder of the kind manifest.
+
+    Builder is called with template options as kwargs and returns skeleton
+    with Field placeholders.
+
+    :param kind: object kind
+    """
+    def decorator(builder):
+        _BUILDERS[kind] = builder
+        return builder
+    return decorator
+
+
+def get_template(kind, **options):
+    """Get template of the kind manifest built once per options.
+
+    :param kind: object kind
+    :param options: options of registered skeleton builder
+    """
+    key = (kind, tuple(sorted(options.items())))
+    template = _TEMPLATES.get(key)
+    if template is None:
+        with _TEMPLATES_LOCK:
+            template = _TEMPLATES.get(key)
+            if template is None:
+                template = Template(_BUILDERS[kind](**options))
+                _TEMPLATES[key] = template
+    return template
+
+
+@register("Pod")
+def pod(service_account=False, command=False, volume_mounts=False,
+        ports=False, volumes=False):
+    container = {
+        "name": Field("name"),
+        "image": Field("image"),
+        "imagePullPolicy": Field("image_pull_policy")
+    }
+    if command:
+        container["command"] = Field("command")
+    if volume_mounts:
+        container["volumeMounts"] = Field("volume_mounts")
+    if ports:
+        container["ports"] = Field("ports")
+    manifest = {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": Field("name"),
+            "labels": Field("labels"),
+            "annotations": Field("annotations")
+        },
+        "spec": {
+            "containers": [container]
+        }
+    }
+    if service_account:
+        manifest["spec"]["serviceAccountName"] = Field("service_account")
+    if volumes:
+        manifest["spec"]["volumes"] = Field("volumes")
+    return manifest
+
+
+@register("ConfigMap")
+def configmap():
+    return {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {
+            "name": Field("name"),
+            "labels": Field("labels"),
+            "annotations": Field("annotations")
+        },
+        "data": Field("data")
+    }
@@ -0,0 +1,98 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import threading
+import time
+
+from rally.common import cfg
+
+from rally_plugins.services.kube import clients
+
+CONF = cfg.CONF
+
+_NODE_CACHES = {}
+_NODE_CACHES_LOCK = threading.Lock()
+
+
+def label_selector(node_labels):
+    """Make label selector, which matches all labels of the map.
+
+    :param node_labels: map, each key is a label name with some value
+    """
+    return ",".join("%s=%s" % (k, v) for k, v in sorted(node_labels.items()))
+
+
+def get_node_cache(core_api):
+    """Get process-wide node cache for Kubernetes API.
+
+    :param core_api: CoreV1Api instance
+    """
+    core_api = clients.unbound_api(core_api)
+    key = id(core_api.api_client)
+    with _NODE_CACHES_LOCK:
+        if key not in _NODE_CACHES:
+            _NODE_CACHES[key] = NodeCache(core_api.list_node)
+        return _NODE_CACHES[key]
+
+
+class NodeCache(object):
+    """Node names with label index, refreshed each node_cache_ttl seconds."""
+
+    def __init__(self, list_method):
+        """Initialize node cache.
+
+        :param list_method: CoreV1Api.list_node method
+        """
+        self._list_method = list_method
+        self._names = []
+        self._index = {}
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        index = collections.defaultdict(set)
+        names = []
+        for node in self._list_method().items:
+            names.append(node.metadata.name)
+            for label in (node.metadata.labels or {}).items():
+                index[label].add(node.metadata.name)
+        self._names = names
+        self._index = dict(index)
+        self._fetched_at = time.time()
+
+    def invalidate(self):
+        with self._lock:
+            self._fetched_at = None
+
+    def names(self, node_labels=None):
+        """Return names of nodes, which have all the labels.
+
+        :param node_labels: map, each key is a label name with some value
+        """
+        ttl = CONF.kubernetes.node_cache_ttl
+        if not ttl:
+            selector = label_selector(node_labels) if node_labels else None
+            return [node.metadata.name for node in
+                    self._list_method(label_selector=selector).items]
+
+        with self._lock:
+            if (self._fetched_at is None
+                    or time.time() - self._fetched_at > ttl):
+                self._refresh()
+            if not node_labels:
+                return list(self._names)
+            matched = set.intersection(*[self._index.get(label, set())
+                                         for label in node_labels.items()])
+            return [name for name in self._names if name in matched]
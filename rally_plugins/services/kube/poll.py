@@ -0,0 +1,121 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import random
+import threading
+
+from rally.common import cfg
+
+CONF = cfg.CONF
+
+# Minimal number of observed waits to build learned schedule from.
+LEARNED_MIN_SAMPLES = 3
+# Number of the latest observed waits kept per resource kind.
+LEARNED_MAX_SAMPLES = 100
+
+_OBSERVED = collections.defaultdict(
+    lambda: collections.deque(maxlen=LEARNED_MAX_SAMPLES))
+_OBSERVED_LOCK = threading.Lock()
+
+
+def observe(kind, duration):
+    """Save observed wait duration for learned poll schedule.
+
+    :param kind: resource kind (and wait type) the wait was done for
+    :param duration: time in seconds the resource got desired state in
+    """
+    if kind is None:
+        return
+    with _OBSERVED_LOCK:
+        _OBSERVED[kind].append(duration)
+
+
+def _median(kind):
+    with _OBSERVED_LOCK:
+        samples = sorted(_OBSERVED.get(kind, ()))
+    if len(samples) < LEARNED_MIN_SAMPLES:
+        return None
+    middle = len(samples) // 2
+    if len(samples) % 2:
+        return samples[middle]
+    return (samples[middle - 1] + samples[middle]) / 2.0
+
+
+def _constant(kind):
+    while True:
+        yield CONF.kubernetes.status_poll_interval
+
+
+def _fast_first(kind):
+    delay = CONF.kubernetes.status_poll_min_interval
+    while True:
+        yield min(delay, CONF.kubernetes.status_poll_interval)
+        delay *= 2
+
+
+def _backoff(kind):
+    delay = CONF.kubernetes.status_poll_min_interval
+    while True:
+        delay = min(delay, CONF.kubernetes.status_poll_interval)
+        # NOTE: "equal jitter" keeps delays growing, but spreads reads of
+        #   concurrent iterations started at the same time.
+        yield delay / 2.0 + random.uniform(0, delay / 2.0)
+        delay *= 2
+
+
+def _learned(kind):
+    median = _median(kind)
+    if median is not None:
+        # NOTE: sleep until most of resources of the kind are usually ready,
+        #   then poll fast, since resource is expected to be ready soon.
+        yield median * 0.8
+    for delay in _fast_first(kind):
+        yield delay
+
+
+SCHEDULES = {
+    "constant": _constant,
+    "fast_first": _fast_first,
+    "backoff": _backoff,
+    "learned": _learned
+}
+
+
+def schedule(kind=None, timeout=None):
+    """Return sleep times between resource status reads.
+
+    Schedule is chosen by [kubernetes]status_poll_strategy option. Total sum
+    of sleep times is limited by status_total_retries * status_poll_interval,
+    so all strategies have the same timeout.
+
+    :param kind: resource kind (and wait type) to wait for, used by learned
+           strategy
+    :param timeout: limit of total sum of sleep times to use instead of the
+           configured one, e.g. the rest of the wait timeout
+    """
+    if timeout is None:
+        timeout = (CONF.kubernetes.status_total_retries *
+                   CONF.kubernetes.status_poll_interval)
+    strategy = SCHEDULES[CONF.kubernetes.status_poll_strategy]
+
+    total = 0
+    for delay in strategy(kind):
+        # NOTE: compare with precision to not make an extra read because of
+        #   float sum error.
+        if timeout - total < 1e-6:
+            return
+        delay = min(delay, timeout - total)
+        total += delay
+        yield delay
@@ -0,0 +1,120 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+
+from rally.common import cfg
+from rally.task import atomic
+
+CONF = cfg.CONF
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket.
+
+    Tokens could be borrowed in advance, so each caller gets the time to
+    wait for its token and callers are served in order of reservation.
+    """
+
+    def __init__(self, qps, burst):
+        self.qps = qps
+        self.burst = max(1, burst or 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return time in seconds to wait for it."""
+        if not self.qps:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._updated) * self.qps)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.qps
+
+
+class RateLimiter(object):
+    """Requests rate limiter with separate read and mutating budgets."""
+
+    def __init__(self, read_qps=None, read_burst=None, mutating_qps=None,
+                 mutating_burst=None):
+        self._read = TokenBucket(read_qps, read_burst)
+        self._mutating = TokenBucket(mutating_qps, mutating_burst)
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_conf(cls):
+        return cls(read_qps=CONF.kubernetes.api_read_qps,
+                   read_burst=CONF.kubernetes.api_read_burst,
+                   mutating_qps=CONF.kubernetes.api_mutating_qps,
+                   mutating_burst=CONF.kubernetes.api_mutating_burst)
+
+    def reserve(self, method):
+        """Reserve request and return time in seconds to wait before it.
+
+        :param method: HTTP method of request
+        """
+        bucket = self._read if method in READ_METHODS else self._mutating
+        delay = bucket.reserve()
+        with self._lock:
+            paused_until = self._paused_until
+        return max(delay, paused_until - time.monotonic())
+
+    def pause(self, seconds):
+        """Hold all requests for given time, e.g. on Retry-After.
+
+        :param seconds: time in seconds to hold requests for
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until,
+                                     time.monotonic() + seconds)
+
+
+def retry_after(ex, default=1.0):
+    """Get Retry-After delay of API error response.
+
+    :param ex: kubernetes.client.rest.ApiException
+    :param default: delay if header is missing or isn't number of seconds
+    """
+    try:
+        return float((ex.headers or {}).get("Retry-After"))
+    except (TypeError, ValueError):
+        return default
+
+
+def throttle(delay, inst=None, action="kubernetes.throttled"):
+    """Sleep the throttling delay, timed as atomic action.
+
+    Action is nested into the currently running atomic action of the
+    instance, so throttled time is shown separately from the request time.
+
+    :param delay: time in seconds to sleep
+    :param inst: object with _atomic_actions attribute (e.g. service
+           instance) to report action to, or None
+    :param action: atomic action name
+    """
+    if delay <= 0:
+        return
+    if inst is None:
+        time.sleep(delay)
+        return
+    with atomic.ActionTimer(inst, action):
+        time.sleep(delay)
@@ -0,0 +1,63 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+
+class RawObject(object):
+    """Read-only view of Kubernetes object raw JSON.
+
+    Attributes are resolved the same way as kubernetes client models ones,
+    i.e. snake_case name is looked up as camelCase key, and missing keys
+    are None, so the view could be used in place of model for reading
+    status, e.g. resp.status.ready_replicas. Timestamps are kept as
+    strings (see latency.to_time).
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    @staticmethod
+    def _wrap(value):
+        if isinstance(value, dict):
+            return RawObject(value)
+        if isinstance(value, list):
+            return [RawObject._wrap(v) for v in value]
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        head, _, tail = name.partition("_")
+        key = head + "".join(p.capitalize() for p in tail.split("_"))
+        return self._wrap(self._data.get(key))
+
+    def to_dict(self):
+        return self._data
+
+
+def read(read_method, *args, raw=True, **kwargs):
+    """Call read method of kubernetes api without models deserialization.
+
+    :param read_method: read_* method of kubernetes client api
+    :param args: positional args for read_method
+    :param raw: return RawObject if True, otherwise just call read_method
+    :param kwargs: kwargs for read_method
+    """
+    if not raw:
+        return read_method(*args, **kwargs)
+    resp = read_method(*args, _preload_content=False, **kwargs)
+    return RawObject(json.loads(resp.data))
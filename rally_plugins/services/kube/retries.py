@@ -0,0 +1,85 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import random
+import uuid
+
+from rally.common import cfg
+
+CONF = cfg.CONF
+
+# Transient apiserver errors, which requests are retried on after
+# exponential backoff. 429 is retried separately, after Retry-After delay.
+BACKOFF_STATUSES = (500, 502, 503, 504)
+
+# Annotation with client-side token of create request. If the request
+# failed, but the object was actually created, retried request gets 409
+# AlreadyExists, and the token tells our object from someone else's one.
+IDEMPOTENCY_ANNOTATION = "rally-plugins/request-id"
+
+
+class ErrorResponse(object):
+    """Response of failed request, which is considered successful."""
+
+    def __init__(self, ex):
+        self.status = ex.status
+        self.reason = ex.reason
+        self.data = ex.body
+        self._headers = ex.headers or {}
+
+    def getheaders(self):
+        return self._headers
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+
+def backoff(attempt):
+    """Return delay in seconds before the retry.
+
+    :param attempt: number of the retry starting from 0
+    """
+    delay = CONF.kubernetes.api_retry_backoff * 2 ** attempt
+    return delay * random.uniform(0.5, 1.0)
+
+
+def new_token():
+    """Make new idempotency token."""
+    return uuid.uuid4().hex
+
+
+def set_idempotency_token(body):
+    """Set idempotency token annotation into the object manifest.
+
+    :param body: object manifest (dict) of create request
+    :returns: token or None, if object has no name to check it by
+    """
+    metadata = body.get("metadata") if isinstance(body, dict) else None
+    if not isinstance(metadata, dict) or not metadata.get("name"):
+        return None
+    token = metadata.setdefault("annotations", {}).setdefault(
+        IDEMPOTENCY_ANNOTATION, new_token())
+    return token
+
+
+def has_token(resp, token):
+    """Check, that object of the response is created with the token.
+
+    :param resp: response of read request
+    :param token: idempotency token of create request
+    """
+    metadata = json.loads(resp.data).get("metadata") or {}
+    return (metadata.get("annotations") or {}).get(
+        IDEMPOTENCY_ANNOTATION) == token
@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import re
+
 from rally.common import validation
 
 import rally_openstack
@@ -32,6 +34,86 @@ class RequiredKubernetesPlatform(validation.RequiredPlatformValidator):
                       "selected environment.")
 
 
+@validation.configure(name="required_kubernetes_asyncio",
+                      platform="kubernetes")
+class RequiredKubernetesAsyncio(validation.Validator):
+    """Check that kubernetes_asyncio library is installed."""
+
+    def validate(self, context, config, plugin_cls, plugin_cfg):
+        from rally_plugins.services.kube import kube_async
+
+        if kube_async.k8s_async is None:
+            self.fail("kubernetes_asyncio library is not installed, install "
+                      "rally-plugins[asyncio] to use the scenario.")
+
+
+@validation.configure(name="regexp")
+class RegexpParameterValidator(validation.Validator):
+    """Check that parameter is valid regular expression.
+
+    The regexp is compiled by the same process-wide cache as at run time.
+
+    :param param_name: Name of parameter to validate
+    :param missed: Allow to accept optional parameter
+    """
+    def __init__(self, param_name, missed=True):
+        super(RegexpParameterValidator, self).__init__()
+        self.param_name = param_name
+        self.missed = missed
+
+    def validate(self, context, config, plugin_cls, plugin_cfg):
+        from rally_plugins.services.kube import exec_output
+
+        pattern = config.get("args", {}).get(self.param_name)
+        if pattern is None:
+            if not self.missed:
+                self.fail("'%s' parameter is not defined in the task config "
+                          "file" % self.param_name)
+            return
+        if not isinstance(pattern, str):
+            self.fail("Parameter '%s' should be a string" % self.param_name)
+        try:
+            exec_output.compile_regexp(pattern)
+        except re.error as e:
+            self.fail("Parameter '%(name)s' is not a valid regular "
+                      "expression: %(error)s" % {"name": self.param_name,
+                                                 "error": e})
+
+
+@validation.configure(name="local_persistent_volumes_pool")
+class LocalPersistentVolumesPoolValidator(validation.Validator):
+    """Check that pool of local PVs is enough for runner concurrency.
+
+    Each iteration leases one PV of local_persistent_volumes context pool
+    for its lifetime, so iterations running in parallel would wait for
+    each other's volumes if pool is smaller than concurrency.
+    """
+
+    def validate(self, context, config, plugin_cls, plugin_cfg):
+        pool = config.get("contexts", {}).get("local_persistent_volumes")
+        if not pool:
+            return
+        size = sum(1 if isinstance(paths, str) else len(paths)
+                   for paths in pool.get("nodes", {}).values())
+
+        runner = config.get("runner") or {}
+        times = runner.get("times", 1)
+        if config.get("runner_type") == "serial":
+            concurrency = 1
+        elif config.get("runner_type") == "rps":
+            concurrency = min(runner.get("max_concurrency", times), times)
+        elif config.get("runner_type") == "constant_for_duration":
+            concurrency = runner.get("concurrency", 1)
+        else:
+            concurrency = min(runner.get("concurrency", 1), times)
+
+        if size < concurrency:
+            self.fail("Pool of local_persistent_volumes context has %(size)s "
+                      "volumes, which is less than runner concurrency "
+                      "%(concurrency)s." % {"size": size,
+                                            "concurrency": concurrency})
+
+
 class MapKeysParameterValidator(validation.Validator):
     """Check that parameter contains specified keys.
 
@@ -27,8 +27,9 @@ def read_requirements(filename):
             if l and not l.startswith("#")]
 
 
-# we do not have extras yet.
-EXRAS_REQUIREMENTS = {}
+EXRAS_REQUIREMENTS = {
+    "asyncio": ["kubernetes_asyncio>=12.0.0"]
+}
 
 
 setuptools.setup(
@@ -49,6 +50,7 @@ setuptools.setup(
             "options = rally_plugins.common.opts:list_opts"
         ]
     },
+    python_requires=">=3.7",
     install_requires=read_requirements("requirements.txt"),
     extras_require=EXRAS_REQUIREMENTS,
     classifiers=["Intended Audience :: Developers",
@@ -56,10 +58,8 @@ setuptools.setup(
                  "License :: OSI Approved :: Apache Software License",
                  "Operating System :: POSIX :: Linux",
                  "Programming Language :: Python",
-                 "Programming Language :: Python :: 2",
-                 "Programming Language :: Python :: 2.7",
                  "Programming Language :: Python :: 3",
-                 "Programming Language :: Python :: 3.4",
-                 "Programming Language :: Python :: 3.5",
-                 "Programming Language :: Python :: 3.6"]
+                 "Programming Language :: Python :: 3 :: Only",
+                 "Programming Language :: Python :: 3.7",
+                 "Programming Language :: Python :: 3.8"]
 )
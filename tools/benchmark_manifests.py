@@ -0,0 +1,112 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Micro-benchmark of pod manifest construction and serialization.
+
+Compares time to get request body of create pod call:
+
+* dict - manifest dict built per call, serialized by kubernetes client;
+* template - manifest filled from template, serialized by kubernetes client;
+* serialized - manifest JSON made from template directly.
+
+Usage: python tools/benchmark_manifests.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+
+from kubernetes.client import api_client
+
+from rally_plugins.services.kube import kube
+from rally_plugins.services.kube import manifests
+
+API = api_client.ApiClient()
+LABELS, ANNOTATIONS = kube.owner_metadata(
+    "3b5c4c5e-4e57-4b8e-9d8b-0b2d5a8d4f61",
+    scenario="Kubernetes.create_and_delete_pod", iteration=42)
+NAME = "rally-7f2a1c3d-pod-x9k2"
+IMAGE = "kubernetes/pause"
+NAMESPACE = "rally-7f2a1c3d-ns-0"
+
+
+def send(body):
+    if isinstance(body, bytes):
+        return body
+    return json.dumps(API.sanitize_for_serialization(body)).encode("utf8")
+
+
+def dict_body():
+    manifest = {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": NAME,
+            "labels": {
+                "role": NAME
+            }
+        },
+        "spec": {
+            "serviceAccountName": NAMESPACE,
+            "containers": [{
+                "name": NAME,
+                "image": IMAGE,
+                "imagePullPolicy": "IfNotPresent"
+            }]
+        }
+    }
+    kube.set_owner_metadata(manifest, labels=LABELS, annotations=ANNOTATIONS)
+    return send(manifest)
+
+
+def _values():
+    return {"name": NAME, "image": IMAGE,
+            "image_pull_policy": "IfNotPresent",
+            "labels": dict(LABELS, role=NAME),
+            "annotations": dict(ANNOTATIONS),
+            "service_account": NAMESPACE}
+
+
+def template_body():
+    template = manifests.get_template("Pod", service_account=True)
+    return send(template.fill(**_values()))
+
+
+def serialized_body():
+    template = manifests.get_template("Pod", service_account=True)
+    return send(manifests.Serialized(template.dumps(**_values()),
+                                     name=NAME))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=20000,
+                        help="number of bodies to make per method")
+    args = parser.parse_args()
+
+    bodies = [json.loads(f()) for f in (dict_body, template_body,
+                                        serialized_body)]
+    assert bodies[0] == bodies[1] == bodies[2], "manifests differ"
+
+    baseline = None
+    for f in (dict_body, template_body, serialized_body):
+        seconds = min(timeit.repeat(f, number=args.number, repeat=3))
+        baseline = baseline or seconds
+        print("%-12s %8.2f us per body, x%.1f" % (
+            f.__name__[:-len("_body")], seconds / args.number * 10 ** 6,
+            baseline / seconds))
+
+
+if __name__ == "__main__":
+    main()
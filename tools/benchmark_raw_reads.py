@@ -0,0 +1,138 @@
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Micro-benchmark of pod status read while polling.
+
+Compares CPU time of a single status poll of running pod, i.e. response
+handling and status check with ready time lookup:
+
+* models - response deserialized into kubernetes client models;
+* raw - response read as RawObject view of JSON (status_raw_reads).
+
+API response is made locally, so network time is not included.
+
+Usage: python tools/benchmark_raw_reads.py [--number N] [--env N]
+"""
+
+import argparse
+import json
+import timeit
+
+from kubernetes.client import api_client
+
+from rally_plugins.services.kube import latency
+from rally_plugins.services.kube import raw
+
+API = api_client.ApiClient()
+NAME = "rally-7f2a1c3d-pod-x9k2"
+NAMESPACE = "rally-7f2a1c3d-ns-0"
+STARTED_AT = "2024-01-01T00:00:05Z"
+
+
+class Response(object):
+    """Response of api call made with _preload_content=False."""
+
+    def __init__(self, data):
+        self.data = data
+
+
+def make_pod(env):
+    condition = {"status": "True", "lastProbeTime": None,
+                 "lastTransitionTime": STARTED_AT}
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": NAME,
+            "namespace": NAMESPACE,
+            "uid": "5d0b1c1e-6a4b-4b8e-9d8b-0b2d5a8d4f61",
+            "resourceVersion": "123456",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {"role": NAME},
+            "managedFields": [{
+                "manager": "kubelet",
+                "operation": "Update",
+                "apiVersion": "v1",
+                "time": STARTED_AT,
+                "fieldsType": "FieldsV1",
+                "fieldsV1": {"f:status": {}}
+            }]
+        },
+        "spec": {
+            "serviceAccountName": NAMESPACE,
+            "containers": [{
+                "name": NAME,
+                "image": "kubernetes/pause",
+                "imagePullPolicy": "IfNotPresent",
+                "env": [{"name": "VAR_%d" % i, "value": str(i)}
+                        for i in range(env)]
+            }]
+        },
+        "status": {
+            "phase": "Running",
+            "conditions": [dict(condition, type=t)
+                           for t in ("Initialized", "Ready",
+                                     "ContainersReady", "PodScheduled")],
+            "containerStatuses": [{
+                "name": NAME,
+                "ready": True,
+                "restartCount": 0,
+                "image": "kubernetes/pause:latest",
+                "imageID": "docker-pullable://kubernetes/pause@sha256:0",
+                "containerID": "docker://0",
+                "state": {"running": {"startedAt": STARTED_AT}},
+                "lastState": {}
+            }],
+            "startTime": STARTED_AT
+        }
+    }
+
+
+def poll(read):
+    resp = read()
+    assert resp.status.phase == "Running"
+    return latency.ready_time(resp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=2000,
+                        help="number of polls per method")
+    parser.add_argument("--env", type=int, default=10,
+                        help="number of env vars in pod container")
+    args = parser.parse_args()
+
+    data = json.dumps(make_pod(args.env)).encode("utf8")
+
+    def models():
+        return API.deserialize(Response(data), "V1Pod")
+
+    def raw_object():
+        return raw.RawObject(json.loads(data))
+
+    readers = (("models", models), ("raw", raw_object))
+    ready = [poll(read) for _name, read in readers]
+    assert ready[0] == ready[1], "ready times differ"
+
+    baseline = None
+    for name, read in readers:
+        seconds = min(timeit.repeat(lambda: poll(read), number=args.number,
+                                    repeat=3))
+        baseline = baseline or seconds
+        print("%-12s %8.2f us per poll, x%.1f" % (
+            name, seconds / args.number * 10 ** 6, baseline / seconds))
+
+
+if __name__ == "__main__":
+    main()